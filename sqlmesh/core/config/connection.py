@@ -45,6 +45,11 @@ class _ConnectionConfig(abc.ABC, BaseConfig):
         """The static connection kwargs for this connection"""
         return {}
 
+    @property
+    def is_multiprocess_safe(self) -> bool:
+        """Whether connections can be opened by multiple processes at once."""
+        return True
+
     def create_engine_adapter(self) -> EngineAdapter:
         """Returns a new instance of the Engine Adapter."""
         return self._engine_adapter(
@@ -80,6 +85,12 @@ class DuckDBConnectionConfig(_ConnectionConfig):
     def _engine_adapter(self) -> t.Type[EngineAdapter]:
         return engine_adapter.DuckDBEngineAdapter
 
+    @property
+    def is_multiprocess_safe(self) -> bool:
+        # A database file can only be opened by a single process, and an in-memory database
+        # isn't shared between processes.
+        return False
+
     @property
     def _connection_factory(self) -> t.Callable:
         import duckdb
@@ -218,6 +229,11 @@ class DatabricksSparkSessionConnectionConfig(_ConnectionConfig):
     def _engine_adapter(self) -> t.Type[EngineAdapter]:
         return engine_adapter.DatabricksSparkSessionEngineAdapter
 
+    @property
+    def is_multiprocess_safe(self) -> bool:
+        # The Spark session belongs to the current process.
+        return False
+
     @property
     def _connection_factory(self) -> t.Callable:
         from sqlmesh.engines.spark.db_api.spark_session import connection
@@ -11,6 +11,7 @@ from sqlmesh.core.config.base import BaseConfig
 from sqlmesh.core.config.common import concurrent_tasks_validator
 from sqlmesh.core.console import Console
 from sqlmesh.core.plan import AirflowPlanEvaluator, BuiltInPlanEvaluator, PlanEvaluator
+from sqlmesh.core.scheduler import ExecutorType, SchedulingPolicyType
 from sqlmesh.core.state_sync import EngineAdapterStateSync, StateReader, StateSync
 from sqlmesh.schedulers.airflow.client import AirflowClient
 
@@ -63,7 +64,26 @@ class _SchedulerConfig(abc.ABC):
 
 
 class BuiltInSchedulerConfig(_SchedulerConfig, BaseConfig):
-    """The Built-In Scheduler configuration."""
+    """The Built-In Scheduler configuration.
+
+    Args:
+        scheduling_policy: The policy which determines the order in which intervals are evaluated
+            when there are more intervals ready for evaluation than available concurrent tasks.
+        executor: Whether intervals are evaluated by threads or by worker processes.
+        python_model_buffer_size: The number of outputs a Python model is allowed to produce ahead
+            of their ingestion. If greater than 0 the model runs in a separate producer thread while
+            its outputs are being inserted.
+        python_model_chunk_rows: Consecutive DataFrames yielded by a Python model are concatenated
+            until they have at least this many rows before being inserted. Only applies if
+            `python_model_buffer_size` is set.
+        batch_audits: Whether the results of all audits of a model are fetched using a single query.
+    """
+
+    scheduling_policy: SchedulingPolicyType = SchedulingPolicyType.FIFO
+    executor: ExecutorType = ExecutorType.THREAD
+    python_model_buffer_size: int = 0
+    python_model_chunk_rows: int = 0
+    batch_audits: bool = True
 
     type_: Literal["builtin"] = Field(alias="type", default="builtin")
 
@@ -76,6 +96,10 @@ class BuiltInSchedulerConfig(_SchedulerConfig, BaseConfig):
             snapshot_evaluator=context.snapshot_evaluator,
             backfill_concurrent_tasks=context.concurrent_tasks,
             console=context.console,
+            scheduling_policy=self.scheduling_policy,
+            run_durations=context.run_durations,
+            executor_type=self.executor,
+            connection_config=context.connection_config,
         )
 
 
@@ -143,13 +167,21 @@ class AirflowSchedulerConfig(_BaseAirflowSchedulerConfig, BaseConfig):
 
     _concurrent_tasks_validator = concurrent_tasks_validator
 
-    def get_client(self, console: t.Optional[Console] = None) -> AirflowClient:
-        session = Session()
-        session.headers.update({"Content-Type": "application/json"})
-        session.auth = (self.username, self.password)
+    _session: t.Optional[Session] = None
+
+    @property
+    def session(self) -> Session:
+        # The session is shared by all clients so that connections to the webserver are kept alive
+        # and reused across requests.
+        if self._session is None:
+            self._session = Session()
+            self._session.headers.update({"Content-Type": "application/json"})
+            self._session.auth = (self.username, self.password)
+        return self._session
 
+    def get_client(self, console: t.Optional[Console] = None) -> AirflowClient:
         return AirflowClient(
-            session=session,
+            session=self.session,
             airflow_url=self.airflow_url,
             console=console,
         )
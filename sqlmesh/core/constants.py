@@ -23,6 +23,8 @@ CACHE_PATH = ".cache"
 """Cache path"""
 TABLE_INFO_CACHE = "table_info_cache"
 """Table info cache"""
+STORED_SNAPSHOTS_CACHE_TTL = 5.0
+"""The number of seconds for which snapshots fetched from the state are reused"""
 DATA_VERSION_LIMIT = 10
 """Data version limit"""
 DEFAULT_TIME_COLUMN_FORMAT = "%Y-%m-%d"
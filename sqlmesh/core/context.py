@@ -34,6 +34,7 @@ from __future__ import annotations
 
 import abc
 import contextlib
+import time
 import typing as t
 import unittest.result
 from io import StringIO
@@ -46,7 +47,7 @@ from sqlglot import exp
 from sqlmesh.core import constants as c
 from sqlmesh.core._typing import NotificationTarget
 from sqlmesh.core.audit import Audit
-from sqlmesh.core.config import Config, load_config_from_paths
+from sqlmesh.core.config import BuiltInSchedulerConfig, Config, load_config_from_paths
 from sqlmesh.core.console import Console, get_console
 from sqlmesh.core.context_diff import ContextDiff
 from sqlmesh.core.dialect import format_model_expressions, pandas_to_sql, parse
@@ -57,11 +58,13 @@ from sqlmesh.core.loader import Loader, SqlMeshLoader, update_model_schemas
 from sqlmesh.core.macros import ExecutableOrMacro
 from sqlmesh.core.model import Model
 from sqlmesh.core.plan import Plan
-from sqlmesh.core.scheduler import Scheduler
+from sqlmesh.core.scheduler import ExecutorType, Scheduler, SchedulingPolicyType
 from sqlmesh.core.snapshot import (
+    FingerprintIndex,
     Snapshot,
     SnapshotEvaluator,
     SnapshotFingerprint,
+    SnapshotId,
     to_table_mapping,
 )
 from sqlmesh.core.state_sync import StateReader, StateSync
@@ -74,6 +77,7 @@ from sqlmesh.utils.errors import ConfigError, MissingDependencyError, PlanError
 
 if t.TYPE_CHECKING:
     import graphviz
+    import pyarrow as pa
     import pyspark
 
     from sqlmesh.core.engine_adapter._typing import DF
@@ -121,6 +125,20 @@ class BaseContext(abc.ABC):
         """
         return self.engine_adapter.fetchdf(query)
 
+    def fetch_batches(
+        self, query: t.Union[exp.Expression, str], batch_rows: t.Optional[int] = None
+    ) -> t.Iterator[pa.RecordBatch]:
+        """Fetches the results of a sql string or sqlglot expression as a stream of Arrow record batches.
+
+        Args:
+            query: SQL string or sqlglot expression.
+            batch_rows: The maximum number of rows in each batch.
+
+        Returns:
+            An iterator over Arrow record batches which contains at least one, possibly empty, batch.
+        """
+        return self.engine_adapter.fetch_batches(query, batch_rows)
+
     def fetch_pyspark_df(self, query: t.Union[exp.Expression, str]) -> pyspark.sql.DataFrame:
         """Fetches a PySpark dataframe given a sql string or sqlglot expression.
 
@@ -220,8 +238,18 @@ class Context(BaseContext):
         self._macros: UniqueKeyDict[str, ExecutableOrMacro] = UniqueKeyDict("macros")
         self._hooks: UniqueKeyDict[str, hook] = UniqueKeyDict("hooks")
 
+        # Snapshots and fingerprints of models are reused until the models change.
+        self._local_snapshots: t.Dict[str, Snapshot] = {}
+        self._fingerprints: t.Dict[str, SnapshotFingerprint] = {}
+        self._local_snapshots_key: t.Tuple[str, str] = (self.physical_schema, self.snapshot_ttl)
+        self._fingerprint_index: t.Optional[FingerprintIndex] = None
+        # Snapshots fetched from the state are reused for a short period of time.
+        self._stored_snapshots: t.Dict[SnapshotId, Snapshot] = {}
+        self._stored_snapshots_expire_at = 0.0
+
         self.connection = connection
         connection_config = self.config.get_connection(connection)
+        self.connection_config = connection_config
         self.concurrent_tasks = concurrent_tasks or connection_config.concurrent_tasks
         self._engine_adapter = engine_adapter or connection_config.create_engine_adapter()
 
@@ -234,8 +262,15 @@ class Context(BaseContext):
 
         self.dialect = dialect or self.config.model_defaults.dialect or self._engine_adapter.dialect
 
+        evaluator_kwargs: t.Dict[str, t.Any] = {}
+        if isinstance(self.config.scheduler, BuiltInSchedulerConfig):
+            evaluator_kwargs = dict(
+                python_model_buffer_size=self.config.scheduler.python_model_buffer_size,
+                python_model_chunk_rows=self.config.scheduler.python_model_chunk_rows,
+                batch_audits=self.config.scheduler.batch_audits,
+            )
         self.snapshot_evaluator = SnapshotEvaluator(
-            self.engine_adapter, ddl_concurrent_tasks=self.concurrent_tasks
+            self.engine_adapter, ddl_concurrent_tasks=self.concurrent_tasks, **evaluator_kwargs
         )
 
         self.notification_targets = self.config.notification_targets + (notification_targets or [])
@@ -246,6 +281,11 @@ class Context(BaseContext):
 
         self.users = self.config.users + (users or [])
 
+        # Historical run durations of models which are used by the built-in scheduler to prioritize intervals.
+        # They are only kept in memory, so they approximate the durations of runs made by this context and
+        # start out empty in every new process.
+        self.run_durations: t.Dict[str, float] = {}
+
         self._loader = (loader or self.config.loader or SqlMeshLoader)()
 
         if load:
@@ -279,6 +319,7 @@ class Context(BaseContext):
 
         self._add_model_to_dag(model)
         update_model_schemas(self.dialect, self.dag, self._models)
+        self._invalidate_local_snapshots([model.name])
 
         return model
 
@@ -310,6 +351,18 @@ class Context(BaseContext):
             self.state_sync,
             max_workers=self.concurrent_tasks,
             console=self.console,
+            scheduling_policy=(
+                self.config.scheduler.scheduling_policy
+                if isinstance(self.config.scheduler, BuiltInSchedulerConfig)
+                else SchedulingPolicyType.FIFO
+            ),
+            run_durations=self.run_durations,
+            executor_type=(
+                self.config.scheduler.executor
+                if isinstance(self.config.scheduler, BuiltInSchedulerConfig)
+                else ExecutorType.THREAD
+            ),
+            connection_config=self.connection_config,
         )
 
     @property
@@ -383,9 +436,24 @@ class Context(BaseContext):
             project = self._loader.load(self)
             self._hooks = project.hooks
             self._macros = project.macros
+            self.dag = project.dag
+            self._fingerprint_index = project.fingerprint_index
+
+            if project.audits.keys() != self._audits.keys() or any(
+                self._audits[name] is not audit for name, audit in project.audits.items()
+            ):
+                self._invalidate_local_snapshots()
+            else:
+                self._invalidate_local_snapshots(
+                    {
+                        name
+                        for name, model in project.models.items()
+                        if self._models.get(name) is not model
+                    }
+                    | (self._models.keys() - project.models.keys())
+                )
             self._models = project.models
             self._audits = project.audits
-            self.dag = project.dag
 
         return self
 
@@ -409,6 +477,7 @@ class Context(BaseContext):
         """
         environment = environment or c.PROD
         self.scheduler(environment=environment).run(environment, start, end, latest)
+        self._invalidate_stored_snapshots()
 
         if not skip_janitor:
             self._run_janitor()
@@ -437,33 +506,60 @@ class Context(BaseContext):
         """Generates and returns snapshots based on models registered in this context.
 
         If one of the snapshots has been previosly stored in the persisted state, the stored
-        instance will be returned.
+        instance will be returned. Snapshots fetched from the persisted state are reused for
+        `STORED_SNAPSHOTS_CACHE_TTL` seconds or until this context modifies the state.
         """
         local_snapshots = self.local_snapshots
 
-        stored_snapshots = self.state_reader.get_snapshots(
-            [s.snapshot_id for s in local_snapshots.values()]
-        )
+        now = time.monotonic()
+        if now >= self._stored_snapshots_expire_at:
+            self._stored_snapshots.clear()
+            self._stored_snapshots_expire_at = now + c.STORED_SNAPSHOTS_CACHE_TTL
+
+        # Snapshots that haven't been stored yet are looked up every time, since they are stored as soon as
+        # a plan is applied, possibly by a different process.
+        missing_ids = [
+            s.snapshot_id
+            for s in local_snapshots.values()
+            if s.snapshot_id not in self._stored_snapshots
+        ]
+        if missing_ids:
+            self._stored_snapshots.update(self.state_reader.get_snapshots(missing_ids))
 
-        return {name: stored_snapshots.get(s.snapshot_id, s) for name, s in local_snapshots.items()}
+        snapshots = {}
+        for name, snapshot in local_snapshots.items():
+            stored_snapshot = self._stored_snapshots.get(snapshot.snapshot_id)
+            snapshots[name] = _copy_snapshot(stored_snapshot) if stored_snapshot else snapshot
+        return snapshots
 
     @property
     def local_snapshots(self) -> t.Dict[str, Snapshot]:
         """Generates and returns snapshots based on models registered in this context without reconciling them
         with the persisted state.
+
+        Snapshots are only generated for models that changed since the previous call, all other snapshots
+        are copies of previously generated ones.
         """
+        if self._local_snapshots_key != (self.physical_schema, self.snapshot_ttl):
+            self._invalidate_local_snapshots()
+            self._local_snapshots_key = (self.physical_schema, self.snapshot_ttl)
+
         local_snapshots = {}
-        fingerprint_cache: t.Dict[str, SnapshotFingerprint] = {}
         for model in self._models.values():
-            snapshot = Snapshot.from_model(
-                model,
-                physical_schema=self.physical_schema,
-                models=self._models,
-                ttl=self.snapshot_ttl,
-                audits=self._audits,
-                cache=fingerprint_cache,
-            )
-            local_snapshots[model.name] = snapshot
+            snapshot = self._local_snapshots.get(model.name)
+            if snapshot is None:
+                snapshot = Snapshot.from_model(
+                    model,
+                    physical_schema=self.physical_schema,
+                    models=self._models,
+                    ttl=self.snapshot_ttl,
+                    audits=self._audits,
+                    cache=self._fingerprints,
+                    index=self._fingerprint_index,
+                )
+                self._local_snapshots[model.name] = snapshot
+            # Snapshots are mutated during plan application, so the cached instances must not be shared.
+            local_snapshots[model.name] = _copy_snapshot(snapshot)
         return local_snapshots
 
     def render(
@@ -663,7 +759,10 @@ class Context(BaseContext):
             return
         if plan.uncategorized:
             raise PlanError("Can't apply a plan with uncategorized changes.")
-        self.config.scheduler.create_plan_evaluator(self).evaluate(plan)
+        try:
+            self.config.scheduler.create_plan_evaluator(self).evaluate(plan)
+        finally:
+            self._invalidate_stored_snapshots()
 
     def diff(self, environment: t.Optional[str] = None, detailed: bool = False) -> None:
         """Show a diff of the current context with a given environment.
@@ -815,6 +914,7 @@ class Context(BaseContext):
         Please contact your SQLMesh administrator before doing this.
         """
         self.state_sync.migrate()
+        self._invalidate_stored_snapshots()
 
     def close(self) -> None:
         """Releases all resources allocated by this context."""
@@ -885,3 +985,42 @@ class Context(BaseContext):
 
         expired_snapshots = self.state_sync.delete_expired_snapshots()
         self.snapshot_evaluator.cleanup(expired_snapshots)
+        self._invalidate_stored_snapshots()
+
+    def _invalidate_local_snapshots(self, names: t.Optional[t.Iterable[str]] = None) -> None:
+        """Discards the cached snapshots of the given models and their downstream dependents.
+
+        Args:
+            names: The names of models that changed. If not provided all cached snapshots are discarded.
+        """
+        if names is None:
+            self._local_snapshots.clear()
+            self._fingerprints.clear()
+            return
+
+        invalidated = set(names)
+        graph = self.dag.graph
+        for name in self.dag.sorted():
+            if not graph[name].isdisjoint(invalidated):
+                invalidated.add(name)
+        for name in invalidated:
+            self._local_snapshots.pop(name, None)
+            self._fingerprints.pop(name, None)
+
+    def _invalidate_stored_snapshots(self) -> None:
+        self._stored_snapshots.clear()
+
+
+def _copy_snapshot(snapshot: Snapshot) -> Snapshot:
+    """Copies a snapshot so that mutating the copy's intervals or indirect versions doesn't affect the original.
+
+    Models and audits are shared with the original, since a model is never mutated through its snapshot and a
+    deep copy would be as expensive as parsing it again.
+    """
+    return snapshot.copy(
+        update={
+            "intervals": list(snapshot.intervals),
+            "dev_intervals": list(snapshot.dev_intervals),
+            "indirect_versions": dict(snapshot.indirect_versions),
+        }
+    )
@@ -11,6 +11,7 @@ from __future__ import annotations
 import contextlib
 import itertools
 import logging
+import math
 import typing as t
 
 import pandas as pd
@@ -35,6 +36,8 @@ from sqlmesh.utils.date import TimeLike, make_inclusive
 from sqlmesh.utils.errors import SQLMeshError
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
+
     from sqlmesh.core._typing import TableName
     from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
     from sqlmesh.core.model.meta import IntervalUnit
@@ -57,6 +60,7 @@ class EngineAdapter:
 
     DIALECT = ""
     DEFAULT_BATCH_SIZE = 10000
+    MAX_TYPE_LOOKAHEAD_BATCHES = 10
     DEFAULT_SQL_GEN_KWARGS: t.Dict[str, str | bool | int] = {}
     ESCAPE_JSON = False
 
@@ -680,6 +684,101 @@ class EngineAdapter:
             )
         return df
 
+    def fetch_batches(
+        self, query: t.Union[exp.Expression, str], batch_rows: t.Optional[int] = None
+    ) -> t.Iterator[pa.RecordBatch]:
+        """Fetches the results of a query as a stream of Arrow record batches.
+
+        Unlike `fetchdf` the whole result is never materialized at once. At least one batch is always
+        produced so that the schema of the result is known even if the result is empty.
+
+        The query runs on its own cursor so that other queries issued while the stream is being consumed
+        don't clobber its results. The cursor is closed once the stream is exhausted or closed.
+
+        Args:
+            query: SQL string or sqlglot expression.
+            batch_rows: The maximum number of rows in each batch, which some engines round to the size
+                of their native chunks. Default: DEFAULT_BATCH_SIZE.
+
+        Returns:
+            An iterator over Arrow record batches.
+        """
+        try:
+            import pyarrow  # noqa
+        except ImportError:
+            raise SQLMeshError(
+                "Fetching query results as Arrow record batches requires the 'pyarrow' package. "
+                "Install it with `pip install pyarrow`."
+            )
+
+        cursor = self._connection_pool.get().cursor()
+        try:
+            self._execute(cursor, query)
+            batches = self._fetch_batches(cursor, batch_rows or self.DEFAULT_BATCH_SIZE)
+        except Exception:
+            cursor.close()
+            raise
+        return _close_cursor_after(batches, cursor)
+
+    def _fetch_batches(self, cursor: t.Any, batch_rows: int) -> t.Iterator[pa.RecordBatch]:
+        """Streams the results of a query executed on the given cursor as Arrow record batches."""
+        return self._fetchmany_batches(cursor, batch_rows)
+
+    def _fetchmany_batches(self, cursor: t.Any, batch_rows: int) -> t.Iterator[pa.RecordBatch]:
+        """Converts the rows of an executed query into record batches using the DB-API `fetchmany`.
+
+        All batches share the same schema, which is inferred from the values of the first batches. A column
+        that only contains NULLs has no type, so batches are looked ahead until the type of every column is
+        known. Columns whose type is still unknown after `MAX_TYPE_LOOKAHEAD_BATCHES` batches are returned
+        as strings.
+        """
+        import pyarrow as pa
+
+        columns = [column[0] for column in cursor.description] if cursor.description else None
+
+        def frames() -> t.Iterator[pd.DataFrame]:
+            first = True
+            while True:
+                rows = cursor.fetchmany(batch_rows)
+                if not rows and not first:
+                    return
+                first = False
+                yield pd.DataFrame.from_records(rows, columns=columns)
+                if len(rows) < batch_rows:
+                    return
+
+        remaining_frames = frames()
+        lookahead_frames: t.List[pd.DataFrame] = []
+        fields: t.List[pa.Field] = []
+        for df in remaining_frames:
+            lookahead_frames.append(df)
+            inferred_schema = pa.Schema.from_pandas(df, preserve_index=False)
+            fields = [
+                inferred if not fields or pa.types.is_null(fields[i].type) else fields[i]
+                for i, inferred in enumerate(inferred_schema)
+            ]
+            if (
+                not any(pa.types.is_null(field.type) for field in fields)
+                or len(lookahead_frames) >= self.MAX_TYPE_LOOKAHEAD_BATCHES
+            ):
+                break
+
+        string_columns = [i for i, field in enumerate(fields) if pa.types.is_null(field.type)]
+        schema = pa.schema(
+            [
+                pa.field(field.name, pa.string()) if i in string_columns else field
+                for i, field in enumerate(fields)
+            ]
+        )
+
+        def to_batch(df: pd.DataFrame) -> pa.RecordBatch:
+            for i in string_columns:
+                df.iloc[:, i] = df.iloc[:, i].map(_to_nullable_str)
+            return pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
+
+        for df in itertools.chain(lookahead_frames, remaining_frames):
+            yield to_batch(df)
+
     def fetch_pyspark_df(self, query: t.Union[exp.Expression, str]) -> PySparkDataFrame:
         """Fetches a PySpark DataFrame from the cursor"""
         raise NotImplementedError(f"Engine does not support PySpark DataFrames: {type(self)}")
@@ -714,12 +813,21 @@ class EngineAdapter:
         **kwargs: t.Any,
     ) -> None:
         """Execute a sql query."""
+        self._execute(self.cursor, sql, ignore_unsupported_errors, **kwargs)
+
+    def _execute(
+        self,
+        cursor: t.Any,
+        sql: t.Union[str, exp.Expression],
+        ignore_unsupported_errors: bool = False,
+        **kwargs: t.Any,
+    ) -> None:
         to_sql_kwargs = (
             {"unsupported_level": ErrorLevel.IGNORE} if ignore_unsupported_errors else {}
         )
         sql = self._to_sql(sql, **to_sql_kwargs) if isinstance(sql, exp.Expression) else sql
         logger.debug(f"Executing SQL:\n{sql}")
-        self.cursor.execute(sql, **kwargs)
+        cursor.execute(sql, **kwargs)
 
     def _create_table_properties(
         self,
@@ -797,3 +905,21 @@ class EngineAdapterWithIndexSupport(EngineAdapter):
             exp.Anonymous(this="PRIMARY KEY", expressions=[exp.to_column(k) for k in primary_key]),
         )
         return expression
+
+
+def _to_nullable_str(value: t.Any) -> t.Optional[str]:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return str(value)
+
+
+def _close_cursor_after(
+    batches: t.Iterator[pa.RecordBatch], cursor: t.Any
+) -> t.Iterator[pa.RecordBatch]:
+    try:
+        yield from batches
+    finally:
+        close = getattr(batches, "close", None)
+        if close:
+            close()
+        cursor.close()
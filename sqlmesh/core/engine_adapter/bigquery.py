@@ -13,12 +13,14 @@ from sqlmesh.core.engine_adapter.shared import (
     DataObject,
     DataObjectType,
     TransactionType,
+    arrow_tables_to_batches,
 )
 from sqlmesh.core.model.meta import IntervalUnit
 from sqlmesh.utils.date import to_datetime
 from sqlmesh.utils.errors import SQLMeshError
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
     from google.cloud.bigquery.client import Client as BigQueryClient
     from google.cloud.bigquery.client import Connection as BigQueryConnection
     from google.cloud.bigquery.job.base import _AsyncJob as BigQueryQueryResult
@@ -71,15 +73,8 @@ class BigQueryEngineAdapter(EngineAdapter):
         from google.cloud import bigquery
 
         table = exp.to_table(table)
-        precisionless_col_to_types = {
-            col_name: remove_precision_parameterized_types(col_type)
-            for col_name, col_type in columns_to_types.items()
-        }
         temp_table_name = f"{self.client.project}.{table.db}.__temp_{table.name}_{uuid.uuid4().hex}"
-        schema = [
-            bigquery.SchemaField(col_name, col_type.sql(dialect=self.dialect))
-            for col_name, col_type in precisionless_col_to_types.items()
-        ]
+        schema = self.__get_bq_schema(columns_to_types)
         bq_table = bigquery.Table(table_ref=temp_table_name, schema=schema)
         bq_table.expires = to_datetime("in 3 hours")
         self.client.create_table(bq_table)
@@ -88,6 +83,40 @@ class BigQueryEngineAdapter(EngineAdapter):
             raise SQLMeshError(result.errors)
         return result, temp_table_name
 
+    def __get_bq_schema(self, columns_to_types: t.Dict[str, exp.DataType]) -> t.List[t.Any]:
+        from google.cloud import bigquery
+
+        return [
+            bigquery.SchemaField(
+                col_name, remove_precision_parameterized_types(col_type).sql(dialect=self.dialect)
+            )
+            for col_name, col_type in columns_to_types.items()
+        ]
+
+    def _insert_append_pandas_df(
+        self,
+        table_name: TableName,
+        df: pd.DataFrame,
+        columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
+    ) -> None:
+        """
+        Appends the DataFrame with a load job, which serializes it to Parquet instead of rendering every row
+        as a SQL literal.
+        """
+        from google.cloud import bigquery
+
+        job_config = bigquery.LoadJobConfig(
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        )
+        if columns_to_types:
+            df = df[list(columns_to_types)]
+            job_config.schema = self.__get_bq_schema(columns_to_types)
+        result = self.client.load_table_from_dataframe(
+            df, exp.to_table(table_name).sql(dialect=self.dialect), job_config=job_config
+        ).result()
+        if result.errors:
+            raise SQLMeshError(result.errors)
+
     def _insert_overwrite_by_condition(
         self,
         table_name: TableName,
@@ -176,6 +205,18 @@ class BigQueryEngineAdapter(EngineAdapter):
         self.execute(query)
         return self.cursor._query_job.to_dataframe()
 
+    def _fetch_batches(self, cursor: t.Any, batch_rows: int) -> t.Iterator[pa.RecordBatch]:
+        """Streams the results of the query job page by page."""
+        import pyarrow as pa
+
+        return arrow_tables_to_batches(
+            (
+                pa.Table.from_batches([batch])
+                for batch in cursor._query_job.result(page_size=batch_rows).to_arrow_iterable()
+            ),
+            batch_rows,
+        )
+
     def _create_table_properties(
         self,
         storage_format: t.Optional[str] = None,
@@ -5,9 +5,15 @@ import typing as t
 from sqlglot import exp
 
 from sqlmesh.core.engine_adapter.base_spark import BaseSparkEngineAdapter
-from sqlmesh.core.engine_adapter.shared import DataObject, DataObjectType
+from sqlmesh.core.engine_adapter.shared import (
+    DataObject,
+    DataObjectType,
+    arrow_tables_to_batches,
+)
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
+
     from sqlmesh.core.engine_adapter._typing import DF
 
 
@@ -21,6 +27,16 @@ class DatabricksSQLEngineAdapter(BaseSparkEngineAdapter):
         self.execute(query)
         return self.cursor.fetchall_arrow().to_pandas()
 
+    def _fetch_batches(self, cursor: t.Any, batch_rows: int) -> t.Iterator[pa.RecordBatch]:
+        def tables() -> t.Iterator[pa.Table]:
+            while True:
+                table = cursor.fetchmany_arrow(batch_rows)
+                yield table
+                if table.num_rows < batch_rows:
+                    return
+
+        return arrow_tables_to_batches(tables(), batch_rows)
+
     def _get_data_objects(
         self, schema_name: str, catalog_name: t.Optional[str] = None
     ) -> t.List[DataObject]:
@@ -10,6 +10,8 @@ from sqlmesh.core.engine_adapter.base import EngineAdapter
 from sqlmesh.core.engine_adapter.shared import DataObject, DataObjectType
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
+
     from sqlmesh.core._typing import TableName
 
 
@@ -30,6 +32,21 @@ class DuckDBEngineAdapter(EngineAdapter):
             )
         )
 
+    def _fetch_batches(self, cursor: t.Any, batch_rows: int) -> t.Iterator[pa.RecordBatch]:
+        import pyarrow as pa
+
+        reader = cursor.fetch_record_batch(batch_rows)
+
+        def batches() -> t.Iterator[pa.RecordBatch]:
+            empty = True
+            for batch in reader:
+                empty = False
+                yield batch
+            if empty:
+                yield pa.RecordBatch.from_pylist([], schema=reader.schema)
+
+        return batches()
+
     def _get_data_objects(
         self, schema_name: str, catalog_name: t.Optional[str] = None
     ) -> t.List[DataObject]:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import io
 import typing as t
 
+import pandas as pd
 from sqlglot import exp
 
 from sqlmesh.core.engine_adapter.base import (
@@ -43,3 +45,31 @@ class PostgresBaseEngineAdapter(EngineAdapter):
 
 class PostgresEngineAdapter(PostgresBaseEngineAdapter, EngineAdapterWithIndexSupport):
     DIALECT = "postgres"
+    COPY_NULL_MARKER = "\\N"
+
+    def _insert_append_pandas_df(
+        self,
+        table_name: TableName,
+        df: pd.DataFrame,
+        columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
+    ) -> None:
+        """
+        Streams the DataFrame to the server as CSV with `COPY ... FROM STDIN` instead of rendering every row
+        as a SQL literal. Falls back to the default implementation if the driver doesn't support `COPY`.
+        """
+        cursor = self.cursor
+        if not hasattr(cursor, "copy_expert"):
+            return super()._insert_append_pandas_df(table_name, df, columns_to_types)
+
+        columns = list(columns_to_types or df.columns)
+        into = exp.Schema(
+            this=exp.to_table(table_name),
+            expressions=[exp.to_identifier(column) for column in columns],
+        )
+        buffer = io.StringIO()
+        df[columns].to_csv(buffer, index=False, header=False, na_rep=self.COPY_NULL_MARKER)
+        buffer.seek(0)
+
+        sql = f"COPY {self._to_sql(into)} FROM STDIN WITH (FORMAT csv, NULL '{self.COPY_NULL_MARKER}')"
+        with self.transaction():
+            cursor.copy_expert(sql, buffer)
@@ -7,6 +7,9 @@ from pydantic import Field
 
 from sqlmesh.utils.pydantic import PydanticModel
 
+if t.TYPE_CHECKING:
+    import pyarrow as pa
+
 
 class TransactionType(str, Enum):
     DDL = "DDL"
@@ -53,3 +56,24 @@ class DataObject(PydanticModel):
     schema_name: str = Field(alias="schema")
     name: str
     type: DataObjectType
+
+
+def arrow_tables_to_batches(
+    tables: t.Iterable[pa.Table], batch_rows: int
+) -> t.Iterator[pa.RecordBatch]:
+    """Splits a stream of Arrow tables into record batches with at most `batch_rows` rows each.
+
+    Yields a single empty batch if none of the tables contain any rows so that the schema is preserved.
+    """
+    import pyarrow as pa
+
+    schema = None
+    empty = True
+    for table in tables:
+        schema = table.schema
+        for batch in table.to_batches(max_chunksize=batch_rows):
+            if batch.num_rows:
+                empty = False
+                yield batch
+    if empty:
+        yield pa.RecordBatch.from_pylist([], schema=schema)
@@ -6,10 +6,18 @@ import pandas as pd
 from sqlglot import exp, parse_one
 
 from sqlmesh.core.engine_adapter.base import EngineAdapter
-from sqlmesh.core.engine_adapter.shared import DataObject, DataObjectType
+from sqlmesh.core.engine_adapter.shared import (
+    DataObject,
+    DataObjectType,
+    arrow_tables_to_batches,
+)
 from sqlmesh.utils import nullsafe_join
+from sqlmesh.utils.errors import SQLMeshError
 
 if t.TYPE_CHECKING:
+    import pyarrow as pa
+
+    from sqlmesh.core._typing import TableName
     from sqlmesh.core.engine_adapter._typing import DF
 
 
@@ -18,6 +26,34 @@ class SnowflakeEngineAdapter(EngineAdapter):
     DIALECT = "snowflake"
     ESCAPE_JSON = True
 
+    def _insert_append_pandas_df(
+        self,
+        table_name: TableName,
+        df: pd.DataFrame,
+        columns_to_types: t.Optional[t.Dict[str, exp.DataType]] = None,
+    ) -> None:
+        """
+        Uses the connector's `write_pandas` which uploads the DataFrame to a temporary stage as Parquet files
+        and loads them with `COPY INTO` instead of rendering every row as a SQL literal.
+        """
+        from snowflake.connector.pandas_tools import write_pandas
+
+        table = exp.to_table(table_name)
+        if columns_to_types:
+            df = df[list(columns_to_types)]
+        success, _, _, output = write_pandas(
+            self._connection_pool.get(),
+            df,
+            table.name,
+            database=table.catalog or None,
+            schema=table.db or None,
+            quote_identifiers=False,
+        )
+        if not success:
+            raise SQLMeshError(
+                f"Failed to load a DataFrame into '{table.sql(dialect=self.dialect)}': {output}"
+            )
+
     def _fetch_native_df(self, query: t.Union[exp.Expression, str]) -> DF:
         from snowflake.connector.errors import NotSupportedError
 
@@ -46,6 +82,16 @@ class SnowflakeEngineAdapter(EngineAdapter):
             df.columns = query.named_selects
         return df
 
+    def _fetch_batches(self, cursor: t.Any, batch_rows: int) -> t.Iterator[pa.RecordBatch]:
+        from snowflake.connector.errors import NotSupportedError
+
+        try:
+            tables = cursor.fetch_arrow_batches()
+        except NotSupportedError:
+            # Results that aren't returned in the Arrow format (Ex: `SHOW` commands) are fetched row by row.
+            return self._fetchmany_batches(cursor, batch_rows)
+        return arrow_tables_to_batches(tables, batch_rows)
+
     def _get_data_objects(
         self, schema_name: str, catalog_name: t.Optional[str] = None
     ) -> t.List[DataObject]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import hashlib
 import importlib
 import linecache
 import os
@@ -10,28 +11,59 @@ import typing as t
 from dataclasses import dataclass
 from pathlib import Path
 
+from sqlglot import exp
 from sqlglot.errors import SqlglotError
 from sqlglot.schema import MappingSchema
 
-from sqlmesh.core.audit import Audit
+from sqlmesh.core import constants as c
+from sqlmesh.core.audit import BUILT_IN_AUDITS, Audit
 from sqlmesh.core.dialect import parse
 from sqlmesh.core.hooks import HookRegistry, hook
 from sqlmesh.core.macros import MacroRegistry, macro
-from sqlmesh.core.model import Model, SeedModel, load_model
+from sqlmesh.core.model import Model, SeedModel, SqlModel, load_model
 from sqlmesh.core.model import model as model_registry
+from sqlmesh.core.snapshot import FingerprintIndex
 from sqlmesh.utils import UniqueKeyDict
+from sqlmesh.utils.cache import FileCache, cache_key
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.errors import ConfigError
+from sqlmesh.utils.pydantic import PydanticModel
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.context import Context
 
-
-def update_model_schemas(dialect: str, dag: DAG[str], models: UniqueKeyDict[str, Model]) -> None:
+T = t.TypeVar("T")
+
+
+def update_model_schemas(
+    dialect: str,
+    dag: DAG[str],
+    models: UniqueKeyDict[str, Model],
+    changed: t.Optional[t.Set[str]] = None,
+    cache: t.Optional[ModelCache] = None,
+) -> None:
+    """Propagates the columns of models to their downstream dependents.
+
+    Args:
+        dialect: The default dialect.
+        dag: The DAG of models.
+        models: All models by name.
+        changed: If provided only the schemas of these models and their downstream dependents are updated.
+            The schemas of all other models are assumed to be up to date.
+        cache: If provided the inferred columns of models are looked up in and stored to this cache.
+    """
     schema = MappingSchema(dialect=dialect)
+    affected: t.Set[str] = set()
+    graph = dag.graph
     for name in dag.sorted():
         model = models.get(name)
 
+        if changed is not None and name not in changed and graph[name].isdisjoint(affected):
+            if model:
+                schema.add_table(name, model.columns_to_types)
+            continue
+        affected.add(name)
+
         # External models don't exist in the context, so we need to skip them
         if not model:
             continue
@@ -42,7 +74,164 @@ def update_model_schemas(dialect: str, dag: DAG[str], models: UniqueKeyDict[str,
             )
 
         model.update_schema(schema)
-        schema.add_table(name, model.columns_to_types)
+        if changed is not None and name not in changed and isinstance(model, SqlModel):
+            # The model itself didn't change but its upstream did, so the inferred columns are outdated.
+            model._columns_to_types = None
+        schema.add_table(
+            name, cache.columns_to_types(model, models) if cache else model.columns_to_types
+        )
+
+
+class _CachedModel(PydanticModel):
+    model: Model
+    depends_on: t.Set[str]
+
+
+class _CachedColumns(PydanticModel):
+    columns_to_types: t.Dict[str, str]
+
+
+class _CachedHashes(PydanticModel):
+    data_hash: str
+    metadata_hash: str
+
+
+class ModelCache(FingerprintIndex):
+    """Persists parsed model definitions, inferred model columns and model hashes across processes.
+
+    Definitions are keyed by everything that determines the loaded model, ie. the model file's path and
+    content, the macros and hooks of the project, and the project's settings. Inferred columns are keyed
+    by the model's definition and the columns of its upstream models. Data and metadata hashes are keyed
+    by the model's definition, the physical schema and the audits referenced by the model.
+
+    Args:
+        path: The root directory of the cache.
+    """
+
+    def __init__(self, path: Path):
+        self._definitions = FileCache(path, _CachedModel, "models")
+        self._columns = FileCache(path, _CachedColumns, "model_columns")
+        self._hashes = FileCache(path, _CachedHashes, "model_hashes")
+        self._keys: t.Dict[str, t.Tuple[Model, str]] = {}
+        self._audit_keys: t.Dict[str, t.Tuple[Audit, str]] = {}
+
+    def get_or_load(self, key: str, path: Path, load: t.Callable[[], Model]) -> Model:
+        """Returns the cached model with the given key or loads and caches it.
+
+        Args:
+            key: The key of the model's definition, see `cache_key`.
+            path: The path of the model's file.
+            load: Loads the model if it's not cached.
+
+        Returns:
+            The model.
+        """
+        entry = self._definitions.get(key)
+        if entry:
+            model = entry.model
+            model._path = path
+            model._depends_on = entry.depends_on
+        else:
+            model = load()
+            # Seed models depend on the content of their seed files, which is not part of the key.
+            if isinstance(model, SeedModel):
+                return model
+            self._definitions.put(key, _CachedModel(model=model, depends_on=model.depends_on))
+
+        self._keys[model.name] = (model, key)
+        return model
+
+    def columns_to_types(
+        self, model: Model, models: t.Dict[str, Model]
+    ) -> t.Dict[str, exp.DataType]:
+        """Returns the columns of the given model, looking up inferred columns in the cache.
+
+        Args:
+            model: The model.
+            models: All models by name.
+
+        Returns:
+            The mapping of column names to types.
+        """
+        definition_key = self._definition_key(model)
+        if (
+            definition_key is None
+            or not isinstance(model, SqlModel)
+            or model.columns_to_types_ is not None
+        ):
+            return model.columns_to_types
+
+        key = cache_key(
+            definition_key,
+            *(
+                f"{name}:{_columns_key(models[name].columns_to_types)}"
+                for name in sorted(model.depends_on)
+                if name in models
+            ),
+        )
+        entry = self._columns.get(key)
+        if entry:
+            model._columns_to_types = {
+                column: exp.DataType.build(column_type)
+                for column, column_type in entry.columns_to_types.items()
+            }
+        elif all(column_type for column_type in model.columns_to_types.values()):
+            self._columns.put(
+                key,
+                _CachedColumns(
+                    columns_to_types={
+                        column: column_type.sql()
+                        for column, column_type in model.columns_to_types.items()
+                    }
+                ),
+            )
+        return model.columns_to_types
+
+    def get(
+        self, model: Model, physical_schema: str, audits: t.Dict[str, Audit]
+    ) -> t.Optional[t.Tuple[str, str]]:
+        key = self._hashes_key(model, physical_schema, audits)
+        entry = self._hashes.get(key) if key else None
+        return (entry.data_hash, entry.metadata_hash) if entry else None
+
+    def put(
+        self,
+        model: Model,
+        physical_schema: str,
+        audits: t.Dict[str, Audit],
+        hashes: t.Tuple[str, str],
+    ) -> None:
+        key = self._hashes_key(model, physical_schema, audits)
+        if key:
+            self._hashes.put(key, _CachedHashes(data_hash=hashes[0], metadata_hash=hashes[1]))
+
+    def _definition_key(self, model: Model) -> t.Optional[str]:
+        definition = self._keys.get(model.name)
+        if not definition or definition[0] is not model:
+            return None
+        return definition[1]
+
+    def _hashes_key(
+        self, model: Model, physical_schema: str, audits: t.Dict[str, Audit]
+    ) -> t.Optional[str]:
+        definition_key = self._definition_key(model)
+        if definition_key is None:
+            return None
+
+        audit_keys = []
+        for audit_name, _ in sorted(model.audits, key=lambda a: a[0]):
+            if audit_name in BUILT_IN_AUDITS:
+                continue
+            audit = audits.get(audit_name)
+            if audit is None:
+                return None
+            audit_key = self._audit_keys.get(audit_name)
+            if not audit_key or audit_key[0] is not audit:
+                audit_key = (audit, cache_key(audit.json()))
+                self._audit_keys[audit_name] = audit_key
+            audit_keys.append(audit_key[1])
+
+        return cache_key(definition_key, model.name, physical_schema, *audit_keys)
 
 
 @dataclass
@@ -52,14 +241,30 @@ class LoadedProject:
     models: UniqueKeyDict[str, Model]
     audits: UniqueKeyDict[str, Audit]
     dag: DAG[str]
+    fingerprint_index: t.Optional[FingerprintIndex] = None
+
+
+@dataclass
+class _CachedFile(t.Generic[T]):
+    stat: t.Tuple[int, int]
+    content_hash: str
+    value: T
 
 
 class Loader(abc.ABC):
-    """Abstract base class to load macros and models for a context"""
+    """Abstract base class to load macros and models for a context
+
+    Loaders are reused across reloads of the same context. Models that are returned as the same instance
+    as in the previous load are considered unchanged, so that only the schemas of changed models and
+    their downstream dependents are updated.
+    """
 
     def __init__(self) -> None:
         self._path_mtimes: t.Dict[Path, float] = {}
         self._dag: DAG[str] = DAG()
+        self._models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
+        self._file_cache: t.Dict[Path, _CachedFile] = {}
+        self._model_cache: t.Optional[ModelCache] = None
 
     def load(self, context: Context) -> LoadedProject:
         """
@@ -73,6 +278,8 @@ class Loader(abc.ABC):
         linecache.clearcache()
 
         self._context = context
+        if self._model_cache is None:
+            self._model_cache = ModelCache(context.path / c.CACHE_PATH)
         self._path_mtimes.clear()
         self._dag = DAG()
 
@@ -80,12 +287,24 @@ class Loader(abc.ABC):
         models = self._load_models(macros, hooks)
         for model in models.values():
             self._add_model_to_dag(model)
-        update_model_schemas(self._context.dialect, self._dag, models)
+
+        changed = {
+            name for name, model in models.items() if self._models.get(name) is not model
+        } | (self._models.keys() - models.keys())
+        update_model_schemas(
+            self._context.dialect, self._dag, models, changed, cache=self._model_cache
+        )
+        self._models = models
 
         audits = self._load_audits()
 
         project = LoadedProject(
-            macros=macros, hooks=hooks, models=models, audits=audits, dag=self._dag
+            macros=macros,
+            hooks=hooks,
+            models=models,
+            audits=audits,
+            dag=self._dag,
+            fingerprint_index=self._model_cache,
         )
         return project
 
@@ -122,19 +341,70 @@ class Loader(abc.ABC):
         """Project file to track for modifications"""
         self._path_mtimes[path] = path.stat().st_mtime
 
+    def _load_cached(self, path: Path, load: t.Callable[[str], T]) -> T:
+        """Loads a value from the content of a file, reusing the value from a previous load if the file
+        was not modified in the meantime. The content of a file is only hashed if its modification time or
+        size changed.
+
+        Args:
+            path: The path to the file.
+            load: Creates a value from the file's content.
+
+        Returns:
+            The loaded value.
+        """
+        stat_result = path.stat()
+        stat = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._file_cache.get(path)
+        if cached and cached.stat == stat:
+            return cached.value
+
+        with open(path, "r", encoding="utf-8") as file:
+            content = file.read()
+        content_hash = _hash_content(content)
+        if cached and cached.content_hash == content_hash:
+            cached.stat = stat
+            return cached.value
+
+        value = load(content)
+        self._file_cache[path] = _CachedFile(stat=stat, content_hash=content_hash, value=value)
+        return value
+
 
 class SqlMeshLoader(Loader):
-    """Loads macros and models for a context using the SQLMesh file formats"""
+    """Loads macros and models for a context using the SQLMesh file formats
+
+    SQL models and audits are only re-parsed if their files changed since the previous load, unless
+    macros or hooks changed. Python models are re-imported if any of the Python model files changed.
+    Parsed SQL models are also persisted in the project's cache directory, so that unchanged models
+    don't need to be parsed again by subsequent processes.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._scripts: t.Optional[t.Tuple[t.Tuple, MacroRegistry, HookRegistry]] = None
+        self._python_models: t.Optional[t.Tuple[t.Tuple, UniqueKeyDict[str, Model]]] = None
 
     def _load_scripts(self) -> t.Tuple[MacroRegistry, HookRegistry]:
         """Loads all user defined hooks and macros."""
+        paths = tuple(self._glob_path(self._context.macro_directory_path, ".py")) + tuple(
+            self._glob_path(self._context.hook_directory_path, ".py")
+        )
+        scripts_key = _files_key(paths)
+        if self._scripts and self._scripts[0] == scripts_key:
+            for path in paths:
+                self._track_file(path)
+            return self._scripts[1], self._scripts[2]
+
+        # Models are rendered using macros and hooks, so all of them need to be re-loaded.
+        self._file_cache.clear()
+        self._python_models = None
+
         # Store a copy of the macro registry
         standard_hooks = hook.get_registry()
         standard_macros = macro.get_registry()
 
-        for path in tuple(self._glob_path(self._context.macro_directory_path, ".py")) + tuple(
-            self._glob_path(self._context.hook_directory_path, ".py")
-        ):
+        for path in paths:
             if self._import_python_file(path.relative_to(self._context.path)):
                 self._track_file(path)
 
@@ -144,6 +414,7 @@ class SqlMeshLoader(Loader):
         hook.set_registry(standard_hooks)
         macro.set_registry(standard_macros)
 
+        self._scripts = (scripts_key, macros, hooks)
         return macros, hooks
 
     def _load_models(self, macros: MacroRegistry, hooks: HookRegistry) -> UniqueKeyDict[str, Model]:
@@ -163,38 +434,72 @@ class SqlMeshLoader(Loader):
         models: UniqueKeyDict = UniqueKeyDict("models")
         for path in self._glob_path(self._context.models_directory_path, ".sql"):
             self._track_file(path)
-            with open(path, "r", encoding="utf-8") as file:
-                try:
-                    expressions = parse(file.read(), default_dialect=self._context.dialect)
-                except SqlglotError as ex:
-                    raise ConfigError(f"Failed to parse a model definition at '{path}': {ex}")
-                model = load_model(
-                    expressions,
-                    defaults=self._context.config.model_defaults.dict(),
-                    macros=macros,
-                    hooks=hooks,
-                    path=Path(path).absolute(),
-                    module_path=self._context.path,
-                    dialect=self._context.dialect,
-                    time_column_format=self._context.config.time_column_format,
-                )
-                models[model.name] = model
+            model = self._load_cached(
+                path, lambda content: self._load_sql_model(path, content, macros, hooks)
+            )
+            models[model.name] = model
 
-                if isinstance(model, SeedModel):
-                    seed_path = model.seed_path
-                    self._track_file(seed_path)
+            if isinstance(model, SeedModel):
+                seed_path = model.seed_path
+                self._track_file(seed_path)
+                # Changes to the seed file itself are not detected by the cache.
+                self._file_cache.pop(path, None)
 
         return models
 
+    def _load_sql_model(
+        self, path: Path, content: str, macros: MacroRegistry, hooks: HookRegistry
+    ) -> Model:
+        path = Path(path).absolute()
+        if self._model_cache is None:
+            return self._parse_sql_model(path, content, macros, hooks)
+
+        key = cache_key(
+            str(path),
+            content,
+            self._context.dialect,
+            self._context.config.model_defaults.json(),
+            self._context.config.time_column_format,
+            str(self._scripts[0] if self._scripts else ()),
+        )
+        return self._model_cache.get_or_load(
+            key, path, lambda: self._parse_sql_model(path, content, macros, hooks)
+        )
+
+    def _parse_sql_model(
+        self, path: Path, content: str, macros: MacroRegistry, hooks: HookRegistry
+    ) -> Model:
+        try:
+            expressions = parse(content, default_dialect=self._context.dialect)
+        except SqlglotError as ex:
+            raise ConfigError(f"Failed to parse a model definition at '{path}': {ex}")
+        return load_model(
+            expressions,
+            defaults=self._context.config.model_defaults.dict(),
+            macros=macros,
+            hooks=hooks,
+            path=path,
+            module_path=self._context.path,
+            dialect=self._context.dialect,
+            time_column_format=self._context.config.time_column_format,
+        )
+
     def _load_python_models(self) -> UniqueKeyDict[str, Model]:
         """Loads the python models into a Dict"""
+        paths = tuple(self._glob_path(self._context.models_directory_path, ".py"))
+        for path in paths:
+            self._track_file(path)
+
+        models_key = _files_key(paths)
+        if self._python_models and self._python_models[0] == models_key:
+            return self._python_models[1]
+
         models: UniqueKeyDict = UniqueKeyDict("models")
         registry = model_registry.registry()
         registry.clear()
         registered: t.Set[str] = set()
 
-        for path in self._glob_path(self._context.models_directory_path, ".py"):
-            self._track_file(path)
+        for path in paths:
             self._import_python_file(path.relative_to(self._context.path))
             new = registry.keys() - registered
             registered |= new
@@ -207,6 +512,7 @@ class SqlMeshLoader(Loader):
                 )
                 models[model.name] = model
 
+        self._python_models = (models_key, models)
         return models
 
     def _load_audits(self) -> UniqueKeyDict[str, Audit]:
@@ -214,15 +520,16 @@ class SqlMeshLoader(Loader):
         audits_by_name: UniqueKeyDict[str, Audit] = UniqueKeyDict("audits")
         for path in self._glob_path(self._context.audits_directory_path, ".sql"):
             self._track_file(path)
-            with open(path, "r", encoding="utf-8") as file:
-                expressions = parse(file.read(), default_dialect=self._context.dialect)
-                audits = Audit.load_multiple(
-                    expressions=expressions,
+            audits = self._load_cached(
+                path,
+                lambda content: Audit.load_multiple(
+                    expressions=parse(content, default_dialect=self._context.dialect),
                     path=path,
                     dialect=self._context.dialect,
-                )
-                for audit in audits:
-                    audits_by_name[audit.name] = audit
+                ),
+            )
+            for audit in audits:
+                audits_by_name[audit.name] = audit
         return audits_by_name
 
     def _import_python_file(self, relative_path: Path) -> types.ModuleType:
@@ -252,3 +559,23 @@ class SqlMeshLoader(Loader):
                     break
             else:
                 yield filepath
+
+
+def _columns_key(columns_to_types: t.Dict[str, exp.DataType]) -> str:
+    return ",".join(
+        f"{column} {column_type.sql() if column_type else ''}"
+        for column, column_type in columns_to_types.items()
+    )
+
+
+def _hash_content(content: str) -> str:
+    return hashlib.md5(content.encode("utf-8")).hexdigest()
+
+
+def _files_key(paths: t.Iterable[Path]) -> t.Tuple[t.Tuple[Path, str], ...]:
+    """Identifies a set of files by their paths and contents."""
+    key = []
+    for path in sorted(paths):
+        with open(path, "r", encoding="utf-8") as file:
+            key.append((path, _hash_content(file.read())))
+    return tuple(key)
@@ -610,7 +610,7 @@ class SqlModel(_Model):
         return self._query_renderer.contains_star_query
 
     def update_schema(self, schema: MappingSchema) -> None:
-        self._query_renderer.update_schema(schema)
+        self._query_renderer.update_schema(schema, {*self.depends_on, self.name})
 
     @property
     def columns_to_types(self) -> t.Dict[str, exp.DataType]:
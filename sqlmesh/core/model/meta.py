@@ -3,7 +3,7 @@ from __future__ import annotations
 import typing as t
 from enum import Enum
 
-from croniter import croniter
+from croniter import croniter, croniter_range
 from pydantic import Field, root_validator, validator
 from sqlglot import exp, maybe_parse
 
@@ -17,7 +17,12 @@ from sqlmesh.core.model.kind import (
     model_kind_validator,
 )
 from sqlmesh.utils import unique
-from sqlmesh.utils.date import TimeLike, preserve_time_like_kind, to_datetime
+from sqlmesh.utils.date import (
+    TimeLike,
+    preserve_time_like_kind,
+    to_datetime,
+    to_timestamp,
+)
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.pydantic import PydanticModel
 
@@ -35,6 +40,13 @@ class IntervalUnit(str, Enum):
     MINUTE = "minute"
 
 
+# The periods in milliseconds of normalized crons which tick at fixed intervals.
+FIXED_CRON_PERIODS = {
+    "* * * * *": 60 * 1000,
+    "0 * * * *": 60 * 60 * 1000,
+    "0 0 * * *": 24 * 60 * 60 * 1000,
+}
+
 HookCall = t.Union[exp.Expression, t.Tuple[str, t.Dict[str, exp.Expression]]]
 AuditReference = t.Tuple[str, t.Dict[str, exp.Expression]]
 
@@ -305,6 +317,33 @@ class ModelMeta(PydanticModel):
             return "0 0 * * *"
         return ""
 
+    @property
+    def cron_period(self) -> t.Optional[int]:
+        """The period of the normalized cron in milliseconds or None if it doesn't tick at fixed intervals."""
+        return FIXED_CRON_PERIODS.get(self.normalized_cron())
+
+    def cron_ticks(self, start: TimeLike, end: TimeLike) -> t.List[int]:
+        """
+        Get all ticks of the model's normalized cron between start and end inclusive.
+
+        Args:
+            start: The start of the range.
+            end: The end of the range.
+
+        Returns:
+            A list of epoch millis timestamps.
+        """
+        period = self.cron_period
+        if period is None:
+            return [
+                to_timestamp(tick)
+                for tick in croniter_range(
+                    to_datetime(start), to_datetime(end), self.normalized_cron()
+                )
+            ]
+        first = -(-to_timestamp(start) // period) * period
+        return list(range(first, to_timestamp(end) + 1, period))
+
     def croniter(self, value: TimeLike) -> croniter:
         if self._croniter is None:
             self._croniter = croniter(self.normalized_cron())
@@ -321,6 +360,11 @@ class ModelMeta(PydanticModel):
         Returns:
             The timestamp for the next run.
         """
+        period = self.cron_period
+        if period is not None:
+            return preserve_time_like_kind(
+                value, (to_timestamp(value) // period + 1) * period / 1000
+            )
         return preserve_time_like_kind(value, self.croniter(value).get_next())
 
     def cron_prev(self, value: TimeLike) -> TimeLike:
@@ -333,6 +377,11 @@ class ModelMeta(PydanticModel):
         Returns:
             The timestamp for the previous run.
         """
+        period = self.cron_period
+        if period is not None:
+            return preserve_time_like_kind(
+                value, ((to_timestamp(value) - 1) // period) * period / 1000
+            )
         return preserve_time_like_kind(value, self.croniter(value).get_prev())
 
     def cron_floor(self, value: TimeLike) -> TimeLike:
@@ -345,4 +394,7 @@ class ModelMeta(PydanticModel):
         Returns:
             The timestamp floor.
         """
+        period = self.cron_period
+        if period is not None:
+            return preserve_time_like_kind(value, (to_timestamp(value) // period) * period / 1000)
         return preserve_time_like_kind(value, self.croniter(self.cron_next(value)).get_prev())
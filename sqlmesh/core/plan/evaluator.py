@@ -13,13 +13,15 @@ At a high level, when a plan is evaluated, SQLMesh will:
 
 Refer to `sqlmesh.core.plan`.
 """
+from __future__ import annotations
+
 import abc
 import typing as t
 
 from sqlmesh.core._typing import NotificationTarget
 from sqlmesh.core.console import Console, get_console
 from sqlmesh.core.plan.definition import Plan
-from sqlmesh.core.scheduler import Scheduler
+from sqlmesh.core.scheduler import ExecutorType, Scheduler, SchedulingPolicyType
 from sqlmesh.core.snapshot import SnapshotEvaluator, SnapshotInfoLike
 from sqlmesh.core.state_sync import StateSync
 from sqlmesh.core.user import User
@@ -29,6 +31,9 @@ from sqlmesh.utils import random_id
 from sqlmesh.utils.date import now
 from sqlmesh.utils.errors import SQLMeshError
 
+if t.TYPE_CHECKING:
+    from sqlmesh.core.config.connection import ConnectionConfig
+
 
 class PlanEvaluator(abc.ABC):
     @abc.abstractmethod
@@ -52,11 +57,19 @@ class BuiltInPlanEvaluator(PlanEvaluator):
         snapshot_evaluator: SnapshotEvaluator,
         backfill_concurrent_tasks: int = 1,
         console: t.Optional[Console] = None,
+        scheduling_policy: SchedulingPolicyType = SchedulingPolicyType.FIFO,
+        run_durations: t.Optional[t.Dict[str, float]] = None,
+        executor_type: ExecutorType = ExecutorType.THREAD,
+        connection_config: t.Optional[ConnectionConfig] = None,
     ):
         self.state_sync = state_sync
         self.snapshot_evaluator = snapshot_evaluator
         self.backfill_concurrent_tasks = backfill_concurrent_tasks
         self.console = console or get_console()
+        self.scheduling_policy = scheduling_policy
+        self.run_durations = run_durations
+        self.executor_type = executor_type
+        self.connection_config = connection_config
 
     def evaluate(self, plan: Plan) -> None:
         self._push(plan)
@@ -72,6 +85,10 @@ class BuiltInPlanEvaluator(PlanEvaluator):
                 self.state_sync,
                 max_workers=self.backfill_concurrent_tasks,
                 console=self.console,
+                scheduling_policy=self.scheduling_policy,
+                run_durations=self.run_durations,
+                executor_type=self.executor_type,
+                connection_config=self.connection_config,
             )
             is_run_successful = scheduler.run(plan.environment_name, plan.start, plan.end)
             if not is_run_successful:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 import typing as t
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
@@ -19,7 +21,7 @@ from sqlmesh.core import constants as c
 from sqlmesh.core import dialect as d
 from sqlmesh.core.macros import MacroEvaluator
 from sqlmesh.core.model.kind import TimeColumn
-from sqlmesh.utils.date import TimeLike, date_dict, make_inclusive, to_datetime
+from sqlmesh.utils.date import UTC, TimeLike, date_dict, make_inclusive, to_datetime
 from sqlmesh.utils.errors import ConfigError, MacroEvalError, raise_config_error
 from sqlmesh.utils.jinja import JinjaMacroRegistry
 from sqlmesh.utils.metaprogramming import Executable, prepare_env
@@ -35,6 +37,16 @@ RENDER_OPTIMIZER_RULES = (
     annotate_types,
 )
 
+RENDER_CACHE_MAX_ENTRIES = 1000
+
+RenderCacheKey = t.Tuple[t.Hashable, ...]
+
+# Distinctive dates used to render query templates, so that the literals produced by
+# date macros can be located in the rendered query and replaced with placeholders.
+TEMPLATE_START = datetime(1979, 3, 14, 15, 9, 26, 535000, tzinfo=UTC)
+TEMPLATE_END = datetime(1979, 3, 16, 8, 9, 7, 932000, tzinfo=UTC)
+TEMPLATE_LATEST = datetime(1979, 3, 18, 3, 8, 4, 626000, tzinfo=UTC)
+
 
 def _dates(
     start: t.Optional[TimeLike] = None,
@@ -47,6 +59,82 @@ def _dates(
     )
 
 
+class RenderCache:
+    """A thread-safe LRU cache of rendered queries which is shared by all query renderers.
+
+    Args:
+        max_entries: The maximum number of rendered queries to keep.
+    """
+
+    def __init__(self, max_entries: int = RENDER_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[RenderCacheKey, exp.Subqueryable] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: RenderCacheKey) -> t.Optional[exp.Subqueryable]:
+        """Returns the cached query for the given key or None if it's not in the cache."""
+        with self._lock:
+            query = self._entries.get(key)
+            if query is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return query
+
+    def put(self, key: RenderCacheKey, query: exp.Subqueryable) -> None:
+        """Adds a rendered query to the cache evicting the least recently used entries if needed."""
+        with self._lock:
+            self._entries[key] = query
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+render_cache = RenderCache()
+
+
+class _UncacheableValueError(Exception):
+    pass
+
+
+def _kwargs_cache_key(kwargs: t.Dict[str, t.Any]) -> t.Optional[t.Hashable]:
+    """Returns the part of the cache key which identifies the render kwargs or None if they can't be keyed."""
+    try:
+        return tuple(sorted((k, _cache_value(v)) for k, v in kwargs.items() if v is not None))
+    except _UncacheableValueError:
+        return None
+
+
+def _cache_value(value: t.Any) -> t.Hashable:
+    from sqlmesh.core.engine_adapter import EngineAdapter
+
+    if isinstance(value, exp.Expression):
+        return value.sql()
+    if isinstance(value, (list, tuple)):
+        return tuple(_cache_value(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _cache_value(v)) for k, v in value.items()))
+    if value is None or isinstance(value, (str, int, float, bool, datetime)):
+        return value
+    if isinstance(value, EngineAdapter):
+        # Queries are rendered the same way by adapters of the same kind.
+        return (type(value).__name__, value.dialect)
+    raise _UncacheableValueError
+
+
 class ExpressionRenderer:
     def __init__(
         self,
@@ -140,6 +228,7 @@ class QueryRenderer(ExpressionRenderer):
         time_column: t.Optional[TimeColumn] = None,
         time_converter: t.Optional[t.Callable[[TimeLike], exp.Expression]] = None,
         only_latest: bool = False,
+        cache: t.Optional[RenderCache] = None,
     ):
         super().__init__(
             expression=query,
@@ -154,8 +243,11 @@ class QueryRenderer(ExpressionRenderer):
         self._time_column = time_column
         self._time_converter = time_converter or (lambda v: exp.convert(v))
 
-        self._query_cache: t.Dict[t.Tuple[datetime, datetime, datetime], exp.Subqueryable] = {}
+        self._cache = cache
+        self._cache_namespace: t.Optional[t.Tuple[str, ...]] = None
+        self._is_templatable: t.Optional[bool] = None
         self._schema: t.Optional[MappingSchema] = None
+        self._schema_key = ""
 
     def render(
         self,
@@ -180,7 +272,6 @@ class QueryRenderer(ExpressionRenderer):
             expand: Expand referenced models as subqueries. This is used to bypass backfills when running queries
                 that depend on materialized tables.  Model definitions are inlined and can thus be run end to
                 end on the fly.
-            query_key: A query key used to look up a rendered query in the cache.
             is_dev: Indicates whether the rendering happens in the development mode and temporary
                 tables / table clones should be used where applicable.
             kwargs: Additional kwargs to pass to the renderer.
@@ -191,7 +282,11 @@ class QueryRenderer(ExpressionRenderer):
         from sqlmesh.core.snapshot import to_table_mapping
 
         dates = _dates(start, end, latest)
-        cache_key = dates
+        # Queries rendered with kwargs which can't be part of the cache key are not cached.
+        kwargs_key = _kwargs_cache_key(kwargs)
+        cache_key = (
+            (*self._get_cache_namespace(), *dates, kwargs_key) if kwargs_key is not None else None
+        )
 
         snapshots = snapshots or {}
         mapping = to_table_mapping(snapshots.values(), is_dev)
@@ -199,28 +294,34 @@ class QueryRenderer(ExpressionRenderer):
         # won't be valid
         expand = set(expand) | {name for name in snapshots if name not in mapping}
 
-        query = self._expression
-
-        if cache_key not in self._query_cache:
-            query = super().render(start=start, end=end, latest=latest, **kwargs)  # type: ignore
-            if not query:
-                raise ConfigError(f"Failed to render query {query}")
-
-            self._query_cache[cache_key] = t.cast(exp.Subqueryable, query)
-
-            try:
-                self._query_cache[cache_key] = optimize(
-                    self._query_cache[cache_key],
-                    schema=self._schema,
-                    rules=RENDER_OPTIMIZER_RULES,
-                    remove_unused_selections=False,
-                )
-            except (SchemaError, OptimizeError):
-                pass
-            except SqlglotError as ex:
-                raise_config_error(f"Invalid model query. {ex}", self._path)
-
-        query = self._query_cache[cache_key]
+        # The final query is cached separately if it differs from the rendered one and
+        # doesn't inline other models.
+        result_key = (
+            (*cache_key, add_incremental_filter, tuple(sorted(mapping.items())))
+            if cache_key is not None and (mapping or add_incremental_filter) and not expand
+            else None
+        )
+        if result_key is not None:
+            cached = self.cache.get(result_key)
+            if cached is not None:
+                return cached.copy()
+
+        query: exp.Expression
+        cached_query = self.cache.get(cache_key) if cache_key is not None else None
+
+        if cached_query is None:
+            if (
+                kwargs_key is not None
+                and self.is_templatable
+                and not any(isinstance(v, exp.Expression) for v in kwargs.values())
+            ):
+                query = self._render_from_template(dates, kwargs_key, **kwargs)
+            else:
+                query = self._render_optimized(start, end, latest, **kwargs)
+            if cache_key is not None:
+                self.cache.put(cache_key, t.cast(exp.Subqueryable, query))
+        else:
+            query = cached_query
 
         if expand:
 
@@ -256,11 +357,18 @@ class QueryRenderer(ExpressionRenderer):
                     self.filter_time_column(node, *dates[0:2])
 
         if mapping:
-            return exp.replace_tables(query, mapping)
+            query = exp.replace_tables(query, mapping)
+
+        # The rendered query is cached, so make sure callers can't modify the cached copy.
+        if not expand and not add_incremental_filter and not mapping:
+            query = query.copy()
 
         if not isinstance(query, exp.Subqueryable):
             raise_config_error(f"Query needs to be a SELECT or a UNION {query}.", self._path)
 
+        if result_key is not None:
+            self.cache.put(result_key, t.cast(exp.Subqueryable, query.copy()))
+
         return t.cast(exp.Subqueryable, query)
 
     @property
@@ -268,13 +376,138 @@ class QueryRenderer(ExpressionRenderer):
         """Returns True if the model's query contains a star projection."""
         return any(isinstance(expression, exp.Star) for expression in self.render().expressions)
 
-    def update_schema(self, schema: MappingSchema) -> None:
+    @property
+    def is_templatable(self) -> bool:
+        """Whether dates only affect the rendered query through literals substituted by date macros.
+
+        In this case the query can be rendered and optimized once with placeholders for these literals,
+        which are then bound to the dates of each interval.
+        """
+        if self._is_templatable is None:
+            self._is_templatable = not isinstance(self._expression, d.Jinja) and not any(
+                isinstance(node, d.MacroFunc)
+                or (node.is_string and ("{{" in node.this or "{%" in node.this))
+                for node, _, _ in self._expression.walk()
+            )
+            self._is_templatable = self._is_templatable and not self._macro_definitions
+        return self._is_templatable
+
+    @property
+    def cache(self) -> RenderCache:
+        """The cache of rendered queries used by this renderer."""
+        return self._cache or render_cache
+
+    def _render_optimized(
+        self,
+        start: t.Optional[TimeLike] = None,
+        end: t.Optional[TimeLike] = None,
+        latest: t.Optional[TimeLike] = None,
+        **kwargs: t.Any,
+    ) -> exp.Expression:
+        rendered = super().render(start=start, end=end, latest=latest, **kwargs)
+        if not rendered:
+            raise ConfigError(f"Failed to render query {rendered}")
+
+        query = rendered
+        try:
+            query = optimize(
+                query,
+                schema=self._schema,
+                rules=RENDER_OPTIMIZER_RULES,
+                remove_unused_selections=False,
+            )
+        except (SchemaError, OptimizeError):
+            pass
+        except SqlglotError as ex:
+            raise_config_error(f"Invalid model query. {ex}", self._path)
+
+        return query
+
+    def _render_from_template(
+        self,
+        dates: t.Tuple[datetime, datetime, datetime],
+        kwargs_key: t.Hashable,
+        **kwargs: t.Any,
+    ) -> exp.Expression:
+        template_key = (*self._get_cache_namespace(), "template", kwargs_key)
+        template = self.cache.get(template_key)
+
+        if template is None:
+            sentinels = {
+                value.sql(dialect=self._dialect): name
+                for name, value in self._date_literals(
+                    *_dates(TEMPLATE_START, TEMPLATE_END, TEMPLATE_LATEST)
+                ).items()
+            }
+            sentinel_types = {type(parse_one(sql, read=self._dialect)) for sql in sentinels}
+
+            def _to_placeholder(node: exp.Expression) -> exp.Expression:
+                if isinstance(node, tuple(sentinel_types)):
+                    name = sentinels.get(node.sql(dialect=self._dialect))
+                    if name:
+                        return exp.Placeholder(this=name)
+                return node
+
+            template = t.cast(
+                exp.Subqueryable,
+                self._render_optimized(
+                    TEMPLATE_START, TEMPLATE_END, TEMPLATE_LATEST, **kwargs
+                ).transform(_to_placeholder, copy=False),
+            )
+            self.cache.put(template_key, template)
+
+        literals = self._date_literals(*dates)
+
+        def _bind(node: exp.Expression) -> exp.Expression:
+            if isinstance(node, exp.Placeholder) and node.name in literals:
+                return literals[node.name].copy()
+            return node
+
+        return template.transform(_bind)
+
+    def _date_literals(
+        self, start: datetime, end: datetime, latest: datetime
+    ) -> t.Dict[str, exp.Expression]:
+        """Returns the expressions date macros are substituted with for the given dates."""
+        return {
+            name: parse_one(exp.convert(value).sql(dialect=self._dialect), read=self._dialect)
+            for name, value in date_dict(start, end, latest, only_latest=self._only_latest).items()
+        }
+
+    def update_schema(self, schema: MappingSchema, tables: t.Iterable[str]) -> None:
+        """Updates the schema used to optimize the rendered query.
+
+        Args:
+            schema: The schema to optimize the query with.
+            tables: The names of the tables referenced by the query. Queries are keyed by the columns
+                of these tables only, since the rest of the schema doesn't affect the result.
+        """
         self._schema = schema
+        self._schema_key = str(
+            [
+                (
+                    table,
+                    schema.find(exp.to_table(table, dialect=self._dialect), raise_on_missing=False),
+                )
+                for table in sorted(tables)
+            ]
+        )
 
-        if self.contains_star_query:
-            # We need to re-render in order to expand the star projection
-            self._query_cache.clear()
-            self.render()
+    def _get_cache_namespace(self) -> t.Tuple[str, ...]:
+        """Returns the part of the cache key which identifies the definition of this renderer."""
+        if self._cache_namespace is None:
+            self._cache_namespace = (
+                self._expression.sql(dialect=self._dialect),
+                self._dialect,
+                *(definition.sql(dialect=self._dialect) for definition in self._macro_definitions),
+                *sorted(
+                    f"{name}:{executable.payload}" for name, executable in self._python_env.items()
+                ),
+                self._jinja_macro_registry.json(sort_keys=True),
+                self._time_column.json() if self._time_column else "",
+                str(self._only_latest),
+            )
+        return (*self._cache_namespace, self._schema_key)
 
     def filter_time_column(self, query: exp.Select, start: TimeLike, end: TimeLike) -> None:
         """Filters a query on the time column to ensure no data leakage when running in incremental mode."""
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import bisect
 import logging
+import threading
+import time
 import typing as t
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from enum import Enum
 
 from sqlmesh.core import constants as c
 from sqlmesh.core.console import Console, get_console
@@ -14,15 +20,26 @@ from sqlmesh.core.snapshot import (
 )
 from sqlmesh.core.state_sync import StateSync
 from sqlmesh.utils import format_exception
-from sqlmesh.utils.concurrency import concurrent_apply_to_dag
+from sqlmesh.utils.concurrency import (
+    LongestPathPolicy,
+    OldestFirstPolicy,
+    SchedulingPolicy,
+    concurrent_apply_to_dag,
+    estimate_makespan,
+)
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
     TimeLike,
     now,
     to_datetime,
+    to_timestamp,
     validate_date_range,
     yesterday,
 )
+from sqlmesh.utils.errors import ConfigError
+
+if t.TYPE_CHECKING:
+    from sqlmesh.core.config.connection import ConnectionConfig
 
 logger = logging.getLogger(__name__)
 Interval = t.Tuple[datetime, datetime]
@@ -31,6 +48,135 @@ SnapshotToBatches = t.Dict[Snapshot, Batch]
 SchedulingUnit = t.Tuple[Snapshot, Interval]
 
 
+class SchedulingPolicyType(Enum):
+    FIFO = "fifo"
+    """Intervals are evaluated in the order in which they become ready."""
+
+    LONGEST_PATH = "longest_path"
+    """Intervals with the longest remaining path of downstream intervals are evaluated first.
+    The path length is weighted by historical run durations when they are available.
+    """
+
+    OLDEST_INTERVAL = "oldest_interval"
+    """Intervals with the earliest start are evaluated first."""
+
+
+class ExecutorType(Enum):
+    THREAD = "thread"
+    """Intervals are evaluated by a pool of threads of the current process."""
+
+    PROCESS = "process"
+    """Intervals are evaluated by a pool of worker processes, each with its own engine adapter.
+    Processed intervals are committed to the state sync by the current process.
+    """
+
+
+class IntervalCommitBuffer:
+    """Groups processed intervals per snapshot and commits them to the state sync in batches.
+
+    Buffered intervals are flushed in a single state sync transaction once the number of buffered
+    intervals reaches `max_intervals` or once `max_wait_secs` seconds have passed since the last
+    flush. The time-based condition is checked by `flush_if_due`, which the scheduler calls whenever
+    an evaluation completes, successfully or not. An interval is only reported to the console as
+    processed after it has been flushed.
+
+    Errors raised while committing intervals don't fail the evaluation that triggered the flush. They
+    are collected in `errors` and the intervals are kept to be committed by the final `flush`. Once a
+    flush has failed, adding intervals or calling `flush_if_due` no longer triggers a flush, so that
+    the failing commit isn't retried after every evaluation.
+
+    Args:
+        state_sync: The state sync to commit intervals to.
+        console: The console which is notified about committed intervals.
+        is_dev: Indicates whether the intervals are being added while in development mode.
+        max_intervals: The maximum number of intervals to buffer before flushing.
+        max_wait_secs: The maximum number of seconds to wait between flushes.
+    """
+
+    def __init__(
+        self,
+        state_sync: StateSync,
+        console: Console,
+        is_dev: bool = False,
+        max_intervals: int = 100,
+        max_wait_secs: float = 10.0,
+    ):
+        self.state_sync = state_sync
+        self.console = console
+        self.is_dev = is_dev
+        self.max_intervals = max_intervals
+        self.max_wait_secs = max_wait_secs
+
+        self._intervals: t.Dict[Snapshot, t.List[t.Tuple[TimeLike, TimeLike]]] = defaultdict(list)
+        self._size = 0
+        self._last_flush_at = time.monotonic()
+        self._flush_failed = False
+        self._lock = threading.Lock()
+        self.errors: t.List[Exception] = []
+
+    def add(self, snapshot: Snapshot, start: TimeLike, end: TimeLike) -> None:
+        """Adds a processed interval to the buffer, flushing the buffer if necessary.
+
+        Args:
+            snapshot: The processed snapshot.
+            start: The start of the processed interval.
+            end: The end of the processed interval.
+        """
+        with self._lock:
+            self._intervals[snapshot].append((start, end))
+            self._size += 1
+            if self._size >= self.max_intervals and not self._flush_failed:
+                self._flush()
+
+    def flush_if_due(self) -> None:
+        """Commits all buffered intervals if `max_wait_secs` seconds have passed since the last flush."""
+        with self._lock:
+            if (
+                not self._flush_failed
+                and time.monotonic() - self._last_flush_at >= self.max_wait_secs
+            ):
+                self._flush()
+
+    def flush(self) -> None:
+        """Commits all buffered intervals to the state sync."""
+        with self._lock:
+            self._flush()
+
+    @property
+    def pending(self) -> int:
+        """The number of intervals which haven't been committed yet."""
+        return self._size
+
+    def _flush(self) -> None:
+        self._last_flush_at = time.monotonic()
+        if not self._intervals:
+            return
+
+        intervals, self._intervals = self._intervals, defaultdict(list)
+        size, self._size = self._size, 0
+        try:
+            self.state_sync.add_intervals(
+                (
+                    (snapshot, start, end)
+                    for snapshot, snapshot_intervals in intervals.items()
+                    for start, end in snapshot_intervals
+                ),
+                is_dev=self.is_dev,
+            )
+        except Exception as ex:
+            self.errors.append(ex)
+            self._flush_failed = True
+            # Keep the intervals so that they can be committed by the final flush.
+            for snapshot, snapshot_intervals in intervals.items():
+                self._intervals[snapshot].extend(snapshot_intervals)
+            self._size += size
+            return
+
+        self._flush_failed = False
+        for snapshot, snapshot_intervals in intervals.items():
+            self.console.update_snapshot_progress(snapshot.name, len(snapshot_intervals))
+
+
 class Scheduler:
     """Schedules and manages the evaluation of snapshots.
 
@@ -38,7 +184,9 @@ class Scheduler:
     topological order. It consults the state sync to understand what intervals for each
     snapshot needs to be backfilled.
 
-    The scheduler comes equipped with a simple ThreadPoolExecutor based evaluation engine.
+    The scheduler comes equipped with a simple ThreadPoolExecutor based evaluation engine. Intervals can
+    optionally be evaluated by a pool of worker processes instead, which helps when the evaluation is
+    CPU-bound, eg. for Python models.
 
     Args:
         snapshots: A collection of snapshots.
@@ -46,6 +194,17 @@ class Scheduler:
         state_sync: The state sync to pull saved snapshots.
         max_workers: The maximum number of parallel queries to run.
         console: The rich instance used for printing scheduling information.
+        scheduling_policy: The policy which determines the order in which ready intervals are evaluated.
+        run_durations: Historical run durations per model name, in seconds per second of an evaluated
+            interval. The scheduler updates this dictionary with durations of intervals it evaluates. The
+            durations are not persisted, so only runs made by the current process are taken into account.
+        commit_max_intervals: The maximum number of processed intervals which are buffered during a run
+            before they are committed to the state sync.
+        commit_max_wait_secs: The maximum number of seconds processed intervals are buffered during a run
+            before they are committed to the state sync.
+        executor_type: Whether intervals are evaluated by threads or by worker processes.
+        connection_config: The connection configuration used by worker processes to create their own engine
+            adapters. Required when intervals are evaluated by worker processes.
     """
 
     def __init__(
@@ -55,13 +214,38 @@ class Scheduler:
         state_sync: StateSync,
         max_workers: int = 1,
         console: t.Optional[Console] = None,
+        scheduling_policy: SchedulingPolicyType = SchedulingPolicyType.FIFO,
+        run_durations: t.Optional[t.Dict[str, float]] = None,
+        commit_max_intervals: int = 100,
+        commit_max_wait_secs: float = 10.0,
+        executor_type: ExecutorType = ExecutorType.THREAD,
+        connection_config: t.Optional[ConnectionConfig] = None,
     ):
+        if executor_type == ExecutorType.PROCESS:
+            if connection_config is None:
+                raise ConfigError(
+                    "A connection configuration is required to evaluate intervals in worker processes."
+                )
+            if not connection_config.is_multiprocess_safe:
+                raise ConfigError(
+                    f"Intervals can't be evaluated in worker processes with the '{connection_config.type_}' "
+                    "engine, since its database can't be opened by multiple processes at once."
+                )
+
         self.snapshots = {s.snapshot_id: s for s in snapshots}
         self.snapshot_per_version = _resolve_one_snapshot_per_version(snapshots)
         self.snapshot_evaluator = snapshot_evaluator
         self.state_sync = state_sync
         self.max_workers = max_workers
         self.console: Console = console or get_console()
+        self.scheduling_policy = scheduling_policy
+        self.run_durations = {} if run_durations is None else run_durations
+        self.commit_max_intervals = commit_max_intervals
+        self.commit_max_wait_secs = commit_max_wait_secs
+        self.executor_type = executor_type
+        self.connection_config = connection_config
+        self._serialized_snapshots: t.Dict[SnapshotId, str] = {}
+        self._process_pool: t.Optional[ProcessPoolExecutor] = None
 
     def batches(
         self,
@@ -96,10 +280,15 @@ class Scheduler:
         end: TimeLike,
         latest: TimeLike,
         is_dev: bool = False,
+        commit_buffer: t.Optional[IntervalCommitBuffer] = None,
         **kwargs: t.Any,
     ) -> None:
         """Evaluate a snapshot and add the processed interval to the state sync.
 
+        During a run with the process executor, the snapshot is evaluated by a worker process. The
+        duration of the evaluation, which doesn't include adding the interval, is recorded in
+        `run_durations`.
+
         Args:
             snapshot: Snapshot to evaluate.
             start: The start datetime to render.
@@ -107,35 +296,54 @@ class Scheduler:
             latest: The latest datetime to use for non-incremental queries.
             is_dev: Indicates whether the evaluation happens in the development mode and temporary
                 tables / table clones should be used where applicable.
+            commit_buffer: The buffer to add the processed interval to. If not provided, the interval
+                is added to the state sync right away.
             kwargs: Additional kwargs to pass to the renderer.
         """
         validate_date_range(start, end)
 
-        snapshots = {
-            **{p_sid.name: self.snapshots[p_sid] for p_sid in snapshot.parents},
-            snapshot.name: snapshot,
-        }
-
-        self.snapshot_evaluator.evaluate(
-            snapshot,
-            start,
-            end,
-            latest,
-            snapshots=snapshots,
-            is_dev=is_dev,
-            **kwargs,
-        )
-        self.snapshot_evaluator.audit(
-            snapshot=snapshot,
-            start=start,
-            end=end,
-            latest=latest,
-            snapshots=snapshots,
-            is_dev=is_dev,
-            **kwargs,
+        snapshots = self._snapshots_for_evaluation(snapshot)
+
+        started_at = time.perf_counter()
+        if self._process_pool:
+            self._process_pool.submit(
+                _evaluate_in_worker,
+                snapshot.snapshot_id,
+                self._serialize_snapshots(snapshots.values()),
+                start,
+                end,
+                latest,
+                is_dev,
+                kwargs,
+            ).result()
+        else:
+            self.snapshot_evaluator.evaluate(
+                snapshot,
+                start,
+                end,
+                latest,
+                snapshots=snapshots,
+                is_dev=is_dev,
+                **kwargs,
+            )
+            self.snapshot_evaluator.audit(
+                snapshot=snapshot,
+                start=start,
+                end=end,
+                latest=latest,
+                snapshots=snapshots,
+                is_dev=is_dev,
+                **kwargs,
+            )
+        self._record_run_duration(
+            snapshot, to_datetime(start), to_datetime(end), time.perf_counter() - started_at
         )
-        self.state_sync.add_interval(snapshot.snapshot_id, start, end, is_dev=is_dev)
-        self.console.update_snapshot_progress(snapshot.name, 1)
+
+        if commit_buffer:
+            commit_buffer.add(snapshot, start, end)
+        else:
+            self.state_sync.add_interval(snapshot, start, end, is_dev=is_dev)
+            self.console.update_snapshot_progress(snapshot.name, 1)
 
     def run(
         self,
@@ -170,20 +378,79 @@ class Scheduler:
             intervals = batches[snapshot]
             self.console.start_snapshot_progress(snapshot, len(intervals), environment)
 
+        commit_buffer = IntervalCommitBuffer(
+            self.state_sync,
+            self.console,
+            is_dev=is_dev,
+            max_intervals=self.commit_max_intervals,
+            max_wait_secs=self.commit_max_wait_secs,
+        )
+
+        # Worker processes only live for the duration of the run, and so do the snapshots they cache.
+        self._process_pool = (
+            ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.connection_config,
+                    dict(
+                        python_model_buffer_size=self.snapshot_evaluator.python_model_buffer_size,
+                        python_model_chunk_rows=self.snapshot_evaluator.python_model_chunk_rows,
+                        batch_audits=self.snapshot_evaluator.batch_audits,
+                    ),
+                ),
+            )
+            if self.executor_type == ExecutorType.PROCESS
+            else None
+        )
+
         def evaluate_node(node: SchedulingUnit) -> None:
             assert latest
             snapshot, (start, end) = node
-            self.evaluate(snapshot, start, end, latest, is_dev=is_dev)
-
-        with self.snapshot_evaluator.concurrent_context():
-            errors, skipped_intervals = concurrent_apply_to_dag(
-                dag,
-                evaluate_node,
-                self.max_workers,
-                raise_on_error=False,
-            )
+            try:
+                self.evaluate(
+                    snapshot, start, end, latest, is_dev=is_dev, commit_buffer=commit_buffer
+                )
+            finally:
+                commit_buffer.flush_if_due()
+
+        estimate_duration = self._duration_estimator(batches)
+        policy = self._policy(estimate_duration)
+        expected_makespan = (
+            estimate_makespan(dag, estimate_duration, self.max_workers, policy)
+            if estimate_duration
+            else None
+        )
 
-        self.console.stop_snapshot_progress(success=not errors)
+        started_at = time.perf_counter()
+        try:
+            with self.snapshot_evaluator.concurrent_context():
+                errors, skipped_intervals = concurrent_apply_to_dag(
+                    dag,
+                    evaluate_node,
+                    self.max_workers,
+                    raise_on_error=False,
+                    policy=policy,
+                )
+        finally:
+            if self._process_pool:
+                self._process_pool.shutdown()
+                self._process_pool = None
+            commit_buffer.flush()
+        actual_makespan = time.perf_counter() - started_at
+
+        self.console.stop_snapshot_progress(success=not errors and not commit_buffer.pending)
+
+        logger.info(
+            "Evaluated %s intervals in %.2fs, expected %s",
+            len(dag.graph),
+            actual_makespan,
+            "n/a" if expected_makespan is None else f"{expected_makespan:.2f}s",
+        )
+        if expected_makespan is not None:
+            self.console.log_status_update(
+                f"Expected run time: {expected_makespan:.2f}s, actual run time: {actual_makespan:.2f}s"
+            )
 
         for error in errors:
             sid = error.node[0]
@@ -194,7 +461,68 @@ class Scheduler:
         for skipped in skipped_snapshots:
             self.console.log_status_update(f"SKIPPED snapshot {skipped}\n")
 
-        return not errors
+        for commit_error in commit_buffer.errors:
+            formatted_exception = "".join(format_exception(commit_error))
+            self.console.log_error(f"FAILED committing processed intervals\n{formatted_exception}")
+        if commit_buffer.pending:
+            self.console.log_error(
+                f"{commit_buffer.pending} processed intervals were not committed and will be processed again"
+            )
+
+        return not errors and not commit_buffer.pending
+
+    def _snapshots_for_evaluation(self, snapshot: Snapshot) -> t.Dict[str, Snapshot]:
+        return {
+            **{p_sid.name: self.snapshots[p_sid] for p_sid in snapshot.parents},
+            snapshot.name: snapshot,
+        }
+
+    def _serialize_snapshots(self, snapshots: t.Iterable[Snapshot]) -> t.Dict[SnapshotId, str]:
+        """Returns the serialized snapshots which are sent to a worker process."""
+        serialized = {}
+        for s in snapshots:
+            if s.snapshot_id not in self._serialized_snapshots:
+                self._serialized_snapshots[s.snapshot_id] = s.json()
+            serialized[s.snapshot_id] = self._serialized_snapshots[s.snapshot_id]
+        return serialized
+
+    def _policy(
+        self, estimate_duration: t.Optional[t.Callable[[SchedulingUnit], float]]
+    ) -> t.Optional[SchedulingPolicy[SchedulingUnit]]:
+        if self.scheduling_policy == SchedulingPolicyType.LONGEST_PATH:
+            return LongestPathPolicy(estimate_duration)
+        if self.scheduling_policy == SchedulingPolicyType.OLDEST_INTERVAL:
+            return OldestFirstPolicy(lambda node: to_timestamp(node[1][0]))
+        return None
+
+    def _duration_estimator(
+        self, batches: SnapshotToBatches
+    ) -> t.Optional[t.Callable[[SchedulingUnit], float]]:
+        """Returns a function which estimates the duration of an interval evaluation in seconds based on
+        historical run durations, or None if there are no historical run durations for given batches.
+        """
+        rates = [self.run_durations[s.name] for s in batches if s.name in self.run_durations]
+        if not rates:
+            return None
+
+        default_rate = sum(rates) / len(rates)
+
+        def estimate(node: SchedulingUnit) -> float:
+            snapshot, (start, end) = node
+            rate = self.run_durations.get(snapshot.name, default_rate)
+            return rate * (end - start).total_seconds()
+
+        return estimate
+
+    def _record_run_duration(
+        self, snapshot: Snapshot, start: datetime, end: datetime, duration: float
+    ) -> None:
+        rate = duration / max((end - start).total_seconds(), 1.0)
+        previous_rate = self.run_durations.get(snapshot.name)
+        # Use an exponential moving average to favor recent runs.
+        self.run_durations[snapshot.name] = (
+            rate if previous_rate is None else (previous_rate + rate) / 2
+        )
 
     def _interval_params(
         self,
@@ -247,6 +575,10 @@ class Scheduler:
     def _dag(self, batches: SnapshotToBatches) -> DAG[SchedulingUnit]:
         """Builds a DAG of snapshot intervals to be evaluated.
 
+        If both a snapshot and its parent are incremental by time range, each interval of the
+        snapshot only depends on intervals of the parent that overlap with it in time. Otherwise
+        each interval of the snapshot depends on every interval of the parent.
+
         Args:
             batches: The batches of snapshots and intervals to evaluate.
 
@@ -263,29 +595,97 @@ class Scheduler:
         for snapshot, intervals in batches.items():
             if not intervals:
                 continue
-            upstream_dependencies = [
-                (self.snapshots[p_sid], interval)
-                for p_sid in snapshot.parents
-                if p_sid in self.snapshots
-                for interval in intervals_per_snapshot_version.get(
-                    (
-                        self.snapshots[p_sid].name,
-                        self.snapshots[p_sid].version_get_or_generate(),
-                    ),
-                    [],
+
+            parents = []
+            for p_sid in snapshot.parents:
+                if p_sid not in self.snapshots:
+                    continue
+                parent = self.snapshots[p_sid]
+                parent_intervals = intervals_per_snapshot_version.get(
+                    (parent.name, parent.version_get_or_generate()), []
                 )
-            ]
+                if parent_intervals:
+                    parents.append(
+                        (
+                            parent,
+                            parent_intervals,
+                            [start for start, _ in parent_intervals],
+                            [end for _, end in parent_intervals],
+                        )
+                    )
+
             for i, interval in enumerate(intervals):
-                dag.add((snapshot, interval), upstream_dependencies)
-                if snapshot.is_incremental_by_unique_key_kind:
-                    dag.add(
-                        (snapshot, interval),
-                        [(snapshot, _interval) for _interval in intervals[:i]],
+                upstream_dependencies = [
+                    (parent, parent_interval)
+                    for parent, parent_intervals, starts, ends in parents
+                    for parent_interval in (
+                        _overlapping_intervals(parent_intervals, starts, ends, interval)
+                        if snapshot.is_incremental_by_time_range_kind
+                        and parent.is_incremental_by_time_range_kind
+                        else parent_intervals
                     )
+                ]
+                if snapshot.is_incremental_by_unique_key_kind and i > 0:
+                    # Depending on the previous interval is enough to evaluate intervals sequentially.
+                    upstream_dependencies.append((snapshot, intervals[i - 1]))
+                dag.add((snapshot, interval), upstream_dependencies)
 
         return dag
 
 
+_worker_evaluator: t.Optional[SnapshotEvaluator] = None
+_worker_snapshots: t.Dict[SnapshotId, Snapshot] = {}
+
+
+def _init_worker(connection_config: ConnectionConfig, evaluator_kwargs: t.Dict[str, t.Any]) -> None:
+    """Creates the snapshot evaluator of a worker process.
+
+    Worker processes are created for a single run, so the snapshots they cache are bounded by
+    the snapshots of that run. The evaluator is configured like the one of the scheduler.
+    """
+    global _worker_evaluator, _worker_snapshots
+    _worker_evaluator = SnapshotEvaluator(
+        connection_config.create_engine_adapter(), **evaluator_kwargs
+    )
+    _worker_snapshots = {}
+
+
+def _evaluate_in_worker(
+    snapshot_id: SnapshotId,
+    serialized_snapshots: t.Dict[SnapshotId, str],
+    start: TimeLike,
+    end: TimeLike,
+    latest: TimeLike,
+    is_dev: bool,
+    kwargs: t.Dict[str, t.Any],
+) -> None:
+    """Evaluates and audits a snapshot in a worker process.
+
+    Deserialized snapshots are kept for the lifetime of the worker so that their rendered
+    queries can be reused across intervals.
+    """
+    assert _worker_evaluator
+    snapshots = {}
+    for s_id, payload in serialized_snapshots.items():
+        if s_id not in _worker_snapshots:
+            _worker_snapshots[s_id] = Snapshot.parse_raw(payload)
+        snapshots[s_id.name] = _worker_snapshots[s_id]
+
+    snapshot = snapshots[snapshot_id.name]
+    _worker_evaluator.evaluate(
+        snapshot, start, end, latest, snapshots=snapshots, is_dev=is_dev, **kwargs
+    )
+    _worker_evaluator.audit(
+        snapshot=snapshot,
+        start=start,
+        end=end,
+        latest=latest,
+        snapshots=snapshots,
+        is_dev=is_dev,
+        **kwargs,
+    )
+
+
 def compute_interval_params(
     target: t.Iterable[SnapshotIdLike],
     *,
@@ -400,6 +800,26 @@ def _batched_intervals(params: SnapshotToBatches) -> SnapshotToBatches:
     return batches
 
 
+def _overlapping_intervals(
+    intervals: Batch, starts: t.List[datetime], ends: t.List[datetime], target: Interval
+) -> Batch:
+    """Returns intervals that overlap with the target interval.
+
+    Args:
+        intervals: A list of sorted non-overlapping [start, end) intervals.
+        starts: Start dates of the intervals.
+        ends: End dates of the intervals.
+        target: The target [start, end) interval.
+
+    Returns:
+        A slice of intervals which overlap with the target interval.
+    """
+    target_start, target_end = target
+    low = bisect.bisect_right(ends, target_start)
+    high = bisect.bisect_left(starts, target_end, lo=low)
+    return intervals[low:high]
+
+
 def _resolve_one_snapshot_per_version(
     snapshots: t.Iterable[Snapshot],
 ) -> t.Dict[t.Tuple[str, str], Snapshot]:
@@ -1,5 +1,6 @@
 from sqlmesh.core.snapshot.categorizer import categorize_change
 from sqlmesh.core.snapshot.definition import (
+    FingerprintIndex,
     Intervals,
     QualifiedViewName,
     Snapshot,
@@ -11,6 +12,7 @@ from sqlmesh.core.snapshot.definition import (
     SnapshotInfoLike,
     SnapshotNameVersion,
     SnapshotNameVersionLike,
+    SnapshotSummary,
     SnapshotTableInfo,
     fingerprint_from_model,
     merge_intervals,
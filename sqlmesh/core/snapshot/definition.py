@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import abc
+import bisect
+import math
 import typing as t
 import zlib
 from collections import defaultdict
 from enum import IntEnum
 
-from croniter import croniter_range
 from pydantic import validator
 from sqlglot import exp
 
@@ -69,6 +71,43 @@ class SnapshotFingerprint(PydanticModel, frozen=True):
         )
 
 
+class FingerprintIndex(abc.ABC):
+    """Stores the data and metadata hashes of models across processes, so that they only need to be computed
+    for models that changed.
+
+    Parent hashes are not stored, they are cheaply derived from the hashes of the parents instead.
+    """
+
+    @abc.abstractmethod
+    def get(
+        self, model: Model, physical_schema: str, audits: t.Dict[str, Audit]
+    ) -> t.Optional[t.Tuple[str, str]]:
+        """Returns the data and metadata hashes of the given model or None if they are not stored.
+
+        Args:
+            model: The model.
+            physical_schema: The physical schema of the model's snapshot.
+            audits: Available audits by name.
+        """
+
+    @abc.abstractmethod
+    def put(
+        self,
+        model: Model,
+        physical_schema: str,
+        audits: t.Dict[str, Audit],
+        hashes: t.Tuple[str, str],
+    ) -> None:
+        """Stores the data and metadata hashes of the given model.
+
+        Args:
+            model: The model.
+            physical_schema: The physical schema of the model's snapshot.
+            audits: Available audits by name.
+            hashes: The data and metadata hashes.
+        """
+
+
 class SnapshotId(PydanticModel, frozen=True):
     name: str
     identifier: str
@@ -352,6 +391,7 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
         version: t.Optional[str] = None,
         audits: t.Optional[t.Dict[str, Audit]] = None,
         cache: t.Optional[t.Dict[str, SnapshotFingerprint]] = None,
+        index: t.Optional[FingerprintIndex] = None,
     ) -> Snapshot:
         """Creates a new snapshot for a model.
 
@@ -364,6 +404,7 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
             version: The version that a snapshot is associated with. Usually set during the planning phase.
             audits: Available audits by name.
             cache: Cache of model name to fingerprints.
+            index: Persistent index of the hashes of models.
 
         Returns:
             The newly created snapshot.
@@ -380,6 +421,7 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
                 models=models,
                 audits=audits,
                 cache=cache,
+                index=index,
             ),
             physical_schema=physical_schema,
             model=model,
@@ -392,6 +434,7 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
                         models=models,
                         audits=audits,
                         cache=cache,
+                        index=index,
                     ).to_identifier(),
                 )
                 for name in _parents_from_model(model, models)
@@ -487,27 +530,18 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
         if self.is_embedded_kind:
             return []
 
-        missing = []
-        start_dt, end_dt = (to_datetime(ts) for ts in self._inclusive_exclusive(start, end))
-        dates = tuple(croniter_range(start_dt, end_dt, self.model.normalized_cron()))
-        size = len(dates) - 1
-
-        for i in range(size):
-            current_ts = to_timestamp(dates[i])
-            end_ts = (
-                to_timestamp(dates[i + 1])
-                if i + 1 < size
-                else to_timestamp(self.model.cron_next(current_ts))
-            )
+        missing: Intervals = []
+        start_ts, end_ts = self._inclusive_exclusive(start, end)
 
-            for low, high in self.intervals:
-                if current_ts < low:
-                    missing.append((current_ts, end_ts))
-                    break
-                elif current_ts < high:
-                    break
-            else:
-                missing.append((current_ts, end_ts))
+        # Only cron ticks which fall into ranges that are not covered by stored intervals
+        # need to be enumerated.
+        for gap_start, gap_end in uncovered_intervals(self.intervals, start_ts, end_ts):
+            ticks = self.model.cron_ticks(gap_start, gap_end)
+            if not ticks:
+                continue
+            if ticks[-1] != gap_end:
+                ticks.append(to_timestamp(self.model.cron_next(ticks[-1])))
+            missing.extend(zip(ticks, ticks[1:]))
 
         return missing
 
@@ -566,6 +600,28 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
         """Helper method to get the version or generate it from the fingerprint."""
         return self.version or self.fingerprint.to_version()
 
+    @property
+    def summary(self) -> SnapshotSummary:
+        """Helper method to get the SnapshotSummary from the Snapshot."""
+        self._ensure_version()
+        return SnapshotSummary(
+            name=self.name,
+            fingerprint=self.fingerprint,
+            version=self.version,
+            physical_schema=self.physical_schema,
+            parents=self.parents,
+            previous_versions=self.previous_versions,
+            change_category=self.change_category,
+            is_materialized=self.is_materialized,
+            is_embedded_kind=self.is_embedded_kind,
+            intervals=self.intervals.copy(),
+            dev_intervals=self.dev_intervals.copy(),
+            created_ts=self.created_ts,
+            updated_ts=self.updated_ts,
+            ttl=self.ttl,
+            unpaused_ts=self.unpaused_ts,
+        )
+
     @property
     def table_info(self) -> SnapshotTableInfo:
         """Helper method to get the SnapshotTableInfo from the Snapshot."""
@@ -638,9 +694,78 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
             raise SQLMeshError(f"Snapshot {self.snapshot_id} has not been versioned yet.")
 
 
-SnapshotIdLike = t.Union[SnapshotId, SnapshotTableInfo, Snapshot]
+class SnapshotSummary(PydanticModel, SnapshotInfoMixin):
+    """A lightweight projection of a snapshot which omits the model definition and its audits.
+
+    Summaries are meant for callers that only need identity, versioning, interval or lifecycle
+    information about snapshots and shouldn't pay the cost of parsing models.
+
+    Args:
+        name: The snapshot name which is the same as the model name.
+        fingerprint: A unique hash of the model definition.
+        version: The snapshot version which is used for physical storage.
+        physical_schema: The physical schema that the snapshot is stored in.
+        parents: The list of parent snapshots (upstream dependencies).
+        previous_versions: The previous data versions of the snapshot.
+        change_category: The change category of the snapshot.
+        is_materialized: Whether the snapshot's model is materialized.
+        is_embedded_kind: Whether the snapshot's model is of the embedded kind.
+        intervals: List of [start, end) intervals showing which time ranges a snapshot has data for.
+        dev_intervals: List of [start, end) intervals processed in development mode.
+        created_ts: Epoch millis timestamp when a snapshot was first created.
+        updated_ts: Epoch millis timestamp when a snapshot was last updated.
+        ttl: The time-to-live of a snapshot.
+        unpaused_ts: The timestamp which indicates when this snapshot was unpaused.
+    """
+
+    name: str
+    fingerprint: SnapshotFingerprint
+    version: str
+    physical_schema: str
+    parents: t.Tuple[SnapshotId, ...]
+    previous_versions: t.Tuple[SnapshotDataVersion, ...] = ()
+    change_category: t.Optional[SnapshotChangeCategory]
+    is_materialized: bool
+    is_embedded_kind: bool
+    intervals: Intervals = []
+    dev_intervals: Intervals = []
+    created_ts: int
+    updated_ts: int
+    ttl: str
+    unpaused_ts: t.Optional[int] = None
+
+    @property
+    def table_info(self) -> SnapshotTableInfo:
+        """Helper method to get the SnapshotTableInfo from the summary."""
+        return SnapshotTableInfo(
+            physical_schema=self.physical_schema,
+            name=self.name,
+            fingerprint=self.fingerprint,
+            version=self.version,
+            parents=self.parents,
+            previous_versions=self.previous_versions,
+            change_category=self.change_category,
+            is_materialized=self.is_materialized,
+            is_embedded_kind=self.is_embedded_kind,
+        )
+
+    @property
+    def data_version(self) -> SnapshotDataVersion:
+        return SnapshotDataVersion(
+            fingerprint=self.fingerprint,
+            version=self.version,
+            change_category=self.change_category,
+        )
+
+    @property
+    def is_new_version(self) -> bool:
+        """Returns whether or not this version is new and requires a backfill."""
+        return self.fingerprint.to_version() == self.version
+
+
+SnapshotIdLike = t.Union[SnapshotId, SnapshotTableInfo, Snapshot, SnapshotSummary]
 SnapshotInfoLike = t.Union[SnapshotTableInfo, Snapshot]
-SnapshotNameVersionLike = t.Union[SnapshotNameVersion, SnapshotTableInfo, Snapshot]
+SnapshotNameVersionLike = t.Union[SnapshotNameVersion, SnapshotTableInfo, Snapshot, SnapshotSummary]
 
 
 def table_name(physical_schema: str, name: str, version: str, is_temp: bool = False) -> str:
@@ -655,6 +780,7 @@ def fingerprint_from_model(
     physical_schema: str = "",
     audits: t.Optional[t.Dict[str, Audit]] = None,
     cache: t.Optional[t.Dict[str, SnapshotFingerprint]] = None,
+    index: t.Optional[FingerprintIndex] = None,
 ) -> SnapshotFingerprint:
     """Helper function to generate a fingerprint based on a model's query and environment.
 
@@ -669,11 +795,14 @@ def fingerprint_from_model(
             If no dictionary is passed in the fingerprint will not be dependent on a model's parents.
         audits: Available audits by name.
         cache: Cache of model name to fingerprints.
+        index: Persistent index of the data and metadata hashes of models. Only the hashes of models
+            that are missing from the index are computed.
 
     Returns:
         The fingerprint.
     """
     cache = {} if cache is None else cache
+    audits = audits or {}
 
     if model.name not in cache:
         parents = [
@@ -683,6 +812,7 @@ def fingerprint_from_model(
                 physical_schema=physical_schema,
                 audits=audits,
                 cache=cache,
+                index=index,
             )
             for table in model.depends_on
             if table in models
@@ -694,9 +824,18 @@ def fingerprint_from_model(
             sorted(h for p in parents for h in (p.metadata_hash, p.parent_metadata_hash))
         )
 
+        hashes = index.get(model, physical_schema, audits) if index else None
+        if hashes is None:
+            hashes = (
+                _model_data_hash(model, physical_schema),
+                _model_metadata_hash(model, audits),
+            )
+            if index:
+                index.put(model, physical_schema, audits, hashes)
+
         cache[model.name] = SnapshotFingerprint(
-            data_hash=_model_data_hash(model, physical_schema),
-            metadata_hash=_model_metadata_hash(model, audits or {}),
+            data_hash=hashes[0],
+            metadata_hash=hashes[1],
             parent_data_hash=parent_data_hash,
             parent_metadata_hash=parent_metadata_hash,
         )
@@ -847,6 +986,38 @@ def merge_intervals(intervals: Intervals) -> Intervals:
     return merged
 
 
+def uncovered_intervals(intervals: Intervals, start: int, end: int) -> Intervals:
+    """Find the parts of the [start, end) range which are not covered by the given intervals.
+
+    Args:
+        intervals: A sorted list of non-overlapping exclusive intervals.
+        start: The inclusive start of the range.
+        end: The exclusive end of the range.
+
+    Returns:
+        A sorted list of exclusive intervals which are not covered.
+    """
+    uncovered: Intervals = []
+    current = start
+
+    # Skip intervals which end before the range starts.
+    index = max(bisect.bisect_right(intervals, (start, math.inf)) - 1, 0)
+
+    for low, high in intervals[index:]:
+        if low >= end:
+            break
+        if low > current:
+            uncovered.append((current, low))
+        current = max(current, high)
+        if current >= end:
+            break
+
+    if current < end:
+        uncovered.append((current, end))
+
+    return uncovered
+
+
 def remove_interval(intervals: Intervals, remove_start: int, remove_end: int) -> Intervals:
     """Remove an interval from a list of intervals.
 
@@ -23,7 +23,7 @@ from __future__ import annotations
 
 import logging
 import typing as t
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 
 from sqlglot import exp, select
 from sqlglot.executor import execute
@@ -35,6 +35,7 @@ from sqlmesh.core.snapshot import Snapshot, SnapshotId, SnapshotInfoLike
 from sqlmesh.utils.concurrency import concurrent_apply_to_snapshots
 from sqlmesh.utils.date import TimeLike
 from sqlmesh.utils.errors import AuditError, ConfigError, SQLMeshError
+from sqlmesh.utils.streaming import BufferedStream
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
@@ -53,11 +54,29 @@ class SnapshotEvaluator:
         adapter: The adapter that interfaces with the execution engine.
         ddl_concurrent_task: The number of concurrent tasks used for DDL
             operations (table / view creation, deletion, etc). Default: 1.
+        batch_audits: Whether the results of all audits of a model should be fetched
+            using a single query. Default: True.
+        python_model_buffer_size: The number of outputs a Python model is allowed to produce ahead
+            of their ingestion. If greater than 0 the model runs in a separate producer thread while
+            its outputs are being inserted. Default: 0 (disabled).
+        python_model_chunk_rows: Consecutive DataFrames yielded by a Python model are concatenated
+            until they have at least this many rows before being inserted. Only applies if
+            `python_model_buffer_size` is set. Default: 0 (disabled).
     """
 
-    def __init__(self, adapter: EngineAdapter, ddl_concurrent_tasks: int = 1):
+    def __init__(
+        self,
+        adapter: EngineAdapter,
+        ddl_concurrent_tasks: int = 1,
+        batch_audits: bool = True,
+        python_model_buffer_size: int = 0,
+        python_model_chunk_rows: int = 0,
+    ):
         self.adapter = adapter
         self.ddl_concurrent_tasks = ddl_concurrent_tasks
+        self.batch_audits = batch_audits
+        self.python_model_buffer_size = python_model_buffer_size
+        self.python_model_chunk_rows = python_model_chunk_rows
         self._schema_diff_calculator = SchemaDiffCalculator(self.adapter)
 
     def evaluate(
@@ -157,11 +176,20 @@ class SnapshotEvaluator:
             **kwargs,
         )
 
+        stream: t.Optional[BufferedStream[QueryOrDF]] = None
+        if model.is_python and self.python_model_buffer_size > 0 and not limit:
+            stream = BufferedStream(
+                queries_or_dfs,
+                max_buffered_chunks=self.python_model_buffer_size,
+                min_chunk_rows=self.python_model_chunk_rows,
+            )
+            queries_or_dfs = iter(stream)
+
         with self.adapter.transaction(
             transaction_type=TransactionType.DDL
             if model.kind.is_view or model.kind.is_full
             else TransactionType.DML
-        ):
+        ), closing(queries_or_dfs):
             for index, query_or_df in enumerate(queries_or_dfs):
                 if limit and limit > 0:
                     if isinstance(query_or_df, exp.Select):
@@ -175,6 +203,11 @@ class SnapshotEvaluator:
 
                 apply(query_or_df, index)
 
+            if stream is not None:
+                logger.info(
+                    "Ingested the output of Python model '%s': %s", model.name, stream.stats
+                )
+
             model.run_post_hooks(
                 context=context,
                 start=start,
@@ -311,10 +344,9 @@ class SnapshotEvaluator:
 
         audits_by_name = {**BUILT_IN_AUDITS, **{a.name: a for a in snapshot.audits}}
 
-        results = []
-        for audit_name, audit_args in snapshot.model.audits:
-            audit = audits_by_name[audit_name]
-            query = audit.render_query(
+        audits = [audits_by_name[audit_name] for audit_name, _ in snapshot.model.audits]
+        queries = [
+            audit.render_query(
                 snapshot,
                 start=start,
                 end=end,
@@ -325,9 +357,13 @@ class SnapshotEvaluator:
                 **audit_args,
                 **kwargs,
             )
-            count, *_ = self.adapter.fetchone(select("COUNT(*)").from_(query.subquery()))
+            for audit, (_, audit_args) in zip(audits, snapshot.model.audits)
+        ]
+
+        results = []
+        for audit, query, count in zip(audits, queries, self._count_audit_results(queries)):
             if count and raise_exception:
-                message = f"Audit '{audit_name}' for model '{snapshot.model.name}' failed.\nGot {count} results, expected 0.\n{query}"
+                message = f"Audit '{audit.name}' for model '{snapshot.model.name}' failed.\nGot {count} results, expected 0.\n{query}"
                 if audit.blocking:
                     raise AuditError(message)
                 else:
@@ -335,6 +371,30 @@ class SnapshotEvaluator:
             results.append(AuditResult(audit=audit, count=count, query=query))
         return results
 
+    def _count_audit_results(self, queries: t.List[exp.Subqueryable]) -> t.List[int]:
+        """Counts the records returned by each audit query.
+
+        When audits are batched, all counts are fetched in one round trip by combining them with UNION ALL.
+        """
+        if not self.batch_audits or len(queries) < 2:
+            return [
+                self.adapter.fetchone(select("COUNT(*)").from_(query.subquery()))[0]
+                for query in queries
+            ]
+
+        def count_query(index: int, query: exp.Subqueryable) -> exp.Subqueryable:
+            return select(
+                exp.alias_(exp.Literal.number(index), "audit_index"),
+                exp.alias_(exp.Count(this=exp.Star()), "audit_count"),
+            ).from_(query.subquery(f"_q_{index}"))
+
+        counts_query = count_query(0, queries[0])
+        for index, query in enumerate(queries[1:], start=1):
+            counts_query = counts_query.union(count_query(index, query), distinct=False)
+
+        counts = {int(index): count for index, count in self.adapter.fetchall(counts_query)}
+        return [counts[i] for i in range(len(queries))]
+
     @contextmanager
     def concurrent_context(self) -> t.Generator[None, None, None]:
         try:
@@ -12,7 +12,14 @@ implies, it only allows for read-only operations on snapshots and environment st
 
 The provided `sqlmesh.core.state_sync.EngineAdapterStateSync` leverages an existing engine
 adapter to read and write state to the underlying data store.
+
+# SnapshotCatalog
+
+`sqlmesh.core.state_sync.SnapshotCatalog` keeps a local copy of all snapshots stored by an
+`EngineAdapterStateSync`, so that processes which repeatedly read all snapshots only fetch the ones
+that are new or have changed since the previous read.
 """
 from sqlmesh.core.state_sync.base import StateReader, StateSync, Versions
 from sqlmesh.core.state_sync.common import CommonStateSyncMixin
 from sqlmesh.core.state_sync.engine_adapter import EngineAdapterStateSync
+from sqlmesh.core.state_sync.catalog import SnapshotCatalog
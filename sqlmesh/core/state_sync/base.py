@@ -18,6 +18,7 @@ from sqlmesh.core.snapshot import (
     SnapshotIdLike,
     SnapshotInfoLike,
     SnapshotNameVersionLike,
+    SnapshotSummary,
     SnapshotTableInfo,
 )
 from sqlmesh.utils import major_minor
@@ -63,6 +64,25 @@ class StateReader(abc.ABC):
             A dictionary of snapshot ids to snapshots for ones that could be found.
         """
 
+    def get_snapshot_summaries(
+        self, snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]]
+    ) -> t.Dict[SnapshotId, SnapshotSummary]:
+        """Bulk fetch summaries of snapshots given the corresponding snapshot ids.
+
+        Unlike snapshots, summaries don't include model definitions, which makes them cheaper to fetch.
+
+        Args:
+            snapshot_ids: Iterable of snapshot ids to get. If not provided all
+                available snapshot summaries will be returned.
+
+        Returns:
+            A dictionary of snapshot ids to snapshot summaries for ones that could be found.
+        """
+        return {
+            snapshot_id: snapshot.summary
+            for snapshot_id, snapshot in self.get_snapshots(snapshot_ids).items()
+        }
+
     @abc.abstractmethod
     def get_snapshots_with_same_version(
         self, snapshots: t.Iterable[SnapshotNameVersionLike]
@@ -269,14 +289,14 @@ class StateSync(StateReader, abc.ABC):
         """
 
     @abc.abstractmethod
-    def delete_expired_snapshots(self) -> t.List[Snapshot]:
+    def delete_expired_snapshots(self) -> t.List[SnapshotTableInfo]:
         """Removes expired snapshots.
 
         Expired snapshots are snapshots that have exceeded their time-to-live
         and are no longer in use within an environment.
 
         Returns:
-            The list of removed snapshots.
+            The list of table infos of removed snapshots.
         """
 
     @abc.abstractmethod
@@ -289,7 +309,8 @@ class StateSync(StateReader, abc.ABC):
     ) -> None:
         """Add an interval to a snapshot and sync it to the store.
 
-        Snapshots must be pushed before adding intervals to them.
+        Snapshots must be pushed before adding intervals to them. If a snapshot object is
+        provided, it is not fetched from the store again.
 
         Args:
             snapshot_id: The snapshot like object to add an interval to.
@@ -299,6 +320,20 @@ class StateSync(StateReader, abc.ABC):
                 development mode.
         """
 
+    @abc.abstractmethod
+    def add_intervals(
+        self,
+        snapshot_intervals: t.Iterable[t.Tuple[SnapshotIdLike, TimeLike, TimeLike]],
+        is_dev: bool = False,
+    ) -> None:
+        """Add multiple intervals to snapshots and sync them to the store in a single transaction.
+
+        Args:
+            snapshot_intervals: The (snapshot like object, start, end) tuples of intervals to add.
+            is_dev: Indicates whether the given intervals are being added while in
+                development mode.
+        """
+
     @abc.abstractmethod
     def remove_interval(
         self,
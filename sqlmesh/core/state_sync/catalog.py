@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import typing as t
+from pathlib import Path
+
+from sqlmesh.core.snapshot import Snapshot, SnapshotId
+from sqlmesh.core.state_sync.engine_adapter import EngineAdapterStateSync
+from sqlmesh.utils.cache import version_key
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotCatalog:
+    """Fetches all stored snapshots while keeping a local copy of them on disk.
+
+    Each time the catalog is read, only the change tokens of stored snapshots are fetched (see
+    `EngineAdapterStateSync.get_snapshot_change_tokens`). Snapshots whose tokens didn't change since
+    the previous read are loaded from the local copy and only new or modified snapshots are fetched from
+    the state. This makes reading all snapshots cheap for processes that do it repeatedly, eg. when
+    the Airflow scheduler parses DAG files.
+
+    The local copy is stored in pickle format and is therefore only safe to use in a directory which
+    isn't writable by untrusted parties.
+
+    Args:
+        state_sync: The state sync to fetch snapshots from.
+        path: The directory in which the local copy of snapshots is stored.
+    """
+
+    def __init__(self, state_sync: EngineAdapterStateSync, path: t.Union[str, Path]):
+        self.state_sync = state_sync
+        self._file = Path(path) / f"snapshot_catalog__{state_sync.schema}__{version_key()}.pkl"
+
+    def get_snapshots(self) -> t.Dict[SnapshotId, Snapshot]:
+        """Returns all stored snapshots.
+
+        The result is the same as the one of `StateSync.get_snapshots(None)`.
+
+        Returns:
+            A dictionary of snapshot ids to snapshots.
+        """
+        tokens = self.state_sync.get_snapshot_change_tokens()
+        cached_tokens, cached_snapshots = self._load()
+
+        snapshots = {
+            snapshot_id: cached_snapshots[snapshot_id]
+            for snapshot_id, token in tokens.items()
+            if token and cached_tokens.get(snapshot_id) == token
+        }
+        stale_ids = [snapshot_id for snapshot_id in tokens if snapshot_id not in snapshots]
+        logger.info(
+            "Loaded %s snapshots from the local catalog, fetching %s snapshots",
+            len(snapshots),
+            len(stale_ids),
+        )
+
+        # Intervals recorded since the local copy was stored are merged into unchanged snapshots.
+        self.state_sync.merge_pushed_intervals(snapshots.values())
+        if stale_ids:
+            snapshots.update(self.state_sync.get_snapshots(stale_ids))
+        if stale_ids or len(cached_snapshots) != len(snapshots):
+            self._store(tokens, snapshots)
+
+        return snapshots
+
+    def clear(self) -> None:
+        """Removes the local copy of snapshots."""
+        try:
+            self._file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _load(self) -> t.Tuple[t.Dict[SnapshotId, str], t.Dict[SnapshotId, Snapshot]]:
+        try:
+            with open(self._file, "rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            pass
+        except Exception as ex:
+            logger.warning("Discarding the corrupted snapshot catalog '%s': %s", self._file, ex)
+            self.clear()
+        return {}, {}
+
+    def _store(
+        self, tokens: t.Dict[SnapshotId, str], snapshots: t.Dict[SnapshotId, Snapshot]
+    ) -> None:
+        temp_file = self._file.with_name(f"{self._file.name}.{os.getpid()}.tmp")
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "wb") as file:
+                pickle.dump((tokens, snapshots), file, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_file.replace(self._file)
+        except OSError as ex:
+            logger.warning("Failed to store the snapshot catalog '%s': %s", self._file, ex)
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
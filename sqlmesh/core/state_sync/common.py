@@ -14,6 +14,7 @@ from sqlmesh.core.snapshot import (
     SnapshotIdLike,
     SnapshotInfoLike,
     SnapshotNameVersionLike,
+    SnapshotSummary,
     SnapshotTableInfo,
 )
 from sqlmesh.core.state_sync.base import StateSync
@@ -63,11 +64,7 @@ class CommonStateSyncMixin(StateSync):
         Returns:
             The list of snapshots.
         """
-        return [
-            snapshot
-            for snapshot in self._get_snapshots(lock_for_update=lock_for_update).values()
-            if snapshot.name in names
-        ]
+        return list(self._get_snapshots_by_names(names, lock_for_update=lock_for_update).values())
 
     @transactional()
     def promote(
@@ -130,11 +127,11 @@ class CommonStateSyncMixin(StateSync):
         return table_infos, [existing_table_infos[name] for name in missing_models]
 
     @transactional()
-    def delete_expired_snapshots(self) -> t.List[Snapshot]:
+    def delete_expired_snapshots(self) -> t.List[SnapshotTableInfo]:
         current_time = now()
 
         snapshots_by_version = defaultdict(list)
-        for s in self._get_snapshots().values():
+        for s in self.get_snapshot_summaries(None).values():
             snapshots_by_version[(s.name, s.version)].append(s)
 
         promoted_snapshot_ids = {
@@ -143,7 +140,7 @@ class CommonStateSyncMixin(StateSync):
             for snapshot in environment.snapshots
         }
 
-        def _is_snapshot_used(snapshot: Snapshot) -> bool:
+        def _is_snapshot_used(snapshot: SnapshotSummary) -> bool:
             return (
                 snapshot.snapshot_id in promoted_snapshot_ids
                 or to_datetime(snapshot.ttl, relative_base=to_datetime(snapshot.updated_ts))
@@ -162,9 +159,8 @@ class CommonStateSyncMixin(StateSync):
         if expired_snapshots:
             self.delete_snapshots(expired_snapshots)
 
-        return expired_snapshots
+        return [snapshot.table_info for snapshot in expired_snapshots]
 
-    @transactional()
     def add_interval(
         self,
         snapshot_id: SnapshotIdLike,
@@ -172,15 +168,39 @@ class CommonStateSyncMixin(StateSync):
         end: TimeLike,
         is_dev: bool = False,
     ) -> None:
-        snapshot_id = snapshot_id.snapshot_id
-        stored_snapshots = self._get_snapshots([snapshot_id], lock_for_update=True)
-        if snapshot_id not in stored_snapshots:
-            raise SQLMeshError(f"Snapshot {snapshot_id} was not found")
+        self.add_intervals([(snapshot_id, start, end)], is_dev=is_dev)
 
-        logger.info("Adding interval for snapshot %s", snapshot_id)
-        stored_snapshot = stored_snapshots[snapshot_id]
-        stored_snapshot.add_interval(start, end, is_dev=is_dev)
-        self._update_snapshot(stored_snapshot)
+    @transactional()
+    def add_intervals(
+        self,
+        snapshot_intervals: t.Iterable[t.Tuple[SnapshotIdLike, TimeLike, TimeLike]],
+        is_dev: bool = False,
+    ) -> None:
+        snapshot_intervals = list(snapshot_intervals)
+        snapshots = {
+            snapshot.snapshot_id: snapshot
+            for snapshot, _, _ in snapshot_intervals
+            if isinstance(snapshot, Snapshot)
+        }
+        missing_ids = {
+            snapshot_id.snapshot_id
+            for snapshot_id, _, _ in snapshot_intervals
+            if snapshot_id.snapshot_id not in snapshots
+        }
+        if missing_ids:
+            snapshots.update(self._get_snapshots(missing_ids))
+            for missing_id in missing_ids:
+                if missing_id not in snapshots:
+                    raise SQLMeshError(f"Snapshot {missing_id} was not found")
+
+        intervals = []
+        for snapshot_like, start, end in snapshot_intervals:
+            snapshot = snapshots[snapshot_like.snapshot_id]
+            logger.info("Adding interval for snapshot %s", snapshot.snapshot_id)
+            intervals.append((snapshot, *snapshot._inclusive_exclusive(start, end)))
+
+        if intervals:
+            self._push_intervals(intervals, is_dev=is_dev)
 
     @transactional()
     def remove_interval(
@@ -284,6 +304,17 @@ class CommonStateSyncMixin(StateSync):
             snapshot: The target snapshot.
         """
 
+    @abc.abstractmethod
+    def _push_intervals(
+        self, intervals: t.Iterable[t.Tuple[Snapshot, int, int]], is_dev: bool = False
+    ) -> None:
+        """Records processed intervals of target snapshots.
+
+        Args:
+            intervals: The (snapshot, inclusive start timestamp, exclusive end timestamp) tuples.
+            is_dev: Indicates whether the intervals were processed in development mode.
+        """
+
     @abc.abstractmethod
     def _get_snapshots(
         self,
@@ -300,6 +331,20 @@ class CommonStateSyncMixin(StateSync):
             A dictionary of snapshot ids to snapshots for ones that could be found.
         """
 
+    @abc.abstractmethod
+    def _get_snapshots_by_names(
+        self, names: t.Iterable[str], lock_for_update: bool = False
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        """Fetches all snapshots of the given models.
+
+        Args:
+            names: The names of models whose snapshots should be fetched.
+            lock_for_update: Lock the snapshot rows for future update
+
+        Returns:
+            A dictionary of snapshot ids to snapshots.
+        """
+
     @abc.abstractmethod
     def _get_snapshots_with_same_version(
         self,
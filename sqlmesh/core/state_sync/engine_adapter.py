@@ -16,9 +16,11 @@ adapter to read and write state to the underlying data store.
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import json
 import logging
 import typing as t
+from collections import defaultdict
 from copy import deepcopy
 
 from sqlglot import __version__ as SQLGLOT_VERSION
@@ -30,22 +32,30 @@ from sqlmesh.core.engine_adapter import EngineAdapter, TransactionType
 from sqlmesh.core.environment import Environment
 from sqlmesh.core.model import Model
 from sqlmesh.core.snapshot import (
+    Intervals,
     Snapshot,
     SnapshotDataVersion,
     SnapshotFingerprint,
     SnapshotId,
     SnapshotIdLike,
+    SnapshotInfoLike,
     SnapshotNameVersionLike,
+    SnapshotSummary,
+    SnapshotTableInfo,
     fingerprint_from_model,
+    merge_intervals,
 )
 from sqlmesh.core.snapshot.definition import _parents_from_model
 from sqlmesh.core.state_sync.base import SCHEMA_VERSION, StateSync, Versions
 from sqlmesh.core.state_sync.common import CommonStateSyncMixin, transactional
-from sqlmesh.utils.date import now_timestamp
+from sqlmesh.utils.date import TimeLike, now_timestamp
 from sqlmesh.utils.errors import SQLMeshError
 
 logger = logging.getLogger(__name__)
 
+# The start, end, dev flag, and creation timestamp of an interval recorded in the intervals table.
+RecordedInterval = t.Tuple[int, int, bool, int]
+
 
 class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
     """Manages state of models and snapshot with an existing engine adapter.
@@ -53,11 +63,18 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
     This state sync is convenient to use because it requires no additional setup.
     You can reuse the same engine/warehouse that your data is stored in.
 
+    Processed intervals are appended to a dedicated intervals table instead of rewriting
+    the snapshot payload each time. They are merged into snapshots when those are fetched and
+    are folded into the snapshot payloads lazily, when snapshots are updated or expired
+    snapshots are cleaned up.
+
     Args:
         engine_adapter: The EngineAdapter to use to store and fetch snapshots.
         schema: The schema to store state metadata in.
     """
 
+    SNAPSHOT_BATCH_SIZE = 1000
+
     def __init__(
         self,
         engine_adapter: EngineAdapter,
@@ -68,6 +85,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         self.snapshots_table = f"{schema}._snapshots"
         self.environments_table = f"{schema}._environments"
         self.versions_table = f"{schema}._versions"
+        self.intervals_table = f"{schema}._intervals"
 
     @property
     def snapshot_columns_to_types(self) -> t.Dict[str, exp.DataType]:
@@ -76,6 +94,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             "identifier": exp.DataType.build("text"),
             "version": exp.DataType.build("text"),
             "snapshot": exp.DataType.build("text"),
+            "summary": exp.DataType.build("text"),
         }
 
     @property
@@ -97,6 +116,18 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             "sqlglot_version": exp.DataType.build("text"),
         }
 
+    @property
+    def interval_columns_to_types(self) -> t.Dict[str, exp.DataType]:
+        return {
+            "name": exp.DataType.build("text"),
+            "identifier": exp.DataType.build("text"),
+            "version": exp.DataType.build("text"),
+            "start_ts": exp.DataType.build("bigint"),
+            "end_ts": exp.DataType.build("bigint"),
+            "is_dev": exp.DataType.build("boolean"),
+            "created_ts": exp.DataType.build("bigint"),
+        }
+
     @transactional()
     def push_snapshots(self, snapshots: t.Iterable[Snapshot]) -> None:
         """Pushes snapshots to the state store, merging them with existing ones.
@@ -141,6 +172,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
                             snapshot.identifier,
                             snapshot.version,
                             snapshot.json(),
+                            snapshot.summary.json(),
                         )
                         for snapshot in snapshots
                     ],
@@ -191,17 +223,69 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         return environments
 
     def delete_snapshots(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> None:
-        self.engine_adapter.delete_from(
-            self.snapshots_table, where=self._snapshot_id_filter(snapshot_ids)
+        for where in self._snapshot_id_filter(snapshot_ids):
+            self.engine_adapter.delete_from(self.snapshots_table, where=where)
+            self.engine_adapter.delete_from(self.intervals_table, where=where)
+
+    @transactional()
+    def delete_expired_snapshots(self) -> t.List[SnapshotTableInfo]:
+        expired_snapshots = super().delete_expired_snapshots()
+        self.compact_intervals()
+        return expired_snapshots
+
+    @transactional()
+    def remove_interval(
+        self,
+        snapshots: t.Iterable[SnapshotInfoLike],
+        start: TimeLike,
+        end: TimeLike,
+        all_snapshots: t.Optional[t.Iterable[Snapshot]] = None,
+    ) -> None:
+        all_snapshots = list(
+            all_snapshots
+            or self._get_snapshots_with_same_version(
+                snapshots, lock_for_update=True, merge_intervals=False
+            )
         )
+        # The removal is applied to the snapshot payloads, so the recorded intervals are folded into
+        # them first and must not be merged back in afterwards.
+        merged_intervals = self._merge_pushed_intervals(all_snapshots, all_snapshots)
+        super().remove_interval(snapshots, start, end, all_snapshots=all_snapshots)
+        self._delete_merged_intervals(merged_intervals)
+
+    @transactional()
+    def compact_intervals(self) -> None:
+        """Folds the intervals recorded in the intervals table into the snapshot payloads.
+
+        Only the recorded intervals which have been folded are deleted. Intervals recorded after they
+        have been read are left in place and folded by the next compaction.
+        """
+        snapshot_ids = [
+            SnapshotId(name=name, identifier=identifier)
+            for name, identifier in self.engine_adapter.fetchall(
+                exp.select("name", "identifier").distinct().from_(self.intervals_table)
+            )
+        ]
+        if not snapshot_ids:
+            return
+
+        self.get_versions()
+        snapshots = self._fetch_snapshots(
+            self._snapshot_id_filter(snapshot_ids), lock_for_update=True, merge_intervals=False
+        )
+        # Intervals of snapshots which no longer exist are read as well so that they are cleaned up.
+        merged_intervals = self._merge_pushed_intervals(snapshots.values(), snapshot_ids)
+        for snapshot_id, snapshot in snapshots.items():
+            if snapshot_id in merged_intervals:
+                self._update_snapshot(snapshot)
+        self._delete_merged_intervals(merged_intervals)
 
     def snapshots_exist(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> t.Set[SnapshotId]:
         return {
             SnapshotId(name=name, identifier=identifier)
+            for where in self._snapshot_id_filter(snapshot_ids)
             for name, identifier in self.engine_adapter.fetchall(
-                exp.select("name", "identifier")
-                .from_(self.snapshots_table)
-                .where(self._snapshot_id_filter(snapshot_ids))
+                exp.select("name", "identifier").from_(self.snapshots_table).where(where)
             )
         }
 
@@ -210,6 +294,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         self.engine_adapter.drop_table(self.snapshots_table)
         self.engine_adapter.drop_table(self.environments_table)
         self.engine_adapter.drop_table(self.versions_table)
+        self.engine_adapter.drop_table(self.intervals_table)
         self.migrate()
 
     def _update_environment(self, environment: Environment) -> None:
@@ -246,11 +331,123 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
     def _update_snapshot(self, snapshot: Snapshot) -> None:
         self.engine_adapter.update_table(
             self.snapshots_table,
-            {"snapshot": snapshot.json()},
-            where=self._snapshot_id_filter([snapshot.snapshot_id]),
+            {"snapshot": snapshot.json(), "summary": snapshot.summary.json()},
+            where=next(self._snapshot_id_filter([snapshot.snapshot_id])),
             contains_json=True,
         )
 
+    def _push_intervals(
+        self, intervals: t.Iterable[t.Tuple[Snapshot, int, int]], is_dev: bool = False
+    ) -> None:
+        created_ts = now_timestamp()
+        self.engine_adapter.insert_append(
+            self.intervals_table,
+            next(
+                select_from_values(
+                    [
+                        (
+                            snapshot.name,
+                            snapshot.identifier,
+                            snapshot.version,
+                            start_ts,
+                            end_ts,
+                            is_dev,
+                            created_ts,
+                        )
+                        for snapshot, start_ts, end_ts in intervals
+                    ],
+                    columns_to_types=self.interval_columns_to_types,
+                )
+            ),
+            columns_to_types=self.interval_columns_to_types,
+        )
+
+    def _merge_pushed_intervals(
+        self,
+        snapshots: t.Iterable[t.Union[Snapshot, SnapshotSummary]],
+        snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]] = None,
+    ) -> t.Dict[SnapshotId, t.Set[RecordedInterval]]:
+        """Merges the intervals recorded in the intervals table into the given snapshots.
+
+        Args:
+            snapshots: The snapshots to merge intervals into.
+            snapshot_ids: The IDs to filter recorded intervals by. All recorded intervals are
+                fetched if not provided.
+
+        Returns:
+            The recorded interval rows that have been read for each snapshot ID, which can be passed
+            to `_delete_merged_intervals`.
+        """
+        snapshots_by_id = {snapshot.snapshot_id: snapshot for snapshot in snapshots}
+        if not snapshots_by_id and snapshot_ids is None:
+            return {}
+
+        intervals: t.Dict[SnapshotId, Intervals] = defaultdict(list)
+        dev_intervals: t.Dict[SnapshotId, Intervals] = defaultdict(list)
+
+        rows = (
+            row
+            for where in self._optional_snapshot_id_filter(snapshot_ids)
+            for row in self.engine_adapter.fetchall(
+                exp.select("name", "identifier", "start_ts", "end_ts", "is_dev", "created_ts")
+                .from_(self.intervals_table)
+                .where(where)
+            )
+        )
+
+        merged_intervals: t.Dict[SnapshotId, t.Set[RecordedInterval]] = defaultdict(set)
+        for name, identifier, start_ts, end_ts, is_dev, created_ts in rows:
+            snapshot_id = SnapshotId(name=name, identifier=identifier)
+            merged_intervals[snapshot_id].add((start_ts, end_ts, bool(is_dev), created_ts))
+            snapshot = snapshots_by_id.get(snapshot_id)
+            if not snapshot:
+                continue
+            target = dev_intervals if snapshot.is_temporary_table(is_dev) else intervals
+            target[snapshot_id].append((start_ts, end_ts))
+
+        for snapshot_id, snapshot_intervals in intervals.items():
+            snapshot = snapshots_by_id[snapshot_id]
+            snapshot.intervals = merge_intervals([*snapshot.intervals, *snapshot_intervals])
+
+        for snapshot_id, snapshot_intervals in dev_intervals.items():
+            snapshot = snapshots_by_id[snapshot_id]
+            snapshot.dev_intervals = merge_intervals([*snapshot.dev_intervals, *snapshot_intervals])
+
+        return dict(merged_intervals)
+
+    def _delete_merged_intervals(
+        self, merged_intervals: t.Dict[SnapshotId, t.Set[RecordedInterval]]
+    ) -> None:
+        """Deletes recorded intervals which have been merged into snapshot payloads.
+
+        Only the rows that have been read are deleted, matched on all of their columns, so intervals
+        recorded concurrently are kept regardless of their creation timestamps. An identical row
+        recorded concurrently is deleted as well, which is safe since it has already been merged.
+
+        Args:
+            merged_intervals: The recorded interval rows that have been merged for each snapshot ID,
+                as returned by `_merge_pushed_intervals`.
+        """
+        conditions = [
+            exp.and_(
+                exp.EQ(this=exp.to_column("name"), expression=exp.Literal.string(snapshot_id.name)),
+                exp.EQ(
+                    this=exp.to_column("identifier"),
+                    expression=exp.Literal.string(snapshot_id.identifier),
+                ),
+                exp.EQ(this=exp.to_column("start_ts"), expression=exp.Literal.number(start_ts)),
+                exp.EQ(this=exp.to_column("end_ts"), expression=exp.Literal.number(end_ts)),
+                exp.EQ(this=exp.to_column("is_dev"), expression=exp.convert(is_dev)),
+                exp.EQ(this=exp.to_column("created_ts"), expression=exp.Literal.number(created_ts)),
+            )
+            for snapshot_id, rows in merged_intervals.items()
+            for start_ts, end_ts, is_dev, created_ts in rows
+        ]
+        for i in range(0, len(conditions), self.SNAPSHOT_BATCH_SIZE):
+            self.engine_adapter.delete_from(
+                self.intervals_table, where=exp.or_(*conditions[i : i + self.SNAPSHOT_BATCH_SIZE])
+            )
+
     def get_environments(self) -> t.List[Environment]:
         """Fetches all environments.
 
@@ -299,18 +496,102 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         if validate_versions:
             self.get_versions()
 
-        query = (
-            exp.select("snapshot")
-            .from_(self.snapshots_table)
-            .where(None if snapshot_ids is None else self._snapshot_id_filter(snapshot_ids))
+        return self._fetch_snapshots(
+            self._optional_snapshot_id_filter(snapshot_ids),
+            lock_for_update=lock_for_update,
+            is_filtered=snapshot_ids is not None,
         )
-        if lock_for_update:
-            query = query.lock(copy=False)
 
+    def get_snapshot_change_tokens(self) -> t.Dict[SnapshotId, str]:
+        """Returns a token for each stored snapshot which changes whenever the stored snapshot changes.
+
+        Tokens are derived from snapshot summaries, which are always updated together with snapshots, so
+        that changes can be detected without fetching snapshots. Intervals which have been recorded
+        but not yet merged into snapshots are not reflected by tokens.
+
+        Returns:
+            A dictionary of snapshot ids to tokens.
+        """
+        self.get_versions()
+
+        tokens: t.Dict[SnapshotId, str] = {}
+        for name, identifier, summary in self.engine_adapter.fetchall(
+            exp.select("name", "identifier", "summary").from_(self.snapshots_table)
+        ):
+            snapshot_id = SnapshotId(name=name, identifier=identifier)
+            # Duplicates and legacy rows without summaries get an empty token to force a fetch.
+            tokens[snapshot_id] = (
+                hashlib.md5(summary.encode("utf-8")).hexdigest()
+                if summary and snapshot_id not in tokens
+                else ""
+            )
+        return tokens
+
+    def merge_pushed_intervals(self, snapshots: t.Iterable[Snapshot]) -> None:
+        """Merges all intervals which have been recorded but not yet merged into snapshots into the given
+        snapshots.
+
+        Args:
+            snapshots: The snapshots to merge intervals into.
+        """
+        self._merge_pushed_intervals(snapshots)
+
+    def get_snapshot_summaries(
+        self, snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]]
+    ) -> t.Dict[SnapshotId, SnapshotSummary]:
+        self.get_versions()
+
+        summaries: t.Dict[SnapshotId, SnapshotSummary] = {}
+
+        for where in self._optional_snapshot_id_filter(snapshot_ids):
+            for row in self.engine_adapter.fetchall(
+                exp.select("summary").from_(self.snapshots_table).where(where)
+            ):
+                summary = SnapshotSummary.parse_raw(row[0])
+                other = summaries.get(summary.snapshot_id)
+                if not other or summary.updated_ts > other.updated_ts:
+                    summaries[summary.snapshot_id] = summary
+
+        self._merge_pushed_intervals(
+            summaries.values(), summaries.values() if snapshot_ids is not None else None
+        )
+        return summaries
+
+    def _get_snapshots_by_names(
+        self, names: t.Iterable[str], lock_for_update: bool = False
+    ) -> t.Dict[SnapshotId, Snapshot]:
+        """Fetches all snapshots of the given models.
+
+        Args:
+            names: The names of models whose snapshots should be fetched.
+            lock_for_update: Lock the snapshot rows for future update
+
+        Returns:
+            A dictionary of snapshot ids to snapshots.
+        """
+        self.get_versions()
+        return self._fetch_snapshots(self._name_in_filter(names), lock_for_update=lock_for_update)
+
+    def _fetch_snapshots(
+        self,
+        where_filters: t.Iterable[t.Optional[exp.Condition]],
+        lock_for_update: bool = False,
+        is_filtered: bool = True,
+        merge_intervals: bool = True,
+    ) -> t.Dict[SnapshotId, Snapshot]:
         snapshots: t.Dict[SnapshotId, Snapshot] = {}
         duplicates: t.Dict[SnapshotId, Snapshot] = {}
 
-        for row in self.engine_adapter.fetchall(query, ignore_unsupported_errors=True):
+        rows = (
+            row
+            for where in where_filters
+            for row in self.engine_adapter.fetchall(
+                self._snapshots_query(where, lock_for_update=lock_for_update),
+                ignore_unsupported_errors=True,
+            )
+        )
+
+        for row in rows:
             snapshot = Snapshot.parse_raw(row[0])
             snapshot_id = snapshot.snapshot_id
             if snapshot_id in snapshots:
@@ -322,6 +603,11 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
             else:
                 snapshots[snapshot_id] = snapshot
 
+        if merge_intervals:
+            self._merge_pushed_intervals(
+                snapshots.values(), snapshots.values() if is_filtered else None
+            )
+
         if duplicates:
             self._push_snapshots(duplicates.values(), overwrite=True)
             logger.error("Found duplicate snapshots in the state store.")
@@ -332,6 +618,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         self,
         snapshots: t.Iterable[SnapshotNameVersionLike],
         lock_for_update: bool = False,
+        merge_intervals: bool = True,
     ) -> t.List[Snapshot]:
         """Fetches all snapshots that share the same version as the snapshots.
 
@@ -340,6 +627,7 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         Args:
             snapshots: The collection of target name / version pairs.
             lock_for_update: Lock the snapshot rows for future update
+            merge_intervals: Whether to merge recorded intervals into the fetched snapshots.
 
         Returns:
             The list of Snapshot objects.
@@ -347,16 +635,25 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         if not snapshots:
             return []
 
-        query = (
-            exp.select("snapshot")
-            .from_(self.snapshots_table)
-            .where(self._snapshot_name_version_filter(snapshots))
-        )
-        if lock_for_update:
-            query = query.lock(copy=False)
+        stored_snapshots = [
+            Snapshot(**json.loads(row[0]))
+            for where in self._snapshot_name_version_filter(snapshots)
+            for row in self.engine_adapter.fetchall(
+                self._snapshots_query(where, lock_for_update=lock_for_update),
+                ignore_unsupported_errors=True,
+            )
+        ]
+        if merge_intervals:
+            self._merge_pushed_intervals(stored_snapshots, stored_snapshots)
+        return stored_snapshots
 
-        snapshot_rows = self.engine_adapter.fetchall(query, ignore_unsupported_errors=True)
-        return [Snapshot(**json.loads(row[0])) for row in snapshot_rows]
+    def _snapshots_query(
+        self, where: t.Optional[exp.Expression] = None, lock_for_update: bool = False
+    ) -> exp.Select:
+        query = exp.select("snapshot").from_(self.snapshots_table).where(where)
+        if lock_for_update:
+            return query.lock(copy=False)
+        return query
 
     def _get_versions(self, lock_for_update: bool = False) -> Versions:
         if not self.engine_adapter.table_exists(self.versions_table):
@@ -405,6 +702,15 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
         all_snapshots = self._get_snapshots(lock_for_update=True, validate_versions=False)
         environments = self.get_environments()
 
+        for name, identifier in self.engine_adapter.fetchall(
+            exp.select("name", "identifier")
+            .from_(self.snapshots_table)
+            .where(exp.Is(this=exp.to_column("summary"), expression=exp.Null()))
+        ):
+            snapshot_id = SnapshotId(name=name, identifier=identifier)
+            if snapshot_id in all_snapshots:
+                self._update_snapshot(all_snapshots[snapshot_id])
+
         snapshot_mapping = {}
         cache: t.Dict[SnapshotId, t.Dict] = {}
 
@@ -526,48 +832,90 @@ class EngineAdapterStateSync(CommonStateSyncMixin, StateSync):
 
     def _snapshot_id_filter(
         self, snapshot_ids: t.Iterable[SnapshotIdLike]
-    ) -> t.Union[exp.Or, exp.Boolean]:
-        if not snapshot_ids:
-            return exp.FALSE
-
-        return exp.or_(
-            *(
-                exp.and_(
-                    exp.EQ(
-                        this=exp.to_column("name"),
-                        expression=exp.Literal.string(snapshot_id.name),
-                    ),
-                    exp.EQ(
-                        this=exp.to_column("identifier"),
-                        expression=exp.Literal.string(snapshot_id.identifier),
-                    ),
-                )
-                for snapshot_id in snapshot_ids
-            )
+    ) -> t.Iterator[exp.Condition]:
+        return self._name_filter(
+            ((snapshot_id.name, snapshot_id.identifier) for snapshot_id in snapshot_ids),
+            "identifier",
         )
 
+    def _optional_snapshot_id_filter(
+        self, snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]]
+    ) -> t.Iterator[t.Optional[exp.Condition]]:
+        if snapshot_ids is None:
+            return iter([None])
+        return self._snapshot_id_filter(snapshot_ids)
+
     def _snapshot_name_version_filter(
         self, snapshot_name_versions: t.Iterable[SnapshotNameVersionLike]
-    ) -> t.Union[exp.Or, exp.Boolean]:
-        if not snapshot_name_versions:
-            return exp.FALSE
-
-        return exp.or_(
-            *(
-                exp.and_(
-                    exp.EQ(
-                        this=exp.to_column("name"),
-                        expression=exp.Literal.string(snapshot_name_version.name),
-                    ),
-                    exp.EQ(
-                        this=exp.to_column("version"),
-                        expression=exp.Literal.string(snapshot_name_version.version),
-                    ),
-                )
+    ) -> t.Iterator[exp.Condition]:
+        return self._name_filter(
+            (
+                (snapshot_name_version.name, snapshot_name_version.version)
                 for snapshot_name_version in snapshot_name_versions
-            )
+            ),
+            "version",
         )
 
+    def _name_in_filter(self, names: t.Iterable[str]) -> t.Iterator[exp.Condition]:
+        unique_names = list(dict.fromkeys(names))
+        for i in range(0, len(unique_names), self.SNAPSHOT_BATCH_SIZE):
+            yield exp.In(
+                this=exp.to_column("name"),
+                expressions=[
+                    exp.Literal.string(name)
+                    for name in unique_names[i : i + self.SNAPSHOT_BATCH_SIZE]
+                ],
+            )
+
+    def _name_filter(
+        self, name_values: t.Iterable[t.Tuple[str, t.Optional[str]]], column: str
+    ) -> t.Iterator[exp.Condition]:
+        """Yields filters matching rows with the given (name, value of the column) pairs.
+
+        The pairs are grouped by name into `name = ... AND column IN (...)` conditions and each
+        yielded filter matches at most SNAPSHOT_BATCH_SIZE pairs, so that the size of a single
+        statement stays bounded no matter how many snapshots are targeted.
+
+        Args:
+            name_values: The (name, value) pairs to match.
+            column: The name of the column which is matched against the values.
+
+        Returns:
+            A generator of filter expressions. Nothing is yielded if there are no pairs to match.
+        """
+        values_by_name: t.Dict[str, t.Dict[t.Optional[str], None]] = defaultdict(dict)
+        for name, value in name_values:
+            values_by_name[name][value] = None
+
+        conditions: t.List[exp.Condition] = []
+        batch_size = 0
+
+        for name, values in values_by_name.items():
+            remaining_values = list(values)
+            while remaining_values:
+                chunk_size = self.SNAPSHOT_BATCH_SIZE - batch_size
+                chunk, remaining_values = (
+                    remaining_values[:chunk_size],
+                    remaining_values[chunk_size:],
+                )
+                conditions.append(
+                    exp.and_(
+                        exp.EQ(this=exp.to_column("name"), expression=exp.Literal.string(name)),
+                        exp.In(
+                            this=exp.to_column(column),
+                            expressions=[exp.Literal.string(value) for value in chunk],
+                        ),
+                    )
+                )
+                batch_size += len(chunk)
+                if batch_size >= self.SNAPSHOT_BATCH_SIZE:
+                    yield exp.or_(*conditions)
+                    conditions = []
+                    batch_size = 0
+
+        if conditions:
+            yield exp.or_(*conditions)
+
     @contextlib.contextmanager
     def _transaction(self, transaction_type: TransactionType) -> t.Generator[None, None, None]:
         with self.engine_adapter.transaction(transaction_type=transaction_type):
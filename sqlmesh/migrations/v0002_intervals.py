@@ -0,0 +1,26 @@
+"""Add a dedicated table for snapshot intervals."""
+from sqlglot import exp
+
+
+def migrate(state_sync):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+
+    intervals_table = f"{schema}._intervals"
+
+    engine_adapter.create_state_table(
+        intervals_table,
+        {
+            "name": exp.DataType.build("text"),
+            "identifier": exp.DataType.build("text"),
+            "version": exp.DataType.build("text"),
+            "start_ts": exp.DataType.build("bigint"),
+            "end_ts": exp.DataType.build("bigint"),
+            "is_dev": exp.DataType.build("boolean"),
+            "created_ts": exp.DataType.build("bigint"),
+        },
+    )
+
+    engine_adapter.create_index(
+        intervals_table, "intervals_name_identifier_idx", ("name", "identifier")
+    )
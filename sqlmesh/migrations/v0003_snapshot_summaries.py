@@ -0,0 +1,12 @@
+"""Add a column with lightweight snapshot summaries.
+
+The column is populated for existing snapshots when rows are migrated.
+"""
+
+
+def migrate(state_sync):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    snapshots_table = f"{state_sync.schema}._snapshots"
+
+    if "summary" not in engine_adapter.columns(snapshots_table):
+        engine_adapter.alter_table(snapshots_table, {"summary": "text"}, [])
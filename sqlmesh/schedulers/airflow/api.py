@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import json
 import typing as t
 from functools import wraps
@@ -10,7 +11,12 @@ from airflow.www.app import csrf
 from flask import Blueprint, Response, jsonify, make_response, request
 
 from sqlmesh.core import constants as c
-from sqlmesh.core.snapshot import SnapshotId, SnapshotNameVersion
+from sqlmesh.core.snapshot import (
+    Snapshot,
+    SnapshotId,
+    SnapshotNameVersion,
+    SnapshotSummary,
+)
 from sqlmesh.schedulers.airflow import common, util
 from sqlmesh.schedulers.airflow.plan import create_plan_dag_spec
 from sqlmesh.utils.pydantic import PydanticModel
@@ -36,9 +42,9 @@ def check_authentication(func: t.Callable) -> t.Callable:
 @check_authentication
 def apply_plan() -> Response:
     try:
-        plan = common.PlanApplicationRequest.parse_obj(request.json or {})
+        plan = common.PlanApplicationRequest.parse_obj(_request_json())
         with util.scoped_state_sync() as state_sync:
-            spec = create_plan_dag_spec(plan, state_sync)
+            spec = create_plan_dag_spec(plan, state_sync, util.snapshot_catalog(state_sync))
     except Exception as ex:
         return _error(str(ex))
 
@@ -89,6 +95,45 @@ def get_snapshots() -> Response:
         return _success(common.SnapshotsResponse(snapshots=snapshots))
 
 
+@sqlmesh_api_v1.post("/snapshots/search")
+@csrf.exempt
+@check_authentication
+def search_snapshots() -> Response:
+    try:
+        search = common.SnapshotSearchRequest.parse_obj(_request_json())
+    except Exception as ex:
+        return _error(str(ex))
+
+    with util.scoped_state_sync() as state_sync:
+        found: t.Iterable[t.Union[Snapshot, SnapshotSummary]]
+        next_offset: t.Optional[int] = None
+        if search.versions is not None:
+            versions, next_offset = _page(search.versions, search)
+            found = state_sync.get_snapshots_with_same_version(versions)
+        else:
+            snapshot_ids = search.ids
+            summaries = None
+            if snapshot_ids is None and (search.offset or search.limit is not None):
+                # Pages over all snapshots are taken from a stable ordering of their ids.
+                summaries = state_sync.get_snapshot_summaries(None)
+                snapshot_ids = sorted(
+                    summaries, key=lambda snapshot_id: (snapshot_id.name, snapshot_id.identifier)
+                )
+            if snapshot_ids is not None:
+                snapshot_ids, next_offset = _page(snapshot_ids, search)
+
+            if search.projection == common.SnapshotProjection.FULL:
+                found = state_sync.get_snapshots(snapshot_ids).values()
+            elif summaries is not None:
+                found = [summaries[snapshot_id] for snapshot_id in snapshot_ids or []]
+            else:
+                found = state_sync.get_snapshot_summaries(snapshot_ids).values()
+
+    return _success(
+        common.SnapshotSearchResponse.from_snapshots(found, search.projection, next_offset)
+    )
+
+
 @sqlmesh_api_v1.get("/versions")
 @csrf.exempt
 @check_authentication
@@ -100,11 +145,24 @@ def get_versions() -> Response:
 
 
 T = t.TypeVar("T", bound=PydanticModel)
+K = t.TypeVar("K")
 
 
 def _success(data: T, status_code: int = 200) -> Response:
-    response = make_response(data.json(), status_code)
+    body = data.json().encode("utf-8")
+    encoding = _response_encoding(len(body))
+    if encoding == "zstd":
+        import zstandard
+
+        body = zstandard.ZstdCompressor().compress(body)
+    elif encoding == "gzip":
+        body = gzip.compress(body, compresslevel=common.GZIP_COMPRESS_LEVEL)
+
+    response = make_response(body, status_code)
     response.mimetype = "application/json"
+    response.vary.add("Accept-Encoding")
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
     return response
 
 
@@ -112,6 +170,38 @@ def _error(message: str, status_code: int = 400) -> Response:
     return make_response(jsonify(message=message), status_code)
 
 
+def _response_encoding(size_bytes: int) -> t.Optional[str]:
+    if size_bytes < common.COMPRESSION_MIN_SIZE_BYTES:
+        return None
+
+    supported_encodings = ["gzip"]
+    try:
+        import zstandard  # noqa
+
+        supported_encodings.insert(0, "zstd")
+    except ImportError:
+        pass
+    return request.accept_encodings.best_match(supported_encodings)
+
+
+def _request_json() -> t.Any:
+    encoding = request.headers.get("Content-Encoding", "").lower()
+    if encoding == "gzip":
+        return json.loads(gzip.decompress(request.get_data()))
+    if encoding:
+        raise ValueError(f"Unsupported content encoding '{encoding}'")
+    return request.json or {}
+
+
+def _page(
+    keys: t.List[K], search: common.SnapshotSearchRequest
+) -> t.Tuple[t.List[K], t.Optional[int]]:
+    if search.limit is None:
+        return keys[search.offset :], None
+    end = search.offset + search.limit
+    return keys[search.offset : end], end if end < len(keys) else None
+
+
 def _snapshot_ids_from_request() -> t.Optional[t.List[SnapshotId]]:
     if "ids" not in request.args:
         return None
@@ -1,3 +1,4 @@
+import gzip
 import json
 import time
 import typing as t
@@ -10,7 +11,12 @@ from requests.models import Response
 from sqlmesh.core._typing import NotificationTarget
 from sqlmesh.core.console import Console
 from sqlmesh.core.environment import Environment
-from sqlmesh.core.snapshot import Snapshot, SnapshotId, SnapshotNameVersion
+from sqlmesh.core.snapshot import (
+    Snapshot,
+    SnapshotId,
+    SnapshotNameVersion,
+    SnapshotSummary,
+)
 from sqlmesh.core.state_sync import Versions
 from sqlmesh.core.user import User
 from sqlmesh.schedulers.airflow import common
@@ -28,6 +34,7 @@ DAG_RUN_PATH_TEMPLATE = "api/v1/dags/{}/dagRuns"
 PLANS_PATH = f"{common.SQLMESH_API_BASE_PATH}/plans"
 ENVIRONMENTS_PATH = f"{common.SQLMESH_API_BASE_PATH}/environments"
 SNAPSHOTS_PATH = f"{common.SQLMESH_API_BASE_PATH}/snapshots"
+SNAPSHOTS_SEARCH_PATH = f"{SNAPSHOTS_PATH}/search"
 VERSIONS_PATH = f"{common.SQLMESH_API_BASE_PATH}/versions"
 
 
@@ -41,6 +48,8 @@ class AirflowClient:
         self._session = session
         self._airflow_url = airflow_url
         self._console = console
+        # Plugins which predate the snapshot search endpoint only serve the GET snapshots endpoint.
+        self._snapshot_search_supported = True
 
     def apply_plan(
         self,
@@ -70,32 +79,54 @@ class AirflowClient:
             is_dev=is_dev,
         )
 
-        response = self._session.post(
-            urljoin(self._airflow_url, PLANS_PATH),
-            data=request.json(),
-        )
-        self._raise_for_status(response)
+        self._post(PLANS_PATH, request)
 
     def get_snapshots(self, snapshot_ids: t.Optional[t.List[SnapshotId]]) -> t.List[Snapshot]:
-        params: t.Dict[str, str] = {}
-        if snapshot_ids is not None:
-            params["ids"] = _list_to_json(snapshot_ids)
+        if snapshot_ids is None:
+            snapshot_ids = self._search_snapshots(
+                common.SnapshotSearchRequest(projection=common.SnapshotProjection.IDS)
+            ).snapshot_ids
 
-        return common.SnapshotsResponse.parse_obj(self._get(SNAPSHOTS_PATH, **params)).snapshots
+        return [
+            snapshot
+            for ids in _chunks(snapshot_ids or [])
+            for snapshot in self._search_snapshots(common.SnapshotSearchRequest(ids=ids)).snapshots
+            or []
+        ]
+
+    def get_snapshot_summaries(
+        self, snapshot_ids: t.Optional[t.List[SnapshotId]]
+    ) -> t.List[SnapshotSummary]:
+        search = common.SnapshotSearchRequest(projection=common.SnapshotProjection.SUMMARY)
+        if snapshot_ids is None:
+            return self._search_snapshots(search).summaries or []
+
+        return [
+            summary
+            for ids in _chunks(snapshot_ids)
+            for summary in self._search_snapshots(search.copy(update={"ids": ids})).summaries or []
+        ]
 
     def snapshots_exist(self, snapshot_ids: t.List[SnapshotId]) -> t.Set[SnapshotId]:
-        return set(
-            common.SnapshotIdsResponse.parse_obj(
-                self._get(SNAPSHOTS_PATH, "check_existence", ids=_list_to_json(snapshot_ids))
-            ).snapshot_ids
-        )
+        search = common.SnapshotSearchRequest(projection=common.SnapshotProjection.IDS)
+        return {
+            snapshot_id
+            for ids in _chunks(snapshot_ids)
+            for snapshot_id in self._search_snapshots(search.copy(update={"ids": ids})).snapshot_ids
+            or []
+        }
 
     def get_snapshots_with_same_version(
         self, snapshot_name_versions: t.List[SnapshotNameVersion]
     ) -> t.List[Snapshot]:
-        return common.SnapshotsResponse.parse_obj(
-            self._get(SNAPSHOTS_PATH, versions=_list_to_json(snapshot_name_versions))
-        ).snapshots
+        return [
+            snapshot
+            for versions in _chunks(snapshot_name_versions)
+            for snapshot in self._search_snapshots(
+                common.SnapshotSearchRequest(versions=versions)
+            ).snapshots
+            or []
+        ]
 
     def get_environment(self, environment: str) -> t.Optional[Environment]:
         try:
@@ -203,6 +234,52 @@ class AirflowClient:
         self._raise_for_status(response)
         return response.json()
 
+    def _post(self, path: str, data: PydanticModel) -> t.Dict[str, t.Any]:
+        body = data.json().encode("utf-8")
+        headers = {}
+        if len(body) >= common.COMPRESSION_MIN_SIZE_BYTES:
+            body = gzip.compress(body, compresslevel=common.GZIP_COMPRESS_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+        response = self._session.post(urljoin(self._airflow_url, path), data=body, headers=headers)
+        self._raise_for_status(response)
+        return response.json()
+
+    def _search_snapshots(
+        self, search: common.SnapshotSearchRequest
+    ) -> common.SnapshotSearchResponse:
+        if self._snapshot_search_supported:
+            try:
+                return common.SnapshotSearchResponse.parse_obj(
+                    self._post(SNAPSHOTS_SEARCH_PATH, search)
+                )
+            except NotFoundError:
+                self._snapshot_search_supported = False
+        return self._search_snapshots_legacy(search)
+
+    def _search_snapshots_legacy(
+        self, search: common.SnapshotSearchRequest
+    ) -> common.SnapshotSearchResponse:
+        """Looks up snapshots using the GET snapshots endpoint of plugins without snapshot search.
+
+        The projection is applied on the client side. Searches are expected to be unpaginated.
+        """
+        if search.versions is not None:
+            response = self._get(SNAPSHOTS_PATH, versions=_list_to_json(search.versions))
+        elif search.ids is not None and search.projection == common.SnapshotProjection.IDS:
+            return common.SnapshotSearchResponse(
+                snapshot_ids=common.SnapshotIdsResponse.parse_obj(
+                    self._get(SNAPSHOTS_PATH, "check_existence", ids=_list_to_json(search.ids))
+                ).snapshot_ids
+            )
+        elif search.ids is not None:
+            response = self._get(SNAPSHOTS_PATH, ids=_list_to_json(search.ids))
+        else:
+            response = self._get(SNAPSHOTS_PATH)
+
+        return common.SnapshotSearchResponse.from_snapshots(
+            common.SnapshotsResponse.parse_obj(response).snapshots, search.projection
+        )
+
     def _console_loading_start(self) -> t.Optional[uuid.UUID]:
         if self._console:
             return self._console.loading_start()
@@ -222,3 +299,8 @@ T = t.TypeVar("T", bound=PydanticModel)
 
 def _list_to_json(models: t.List[T]) -> str:
     return json.dumps([m.dict() for m in models], separators=(",", ":"))
+
+
+def _chunks(items: t.List[T]) -> t.Iterator[t.List[T]]:
+    for i in range(0, len(items), common.SNAPSHOTS_PAGE_SIZE):
+        yield items[i : i + common.SNAPSHOTS_PAGE_SIZE]
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import typing as t
+from enum import Enum
 
 from sqlmesh.core import constants as c
 from sqlmesh.core._typing import NotificationTarget
 from sqlmesh.core.environment import Environment
 from sqlmesh.core.scheduler import Interval
 from sqlmesh.core.snapshot import (
+    Intervals,
     Snapshot,
     SnapshotId,
     SnapshotIdLike,
     SnapshotInfoLike,
+    SnapshotNameVersion,
+    SnapshotSummary,
     SnapshotTableInfo,
 )
 from sqlmesh.core.user import User
@@ -36,6 +40,13 @@ AIRFLOW_LOCAL_URL = "http://localhost:8080/"
 
 SQLMESH_API_BASE_PATH: str = f"{c.SQLMESH}/api/v1"
 
+SNAPSHOTS_PAGE_SIZE = 500
+"""The number of snapshot ids or versions looked up per request by the Airflow client."""
+
+COMPRESSION_MIN_SIZE_BYTES = 1024
+"""Request and response payloads smaller than this are sent uncompressed."""
+GZIP_COMPRESS_LEVEL = 6
+
 
 class PlanApplicationRequest(PydanticModel):
     request_id: str
@@ -89,6 +100,83 @@ class SnapshotIdsResponse(PydanticModel):
     snapshot_ids: t.List[SnapshotId]
 
 
+class SnapshotProjection(str, Enum):
+    """The part of each snapshot which is returned by a snapshot search."""
+
+    FULL = "full"
+    SUMMARY = "summary"
+    IDS = "ids"
+    VERSIONS = "versions"
+    INTERVALS = "intervals"
+
+
+class SnapshotSearchRequest(PydanticModel):
+    """Looks up snapshots by their ids or by their versions.
+
+    All snapshots are looked up if neither ids nor versions are provided. The lookup is paginated
+    over the provided ids or versions (or over all snapshot ids): only `limit` of them starting at
+    `offset` are looked up per request.
+    """
+
+    ids: t.Optional[t.List[SnapshotId]] = None
+    versions: t.Optional[t.List[SnapshotNameVersion]] = None
+    projection: SnapshotProjection = SnapshotProjection.FULL
+    offset: int = 0
+    limit: t.Optional[int] = None
+
+
+class SnapshotIntervals(PydanticModel):
+    name: str
+    identifier: str
+    intervals: Intervals
+    dev_intervals: Intervals
+
+    @property
+    def snapshot_id(self) -> SnapshotId:
+        return SnapshotId(name=self.name, identifier=self.identifier)
+
+
+class SnapshotSearchResponse(PydanticModel):
+    """A page of found snapshots. Only the attribute matching the requested projection is set."""
+
+    snapshots: t.Optional[t.List[Snapshot]] = None
+    summaries: t.Optional[t.List[SnapshotSummary]] = None
+    snapshot_ids: t.Optional[t.List[SnapshotId]] = None
+    table_infos: t.Optional[t.List[SnapshotTableInfo]] = None
+    intervals: t.Optional[t.List[SnapshotIntervals]] = None
+    next_offset: t.Optional[int] = None
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        snapshots: t.Iterable[t.Union[Snapshot, SnapshotSummary]],
+        projection: SnapshotProjection,
+        next_offset: t.Optional[int] = None,
+    ) -> SnapshotSearchResponse:
+        """Creates a response with the given projection of the found snapshots."""
+        snapshots = list(snapshots)
+        response = cls(next_offset=next_offset)
+        if projection == SnapshotProjection.FULL:
+            response.snapshots = t.cast(t.List[Snapshot], snapshots)
+        elif projection == SnapshotProjection.SUMMARY:
+            response.summaries = [s.summary if isinstance(s, Snapshot) else s for s in snapshots]
+        elif projection == SnapshotProjection.IDS:
+            response.snapshot_ids = [s.snapshot_id for s in snapshots]
+        elif projection == SnapshotProjection.VERSIONS:
+            response.table_infos = [s.table_info for s in snapshots]
+        else:
+            response.intervals = [
+                SnapshotIntervals(
+                    name=s.name,
+                    identifier=s.identifier,
+                    intervals=s.intervals,
+                    dev_intervals=s.dev_intervals,
+                )
+                for s in snapshots
+            ]
+        return response
+
+
 def snapshot_key(snapshot: SnapshotIdLike) -> str:
     return snapshot_key_from_name_identifier(snapshot.name, snapshot.identifier)
 
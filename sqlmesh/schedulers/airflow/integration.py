@@ -56,6 +56,9 @@ class SQLMeshAirflow:
             deletion from Airflow. Default: 1 hour.
         plan_application_dag_ttl: Determines the time-to-live period for finished plan application DAGs.
             Once this period is exceeded, finished plan application DAGs are deleted by the janitor. Default: 2 days.
+        snapshot_catalog_path: The local directory in which stored snapshots are cached, so that only new or
+            modified snapshots are fetched from the state each time DAGs are generated.
+            Default: `$AIRFLOW_HOME/.sqlmesh`.
     """
 
     def __init__(
@@ -66,6 +69,7 @@ class SQLMeshAirflow:
         ddl_engine_operator_args: t.Optional[t.Dict[str, t.Any]] = None,
         janitor_interval: timedelta = timedelta(hours=1),
         plan_application_dag_ttl: timedelta = timedelta(days=2),
+        snapshot_catalog_path: t.Optional[str] = None,
     ):
         if isinstance(engine_operator, str):
             if not ddl_engine_operator:
@@ -87,6 +91,7 @@ class SQLMeshAirflow:
             self._ddl_engine_operator_args = ddl_engine_operator_args or {}
         self._janitor_interval = janitor_interval
         self._plan_application_dag_ttl = plan_application_dag_ttl
+        self._snapshot_catalog_path = snapshot_catalog_path
 
     @property
     def dags(self) -> t.List[DAG]:
@@ -97,7 +102,9 @@ class SQLMeshAirflow:
             The list of DAG instances managed by the platform.
         """
         with util.scoped_state_sync() as state_sync:
-            stored_snapshots = state_sync.get_snapshots(None)
+            stored_snapshots = util.snapshot_catalog(
+                state_sync, self._snapshot_catalog_path
+            ).get_snapshots()
 
         dag_generator = SnapshotDagGenerator(
             self._engine_operator,
@@ -168,14 +175,15 @@ def _janitor_task(
             key=common.SNAPSHOT_CLEANUP_COMMAND_XCOM_KEY,
             value=commands.CleanupCommandPayload(
                 environments=expired_environments,
-                snapshots=[s.table_info for s in expired_snapshots],
+                snapshots=expired_snapshots,
             ).json(),
             session=session,
         )
 
         all_snapshot_dag_ids = set(util.get_snapshot_dag_ids())
         active_snapshot_dag_ids = {
-            common.dag_id_for_snapshot_info(s) for s in state_sync.get_snapshots(None).values()
+            common.dag_id_for_name_version(s.name, s.version)
+            for s in state_sync.get_snapshot_summaries(None).values()
         }
         expired_snapshot_dag_ids = all_snapshot_dag_ids - active_snapshot_dag_ids
         logger.info("Deleting expired Snapshot DAGs: %s", expired_snapshot_dag_ids)
@@ -7,16 +7,21 @@ from sqlmesh.core import scheduler
 from sqlmesh.core.environment import Environment
 from sqlmesh.core.snapshot import SnapshotTableInfo
 from sqlmesh.core.state_sync import StateSync
+from sqlmesh.core.state_sync.catalog import SnapshotCatalog
 from sqlmesh.schedulers.airflow import common
 from sqlmesh.utils.date import now
 from sqlmesh.utils.errors import SQLMeshError
 
 
 def create_plan_dag_spec(
-    request: common.PlanApplicationRequest, state_sync: StateSync
+    request: common.PlanApplicationRequest,
+    state_sync: StateSync,
+    snapshot_catalog: t.Optional[SnapshotCatalog] = None,
 ) -> common.PlanDagSpec:
     new_snapshots = {s.snapshot_id: s for s in request.new_snapshots}
-    stored_snapshots = state_sync.get_snapshots(None)
+    stored_snapshots = (
+        snapshot_catalog.get_snapshots() if snapshot_catalog else state_sync.get_snapshots(None)
+    )
 
     duplicated_snapshots = set(stored_snapshots).intersection(new_snapshots)
     if duplicated_snapshots:
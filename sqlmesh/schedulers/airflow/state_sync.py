@@ -11,6 +11,7 @@ from sqlmesh.core.snapshot import (
     SnapshotIdLike,
     SnapshotNameVersion,
     SnapshotNameVersionLike,
+    SnapshotSummary,
 )
 from sqlmesh.core.state_sync import StateReader, Versions
 from sqlmesh.schedulers.airflow.client import AirflowClient
@@ -67,16 +68,30 @@ class HttpStateReader(StateReader):
     ) -> t.Dict[SnapshotId, Snapshot]:
         """Gets multiple snapshots from the rest api.
 
-        Because of the limitations of the Airflow API, this method is inherently inefficient.
-        It's impossible to bulkfetch the snapshots and thus every snapshot needs to make an individual
-        call to the rest api. Multiple threads can be used, but it could possibly have detrimental effects
-        on the production server.
+        Snapshots are fetched in batches of `common.SNAPSHOTS_PAGE_SIZE` ids per request.
         """
         snapshots = self._client.get_snapshots(
             [s.snapshot_id for s in snapshot_ids] if snapshot_ids is not None else None
         )
         return {snapshot.snapshot_id: snapshot for snapshot in snapshots}
 
+    def get_snapshot_summaries(
+        self, snapshot_ids: t.Optional[t.Iterable[SnapshotIdLike]]
+    ) -> t.Dict[SnapshotId, SnapshotSummary]:
+        """Gets summaries of multiple snapshots from the rest api without fetching their models.
+
+        Args:
+            snapshot_ids: Iterable of snapshot ids to get. If not provided all
+                available snapshot summaries will be returned.
+
+        Returns:
+            A dictionary of snapshot ids to snapshot summaries for ones that could be found.
+        """
+        summaries = self._client.get_snapshot_summaries(
+            [s.snapshot_id for s in snapshot_ids] if snapshot_ids is not None else None
+        )
+        return {summary.snapshot_id: summary for summary in summaries}
+
     def snapshots_exist(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> t.Set[SnapshotId]:
         """Checks if multiple snapshots exist in the state sync.
 
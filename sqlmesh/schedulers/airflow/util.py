@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import os
 import typing as t
 from datetime import timedelta
 
 from airflow import settings
 from airflow.api.common.experimental.delete_dag import delete_dag
+from airflow.configuration import AIRFLOW_HOME
 from airflow.exceptions import AirflowException, DagNotFound
 from airflow.models import BaseOperator, DagRun, DagTag, Variable, XCom
 from airflow.utils.session import provide_session
@@ -14,7 +16,8 @@ from airflow.utils.state import DagRunState
 from sqlalchemy.orm import Session
 
 from sqlmesh.core.engine_adapter import create_engine_adapter
-from sqlmesh.core.state_sync import EngineAdapterStateSync, StateSync
+from sqlmesh.core.state_sync import EngineAdapterStateSync
+from sqlmesh.core.state_sync.catalog import SnapshotCatalog
 from sqlmesh.schedulers.airflow import common
 from sqlmesh.utils.date import now
 from sqlmesh.utils.errors import SQLMeshError
@@ -27,9 +30,12 @@ logger = logging.getLogger(__name__)
 # and prevents mypy from complaining.
 PROVIDED_SESSION: Session = t.cast(Session, None)
 
+SNAPSHOT_CATALOG_PATH = os.path.join(AIRFLOW_HOME, ".sqlmesh")
+"""The default directory in which stored snapshots are cached locally."""
+
 
 @contextlib.contextmanager
-def scoped_state_sync() -> t.Generator[StateSync, None, None]:
+def scoped_state_sync() -> t.Generator[EngineAdapterStateSync, None, None]:
     dialect = settings.engine.dialect.name
     engine_adapter = create_engine_adapter(
         settings.engine.raw_connection, dialect, multithreaded=True
@@ -40,6 +46,12 @@ def scoped_state_sync() -> t.Generator[StateSync, None, None]:
         engine_adapter.close()
 
 
+def snapshot_catalog(
+    state_sync: EngineAdapterStateSync, path: t.Optional[str] = None
+) -> SnapshotCatalog:
+    return SnapshotCatalog(state_sync, path or SNAPSHOT_CATALOG_PATH)
+
+
 @provide_session
 def get_snapshot_dag_ids(session: Session = PROVIDED_SESSION) -> t.List[str]:
     dag_tags = session.query(DagTag).filter(DagTag.name == common.SNAPSHOT_AIRFLOW_TAG).all()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import shutil
+import typing as t
+from pathlib import Path
+
+from sqlglot import __version__ as SQLGLOT_VERSION
+
+from sqlmesh.utils.pydantic import PydanticModel
+
+logger = logging.getLogger(__name__)
+
+T = t.TypeVar("T", bound=PydanticModel)
+
+DEFAULT_MAX_SIZE_BYTES = 256 * 1024 * 1024
+
+CACHE_VERSION = 1
+"""Bump to invalidate all existing cache entries, eg. when the layout of entries changes."""
+
+
+class FileCache(t.Generic[T]):
+    """A persistent cache which stores entries as compressed JSON files in a directory.
+
+    Entries are content addressed, ie. the key of an entry must be derived from all inputs that determine
+    its value (see `cache_key`). All entries are invalidated when the version of SQLMesh or SQLGlot
+    changes. Once the total size of the cache exceeds `max_size_bytes` the least recently used entries
+    are evicted.
+
+    Args:
+        path: The root directory of the cache, eg. `<project>/.cache`.
+        entry_class: The type of cached entries.
+        prefix: The name of the subdirectory in which entries are stored.
+        max_size_bytes: The maximum total size of cached entries.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        entry_class: t.Type[T],
+        prefix: str,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ):
+        self._entry_class = entry_class
+        self._max_size_bytes = max_size_bytes
+        self._size_bytes: t.Optional[int] = None
+
+        root = path / prefix
+        self._path = root / version_key()
+        try:
+            if root.exists():
+                for previous_version in root.iterdir():
+                    if previous_version != self._path:
+                        shutil.rmtree(previous_version, ignore_errors=True)
+            self._path.mkdir(parents=True, exist_ok=True)
+        except OSError as ex:
+            logger.warning("Failed to initialize the cache at '%s': %s", self._path, ex)
+
+    def get(self, key: str) -> t.Optional[T]:
+        """Returns the entry with the given key or None if there is no such entry."""
+        file = self._file(key)
+        try:
+            entry = self._entry_class.parse_raw(gzip.decompress(file.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            logger.warning("Discarding the corrupted cache entry '%s': %s", file, ex)
+            self._remove(file)
+            return None
+
+        try:
+            # The modification time marks when an entry was last used.
+            os.utime(file)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, value: T) -> None:
+        """Stores the given entry under the given key."""
+        file = self._file(key)
+        temp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        try:
+            temp_file.write_bytes(gzip.compress(value.json().encode("utf-8")))
+            temp_file.replace(file)
+        except OSError as ex:
+            logger.warning("Failed to write the cache entry '%s': %s", file, ex)
+            self._remove(temp_file)
+            return
+
+        if self._size_bytes is not None:
+            self._size_bytes += file.stat().st_size
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        for file in self._files():
+            self._remove(file)
+        self._size_bytes = 0
+
+    def _evict(self) -> None:
+        if self._size_bytes is None:
+            self._size_bytes = sum(file.stat().st_size for file in self._files())
+        if self._size_bytes <= self._max_size_bytes:
+            return
+
+        files = sorted(
+            ((file.stat(), file) for file in self._files()), key=lambda entry: entry[0].st_mtime
+        )
+        for stat, file in files:
+            if self._size_bytes <= self._max_size_bytes:
+                break
+            self._remove(file)
+            self._size_bytes -= stat.st_size
+
+    def _files(self) -> t.List[Path]:
+        try:
+            return list(self._path.glob("*.json.gz"))
+        except OSError:
+            return []
+
+    def _file(self, key: str) -> Path:
+        return self._path / f"{key}.json.gz"
+
+    @staticmethod
+    def _remove(file: Path) -> None:
+        try:
+            file.unlink()
+        except OSError:
+            pass
+
+
+def cache_key(*parts: t.Optional[str]) -> str:
+    """Derives a cache key from the given inputs."""
+    sha = hashlib.sha256()
+    for part in parts:
+        sha.update(b"\0" if part is None else part.encode("utf-8"))
+        sha.update(b"\1")
+    return sha.hexdigest()
+
+
+def version_key() -> str:
+    """Identifies the versions of SQLMesh and SQLGlot which cached entries were created with."""
+    try:
+        from sqlmesh import __version__ as sqlmesh_version
+    except ImportError:
+        sqlmesh_version = "unknown"
+
+    return f"v{CACHE_VERSION}__sqlmesh_{sqlmesh_version}__sqlglot_{SQLGLOT_VERSION}".replace(
+        os.path.sep, "_"
+    )
@@ -1,4 +1,8 @@
+import abc
+import heapq
+import itertools
 import typing as t
+from collections import deque
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from threading import Lock
 
@@ -16,9 +20,69 @@ class NodeExecutionFailedError(t.Generic[H], SQLMeshError):
         super().__init__(f"Execution failed for node {node}")
 
 
+class SchedulingPolicy(abc.ABC, t.Generic[H]):
+    """Determines the order in which nodes that are ready for execution are picked up."""
+
+    @abc.abstractmethod
+    def priorities(self, dag: DAG[H]) -> t.Dict[H, float]:
+        """Computes priorities of nodes in the given DAG.
+
+        Args:
+            dag: The target DAG.
+
+        Returns:
+            A dictionary of nodes to priorities. Nodes with higher priorities are executed first.
+        """
+
+
+class FIFOPolicy(SchedulingPolicy[H]):
+    """Executes nodes in the order in which they become ready."""
+
+    def priorities(self, dag: DAG[H]) -> t.Dict[H, float]:
+        return {}
+
+
+class LongestPathPolicy(SchedulingPolicy[H]):
+    """Executes nodes on the longest remaining path of dependents first (critical path first).
+
+    Args:
+        weight: Returns the expected duration of a node. Each node has a weight of 1 by default.
+    """
+
+    def __init__(self, weight: t.Optional[t.Callable[[H], float]] = None):
+        self.weight = weight or (lambda _: 1.0)
+
+    def priorities(self, dag: DAG[H]) -> t.Dict[H, float]:
+        dependents = _dependents(dag.graph)
+        remaining_path: t.Dict[H, float] = {}
+        for node in reversed(dag.sorted()):
+            remaining_path[node] = self.weight(node) + max(
+                (remaining_path[dependent] for dependent in dependents[node]), default=0.0
+            )
+        return remaining_path
+
+
+class OldestFirstPolicy(SchedulingPolicy[H]):
+    """Executes nodes with the smallest key first, eg. nodes that correspond to the oldest intervals.
+
+    Args:
+        key: Returns the sort key of a node, eg. the start timestamp of an interval.
+    """
+
+    def __init__(self, key: t.Callable[[H], float]):
+        self.key = key
+
+    def priorities(self, dag: DAG[H]) -> t.Dict[H, float]:
+        return {node: -self.key(node) for node in dag.graph}
+
+
 class ConcurrentDAGExecutor(t.Generic[H]):
     """Concurrently traverses the given DAG in topological order while applying a function to each node.
 
+    The executor keeps track of the number of pending dependencies for each node. Once a node is processed
+    only its direct dependents are updated and the ones that no longer have pending dependencies are
+    added to the ready queue. Ready nodes are submitted in the order determined by the scheduling policy.
+
     If `raise_on_error` is set to False maintains a state of execution errors as well as of skipped nodes.
 
     Args:
@@ -28,6 +92,7 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        policy: The policy which determines the order in which ready nodes are executed.
     """
 
     def __init__(
@@ -36,11 +101,13 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         fn: t.Callable[[H], None],
         tasks_num: int,
         raise_on_error: bool,
+        policy: t.Optional[SchedulingPolicy[H]] = None,
     ):
         self.dag = dag
         self.fn = fn
         self.tasks_num = tasks_num
         self.raise_on_error = raise_on_error
+        self.policy: SchedulingPolicy[H] = policy or FIFOPolicy()
 
         self._init_state()
 
@@ -58,7 +125,7 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
         with ThreadPoolExecutor(max_workers=self.tasks_num) as pool:
             with self._unprocessed_nodes_lock:
-                self._submit_next_nodes(pool)
+                self._submit_ready_nodes(pool)
             self._finished_future.result()
         return self._node_errors, self._skipped_nodes
 
@@ -67,8 +134,10 @@ class ConcurrentDAGExecutor(t.Generic[H]):
             self.fn(node)
 
             with self._unprocessed_nodes_lock:
+                self._running_nodes_num -= 1
                 self._unprocessed_nodes_num -= 1
-                self._submit_next_nodes(executor, node)
+                self._release_dependents(node)
+                self._submit_ready_nodes(executor)
         except Exception as ex:
             error = NodeExecutionFailedError(node)
             error.__cause__ = ex
@@ -78,48 +147,65 @@ class ConcurrentDAGExecutor(t.Generic[H]):
                 return
 
             with self._unprocessed_nodes_lock:
+                self._running_nodes_num -= 1
                 self._unprocessed_nodes_num -= 1
                 self._node_errors.append(error)
                 self._skip_next_nodes(node)
+                self._submit_ready_nodes(executor)
 
-    def _submit_next_nodes(self, executor: Executor, processed_node: t.Optional[H] = None) -> None:
-        if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
-            return
-
-        submitted_nodes = []
-        for next_node, deps in self._unprocessed_nodes.items():
-            if processed_node:
-                deps.discard(processed_node)
-            if not deps:
-                submitted_nodes.append(next_node)
+    def _release_dependents(self, processed_node: H) -> None:
+        for dependent in self._dependents[processed_node]:
+            self._pending_deps_num[dependent] -= 1
+            if not self._pending_deps_num[dependent]:
+                self._push_ready_node(dependent)
 
-        for submitted_node in submitted_nodes:
-            self._unprocessed_nodes.pop(submitted_node)
-            executor.submit(self._process_node, submitted_node, executor)
+    def _push_ready_node(self, node: H) -> None:
+        heapq.heappush(
+            self._ready_nodes, (-self._priorities.get(node, 0.0), next(self._counter), node)
+        )
 
-    def _skip_next_nodes(self, parent: H) -> None:
+    def _submit_ready_nodes(self, executor: Executor) -> None:
         if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
+            if not self._finished_future.done():
+                self._finished_future.set_result(None)
             return
 
-        skipped_nodes = [node for node, deps in self._unprocessed_nodes.items() if parent in deps]
-
-        self._skipped_nodes.extend(skipped_nodes)
+        # Only submit as many nodes as there are workers so that priorities are respected.
+        while self._ready_nodes and self._running_nodes_num < self.tasks_num:
+            _, _, node = heapq.heappop(self._ready_nodes)
+            self._running_nodes_num += 1
+            executor.submit(self._process_node, node, executor)
 
-        for skipped_node in skipped_nodes:
+    def _skip_next_nodes(self, parent: H) -> None:
+        queue = deque(self._dependents[parent])
+        while queue:
+            node = queue.popleft()
+            if node in self._skipped_nodes_set:
+                continue
+            self._skipped_nodes_set.add(node)
+            self._skipped_nodes.append(node)
             self._unprocessed_nodes_num -= 1
-            self._unprocessed_nodes.pop(skipped_node)
-            self._skip_next_nodes(skipped_node)
+            queue.extend(self._dependents[node])
 
     def _init_state(self) -> None:
-        self._unprocessed_nodes = self.dag.graph
-        self._unprocessed_nodes_num = len(self._unprocessed_nodes)
+        graph = self.dag.graph
+
+        self._dependents = _dependents(graph)
+        self._priorities = self.policy.priorities(self.dag)
+        self._pending_deps_num = {node: len(deps) for node, deps in graph.items()}
+        self._counter = itertools.count()
+        self._ready_nodes: t.List[t.Tuple[float, int, H]] = []
+        for node, deps in graph.items():
+            if not deps:
+                self._push_ready_node(node)
+        self._running_nodes_num = 0
+        self._unprocessed_nodes_num = len(graph)
         self._unprocessed_nodes_lock = Lock()
         self._finished_future = Future()  # type: ignore
 
         self._node_errors: t.List[NodeExecutionFailedError[H]] = []
         self._skipped_nodes: t.List[H] = []
+        self._skipped_nodes_set: t.Set[H] = set()
 
 
 def concurrent_apply_to_snapshots(
@@ -169,6 +255,7 @@ def concurrent_apply_to_dag(
     fn: t.Callable[[H], None],
     tasks_num: int,
     raise_on_error: bool = True,
+    policy: t.Optional[SchedulingPolicy[H]] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     """Applies a function to the given DAG concurrently while preserving the topological
     order between snapshots.
@@ -180,6 +267,7 @@ def concurrent_apply_to_dag(
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        policy: The policy which determines the order in which ready nodes are executed.
 
     Raises:
         NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any snapshot.
@@ -191,13 +279,14 @@ def concurrent_apply_to_dag(
         raise ConfigError(f"Invalid number of concurrent tasks {tasks_num}")
 
     if tasks_num == 1:
-        return sequential_apply_to_dag(dag, fn, raise_on_error)
+        return sequential_apply_to_dag(dag, fn, raise_on_error, policy=policy)
 
     return ConcurrentDAGExecutor(
         dag,
         fn,
         tasks_num,
         raise_on_error,
+        policy=policy,
     ).run()
 
 
@@ -205,6 +294,7 @@ def sequential_apply_to_dag(
     dag: DAG[H],
     fn: t.Callable[[H], None],
     raise_on_error: bool = True,
+    policy: t.Optional[SchedulingPolicy[H]] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     dependencies = dag.graph
 
@@ -213,7 +303,9 @@ def sequential_apply_to_dag(
 
     failed_or_skipped_nodes: t.Set[H] = set()
 
-    for node in dag.sorted():
+    nodes = dag.sorted() if policy is None else _simulate(dag, lambda _: 0.0, 1, policy)[1]
+
+    for node in nodes:
         if not failed_or_skipped_nodes.isdisjoint(dependencies[node]):
             skipped_nodes.append(node)
             failed_or_skipped_nodes.add(node)
@@ -232,3 +324,70 @@ def sequential_apply_to_dag(
             failed_or_skipped_nodes.add(node)
 
     return node_errors, skipped_nodes
+
+
+def estimate_makespan(
+    dag: DAG[H],
+    weight: t.Callable[[H], float],
+    tasks_num: int,
+    policy: t.Optional[SchedulingPolicy[H]] = None,
+) -> float:
+    """Estimates the total time it takes to traverse the given DAG by simulating the execution.
+
+    Args:
+        dag: The target DAG.
+        weight: Returns the expected duration of a node.
+        tasks_num: The number of concurrent tasks.
+        policy: The policy which determines the order in which ready nodes are executed.
+
+    Returns:
+        The expected time it takes to process all nodes, in the same units as node weights.
+    """
+    return _simulate(dag, weight, tasks_num, policy or FIFOPolicy())[0]
+
+
+def _simulate(
+    dag: DAG[H],
+    weight: t.Callable[[H], float],
+    tasks_num: int,
+    policy: SchedulingPolicy[H],
+) -> t.Tuple[float, t.List[H]]:
+    graph = dag.graph
+    dependents = _dependents(graph)
+    priorities = policy.priorities(dag)
+    pending_deps_num = {node: len(deps) for node, deps in graph.items()}
+    counter = itertools.count()
+
+    ready_nodes = [
+        (-priorities.get(node, 0.0), next(counter), node)
+        for node, deps in graph.items()
+        if not deps
+    ]
+    heapq.heapify(ready_nodes)
+    running_nodes: t.List[t.Tuple[float, int, H]] = []
+
+    current_time = 0.0
+    order = []
+    while ready_nodes or running_nodes:
+        while ready_nodes and len(running_nodes) < tasks_num:
+            _, _, node = heapq.heappop(ready_nodes)
+            order.append(node)
+            heapq.heappush(running_nodes, (current_time + weight(node), next(counter), node))
+
+        current_time, _, node = heapq.heappop(running_nodes)
+        for dependent in dependents[node]:
+            pending_deps_num[dependent] -= 1
+            if not pending_deps_num[dependent]:
+                heapq.heappush(
+                    ready_nodes, (-priorities.get(dependent, 0.0), next(counter), dependent)
+                )
+
+    return current_time, order
+
+
+def _dependents(graph: t.Dict[H, t.Set[H]]) -> t.Dict[H, t.List[H]]:
+    dependents: t.Dict[H, t.List[H]] = {node: [] for node in graph}
+    for node, deps in graph.items():
+        for dep in deps:
+            dependents[dep].append(node)
+    return dependents
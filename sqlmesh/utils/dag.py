@@ -8,13 +8,26 @@ allows SQLMesh to easily determine a model's lineage and to identify upstream an
 from __future__ import annotations
 
 import typing as t
+from collections import deque
+
+from sqlmesh.utils.errors import SQLMeshError
 
 T = t.TypeVar("T", bound=t.Hashable)
 
 
 class DAG(t.Generic[T]):
+    """A graph of nodes and their upstream dependencies.
+
+    The topological order of nodes and the downstream dependents of each node are maintained alongside the
+    graph, so that traversals take linear time. The topological order is computed lazily and reset whenever
+    the graph changes.
+    """
+
     def __init__(self, graph: t.Optional[t.Dict[T, t.Set[T]]] = None):
         self._graph: t.Dict[T, t.Set[T]] = {}
+        self._dependents: t.Dict[T, t.Set[T]] = {}
+        self._sorted: t.Optional[t.List[T]] = None
+        self._sorted_index: t.Optional[t.Dict[T, int]] = None
         for node, dependencies in (graph or {}).items():
             self.add(node, dependencies)
 
@@ -27,22 +40,21 @@ class DAG(t.Generic[T]):
         """
         if node not in self._graph:
             self._graph[node] = set()
+            self._dependents[node] = set()
+            self._reset_order()
         if dependencies:
-            self._graph[node].update(dependencies)
+            node_dependencies = self._graph[node]
             for d in dependencies:
                 self.add(d)
+                if d not in node_dependencies:
+                    node_dependencies.add(d)
+                    self._dependents[d].add(node)
+                    self._reset_order()
 
     @property
     def reversed(self) -> DAG[T]:
         """Returns a copy of this DAG with all its edges reversed."""
-        result = DAG[T]()
-
-        for node, deps in self._graph.items():
-            result.add(node)
-            for dep in deps:
-                result.add(dep, [node])
-
-        return result
+        return DAG(self._dependents)
 
     def subdag(self, *nodes: T) -> DAG[T]:
         """Create a new subdag given node(s).
@@ -60,13 +72,13 @@ class DAG(t.Generic[T]):
             node = queue.pop()
             deps = self._graph.get(node, set())
             graph[node] = deps
-            queue.update(deps)
+            queue.update(dep for dep in deps if dep not in graph)
 
         return DAG(graph)
 
     def upstream(self, node: T) -> t.List[T]:
         """Returns all upstream dependencies in topologically sorted order."""
-        return self.subdag(node).sorted()[:-1]
+        return self._sort_subset(self._visit(node, self._graph))
 
     @property
     def leaves(self) -> t.Set[T]:
@@ -81,22 +93,32 @@ class DAG(t.Generic[T]):
         return graph
 
     def sorted(self) -> t.List[T]:
-        """Returns a list of nodes sorted in topological order."""
-        result: t.List[T] = []
-
-        unprocessed_nodes = self.graph
-        while unprocessed_nodes:
-            next_nodes = {node for node, deps in unprocessed_nodes.items() if not deps}
+        """Returns a list of nodes sorted in topological order.
 
-            for node in next_nodes:
-                unprocessed_nodes.pop(node)
-
-            for deps in unprocessed_nodes.values():
-                deps -= next_nodes
-
-            result.extend(next_nodes)
-
-        return result
+        Nodes are sorted level by level, ie. each node comes after all nodes that have fewer levels of
+        upstream dependencies.
+        """
+        if self._sorted is None:
+            in_degrees = {node: len(deps) for node, deps in self._graph.items()}
+            level = [node for node, in_degree in in_degrees.items() if not in_degree]
+            result: t.List[T] = []
+
+            while level:
+                result.extend(level)
+                next_level = []
+                for node in level:
+                    for dependent in self._dependents[node]:
+                        in_degrees[dependent] -= 1
+                        if not in_degrees[dependent]:
+                            next_level.append(dependent)
+                level = next_level
+
+            if len(result) < len(self._graph):
+                cycle = sorted(str(node) for node, in_degree in in_degrees.items() if in_degree)
+                raise SQLMeshError(f"Detected a cycle in the DAG involving: {', '.join(cycle)}")
+
+            self._sorted = result
+        return list(self._sorted)
 
     def downstream(self, node: T) -> t.List[T]:
         """Get all nodes that have the input node as an upstream dependency.
@@ -107,22 +129,7 @@ class DAG(t.Generic[T]):
         Returns:
             A list of descendant nodes sorted in topological order.
         """
-        sorted_nodes = self.sorted()
-        try:
-            node_index = sorted_nodes.index(node)
-        except ValueError:
-            return []
-
-        def visit() -> t.Iterator[T]:
-            """Visit topologically sorted nodes after input node and yield downstream dependants."""
-            downstream = {node}
-            for current_node in sorted_nodes[node_index + 1 :]:
-                upstream = self._graph.get(current_node, set())
-                if not upstream.isdisjoint(downstream):
-                    downstream.add(current_node)
-                    yield current_node
-
-        return list(visit())
+        return self._sort_subset(self._visit(node, self._dependents))
 
     def lineage(self, node: T) -> DAG[T]:
         """Get a dag of the node and its upstream dependencies and downstream dependents.
@@ -134,3 +141,24 @@ class DAG(t.Generic[T]):
             A new dag consisting of the dependent and descendant nodes.
         """
         return self.subdag(node, *self.downstream(node))
+
+    def _visit(self, node: T, edges: t.Dict[T, t.Set[T]]) -> t.Set[T]:
+        """Returns all nodes that are reachable from the given node, excluding the node itself."""
+        visited: t.Set[T] = set()
+        queue = deque(edges.get(node, ()))
+        while queue:
+            current = queue.popleft()
+            if current not in visited:
+                visited.add(current)
+                queue.extend(edges[current])
+        visited.discard(node)
+        return visited
+
+    def _sort_subset(self, nodes: t.Set[T]) -> t.List[T]:
+        if self._sorted_index is None:
+            self._sorted_index = {node: index for index, node in enumerate(self.sorted())}
+        return sorted(nodes, key=self._sorted_index.__getitem__)
+
+    def _reset_order(self) -> None:
+        self._sorted = None
+        self._sorted_index = None
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+import typing as t
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+T = t.TypeVar("T")
+
+_DONE = object()
+
+# How long the consumer waits for the producer thread to finish after the stream has been closed.
+PRODUCER_JOIN_TIMEOUT_SECS = 5.0
+
+
+class _ProducerError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class StreamStats:
+    """Throughput and memory statistics collected while consuming a `BufferedStream`."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.chunks = 0
+        self.seconds = 0.0
+        self.peak_buffered_bytes = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamStats<rows: {self.rows}, chunks: {self.chunks}, "
+            f"rows/s: {self.rows_per_second:.1f}, peak buffered bytes: {self.peak_buffered_bytes}>"
+        )
+
+
+class BufferedStream(t.Generic[T]):
+    """Pulls items from an iterable in a background producer thread while they are consumed.
+
+    The producer blocks once `max_buffered_chunks` items are waiting to be consumed, which bounds the
+    memory used by the items that were produced ahead of the consumer. Consecutive pandas DataFrames are
+    coalesced into chunks of at least `min_chunk_rows` rows, other items are passed through as is.
+
+    Since the iterable is advanced in a different thread it must not depend on thread-local state,
+    eg. a connection that is bound to the consuming thread. For the same reason, the iterable is closed
+    by the producer thread once the stream is exhausted or closed.
+
+    Args:
+        iterable: The source of items, eg. the generator returned by a Python model.
+        max_buffered_chunks: The maximum number of items buffered ahead of the consumer.
+        min_chunk_rows: DataFrames are concatenated until they have at least this many rows.
+            Coalescing is disabled if set to 0.
+    """
+
+    def __init__(
+        self,
+        iterable: t.Iterable[T],
+        max_buffered_chunks: int = 1,
+        min_chunk_rows: int = 0,
+    ):
+        self.iterable = iterable
+        self.max_buffered_chunks = max(max_buffered_chunks, 1)
+        self.min_chunk_rows = min_chunk_rows
+        self.stats = StreamStats()
+
+        self._buffered_bytes = 0
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> t.Generator[T, None, None]:
+        buffer: queue.Queue = queue.Queue(maxsize=self.max_buffered_chunks)
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._produce, args=(buffer, stop), name="sqlmesh_stream_producer", daemon=True
+        )
+        started_at = time.monotonic()
+        producer.start()
+
+        pending: t.List[pd.DataFrame] = []
+        pending_rows = 0
+        try:
+            while True:
+                item = buffer.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, _ProducerError):
+                    raise item.error
+
+                if not isinstance(item, pd.DataFrame) or not self.min_chunk_rows:
+                    if pending:
+                        yield self._release(pending)  # type: ignore
+                        pending, pending_rows = [], 0
+                    yield self._release([item])
+                    continue
+
+                pending.append(item)
+                pending_rows += len(item)
+                if pending_rows >= self.min_chunk_rows:
+                    yield self._release(pending)  # type: ignore
+                    pending, pending_rows = [], 0
+
+            if pending:
+                yield self._release(pending)  # type: ignore
+        finally:
+            stop.set()
+            producer.join(timeout=PRODUCER_JOIN_TIMEOUT_SECS)
+            if producer.is_alive():
+                # The producer is blocked while producing an item and stops once it has been produced.
+                logger.warning(
+                    "The stream producer didn't stop within %ss", PRODUCER_JOIN_TIMEOUT_SECS
+                )
+            self.stats.seconds = time.monotonic() - started_at
+
+    def _produce(self, buffer: queue.Queue, stop: threading.Event) -> None:
+        iterator = iter(self.iterable)
+        try:
+            while not stop.is_set():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self._put(buffer, _DONE, stop)
+                    return
+                with self._lock:
+                    self._buffered_bytes += _size_in_bytes(item)
+                    self.stats.peak_buffered_bytes = max(
+                        self.stats.peak_buffered_bytes, self._buffered_bytes
+                    )
+                if not self._put(buffer, item, stop):
+                    return
+        except BaseException as ex:
+            self._put(buffer, _ProducerError(ex), stop)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+
+    def _put(self, buffer: queue.Queue, item: t.Any, stop: threading.Event) -> bool:
+        # Blocks while the buffer is full unless the consumer stops early.
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _release(self, items: t.List[t.Any]) -> t.Any:
+        chunk = items[0] if len(items) == 1 else pd.concat(items, ignore_index=True)
+        with self._lock:
+            self._buffered_bytes -= sum(_size_in_bytes(item) for item in items)
+        self.stats.chunks += 1
+        if isinstance(chunk, pd.DataFrame):
+            self.stats.rows += len(chunk)
+        return chunk
+
+
+def _size_in_bytes(item: t.Any) -> int:
+    if isinstance(item, pd.DataFrame):
+        return int(item.memory_usage(index=True, deep=False).sum())
+    return 0
@@ -2,11 +2,13 @@
 from unittest.mock import call
 
 import pandas as pd
+import pytest
 from pytest_mock.plugin import MockerFixture
 from sqlglot import expressions as exp
 from sqlglot import parse_one
 
 from sqlmesh.core.engine_adapter import EngineAdapter, EngineAdapterWithIndexSupport
+from sqlmesh.utils.errors import SQLMeshError
 
 
 def test_create_view(mocker: MockerFixture):
@@ -338,3 +340,79 @@ def test_rename_table(mocker: MockerFixture):
     adapter.rename_table("old_table", "new_table")
 
     cursor_mock.execute.assert_called_once_with('ALTER TABLE "old_table" RENAME TO "new_table"')
+
+
+def test_fetch_batches(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+    cursor_mock.description = [("a",), ("b",)]
+    cursor_mock.fetchmany.side_effect = [[(1, "x"), (2, "y")], [(3, None)], []]
+
+    adapter = EngineAdapter(lambda: connection_mock, "")  # type: ignore
+    batches = list(adapter.fetch_batches("SELECT a, b FROM tbl", batch_rows=2))
+
+    cursor_mock.execute.assert_called_once_with("SELECT a, b FROM tbl")
+    cursor_mock.fetchmany.assert_has_calls([call(2), call(2)])
+    assert [batch.to_pydict() for batch in batches] == [
+        {"a": [1, 2], "b": ["x", "y"]},
+        {"a": [3], "b": [None]},
+    ]
+    assert batches[0].schema == batches[1].schema
+    cursor_mock.close.assert_called_once()
+
+    cursor_mock.reset_mock()
+    cursor_mock.fetchmany.side_effect = [[(1, "x"), (2, "y")], [(3, None)], []]
+    stream = adapter.fetch_batches("SELECT a, b FROM tbl", batch_rows=2)
+    next(stream)
+    cursor_mock.close.assert_not_called()
+    stream.close()  # type: ignore
+    cursor_mock.close.assert_called_once()
+
+    cursor_mock.fetchmany.side_effect = [[]]
+    batches = list(adapter.fetch_batches("SELECT a, b FROM tbl WHERE FALSE"))
+    assert len(batches) == 1
+    assert batches[0].num_rows == 0
+    assert batches[0].schema.names == ["a", "b"]
+
+
+def test_fetch_batches_null_columns(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+    cursor_mock.description = [("a",), ("b",)]
+    cursor_mock.fetchmany.side_effect = [[(1, None)], [(2, None)], [(3, 1.5)], [(None, 2.5)], []]
+
+    adapter = EngineAdapter(lambda: connection_mock, "")  # type: ignore
+    batches = list(adapter.fetch_batches("SELECT a, b FROM tbl", batch_rows=1))
+
+    # The type of a column that is NULL in the first batch is inferred from later batches.
+    assert [batch.to_pydict() for batch in batches] == [
+        {"a": [1], "b": [None]},
+        {"a": [2], "b": [None]},
+        {"a": [3], "b": [1.5]},
+        {"a": [None], "b": [2.5]},
+    ]
+    assert all(batch.schema == batches[0].schema for batch in batches)
+    assert str(batches[0].schema.field("b").type) == "double"
+
+    adapter.MAX_TYPE_LOOKAHEAD_BATCHES = 1
+    cursor_mock.fetchmany.side_effect = [[(1, None)], [(2, 3)], []]
+    batches = list(adapter.fetch_batches("SELECT a, b FROM tbl", batch_rows=1))
+
+    # Columns whose type isn't known within the lookahead are returned as strings.
+    assert [batch.to_pydict() for batch in batches] == [
+        {"a": [1], "b": [None]},
+        {"a": [2], "b": ["3"]},
+    ]
+    assert str(batches[1].schema.field("b").type) == "string"
+
+
+def test_fetch_batches_without_pyarrow(mocker: MockerFixture):
+    mocker.patch.dict("sys.modules", {"pyarrow": None})
+    connection_mock = mocker.NonCallableMock()
+
+    adapter = EngineAdapter(lambda: connection_mock, "")
+    with pytest.raises(SQLMeshError, match="requires the 'pyarrow' package"):
+        adapter.fetch_batches("SELECT a FROM tbl")
+    connection_mock.cursor.assert_not_called()
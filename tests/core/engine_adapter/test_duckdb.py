@@ -69,3 +69,20 @@ def test_transaction(adapter: EngineAdapter, duck_conn):
     except Exception:
         pass
     assert duck_conn.execute("SELECT * FROM test_table").fetchall() == [(1,)]
+
+
+def test_fetch_batches(adapter: EngineAdapter):
+    batches = list(adapter.fetch_batches("SELECT range AS x FROM range(5000)", batch_rows=2048))
+    assert [batch.num_rows for batch in batches] == [2048, 2048, 904]
+    assert batches[-1].to_pydict()["x"][-1] == 4999
+
+    batches = list(adapter.fetch_batches("SELECT a FROM tbl WHERE FALSE"))
+    assert len(batches) == 1
+    assert batches[0].num_rows == 0
+    assert batches[0].schema.names == ["a"]
+
+    # Queries executed while the stream is being consumed don't affect its results.
+    stream = adapter.fetch_batches("SELECT range AS x FROM range(5000)", batch_rows=2048)
+    assert next(stream).num_rows == 2048
+    assert adapter.fetchone("SELECT 1") == (1,)
+    assert [batch.num_rows for batch in stream] == [2048, 904]
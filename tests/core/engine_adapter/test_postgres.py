@@ -0,0 +1,47 @@
+# type: ignore
+import pandas as pd
+from pytest_mock.plugin import MockerFixture
+from sqlglot import expressions as exp
+
+from sqlmesh.core.engine_adapter import PostgresEngineAdapter
+
+
+def test_insert_append_pandas_df_copy(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock()
+    connection_mock.cursor.return_value = cursor_mock
+    copied = []
+    cursor_mock.copy_expert.side_effect = lambda sql, buffer: copied.append((sql, buffer.read()))
+
+    adapter = PostgresEngineAdapter(lambda: connection_mock)
+    adapter.insert_append(
+        "test_schema.test_table",
+        pd.DataFrame({"b": ["x", None, ""], "a": [1, 2, 3]}),
+        columns_to_types={"a": exp.DataType.build("int"), "b": exp.DataType.build("text")},
+    )
+
+    assert copied == [
+        (
+            """COPY "test_schema"."test_table" ("a", "b") FROM STDIN WITH (FORMAT csv, NULL '\\N')""",
+            "1,x\n2,\\N\n3,\n",
+        )
+    ]
+    cursor_mock.execute.assert_not_called()
+    cursor_mock.commit.assert_called_once()
+
+
+def test_insert_append_pandas_df_without_copy(mocker: MockerFixture):
+    connection_mock = mocker.NonCallableMock()
+    cursor_mock = mocker.Mock(spec=["execute", "fetchone", "fetchall"])
+    connection_mock.cursor.return_value = cursor_mock
+
+    adapter = PostgresEngineAdapter(lambda: connection_mock)
+    adapter.insert_append(
+        "test_table",
+        pd.DataFrame({"a": [1, 2]}),
+        columns_to_types={"a": exp.DataType.build("int")},
+    )
+
+    cursor_mock.execute.assert_called_once_with(
+        'INSERT INTO "test_table" ("a") SELECT CAST("a" AS INT) AS "a" FROM (VALUES (CAST(1 AS INT)), (2)) AS "t"("a")'
+    )
@@ -3,6 +3,7 @@ from sqlglot import exp, parse, parse_one
 
 from sqlmesh.core.audit import Audit, builtin
 from sqlmesh.core.model import IncrementalByTimeRangeKind, Model, create_sql_model
+from sqlmesh.core.renderer import render_cache
 from sqlmesh.utils.errors import AuditConfigError
 
 
@@ -180,6 +181,24 @@ def test_not_null_audit(model: Model):
     )
 
 
+def test_audit_render_cache(model: Model):
+    render_cache.clear()
+    columns = [exp.to_column("a")]
+
+    query = builtin.not_null_audit.render_query(model, start="2020-01-01", columns=columns)
+    assert render_cache.misses > 0
+    hits = render_cache.hits
+
+    assert builtin.not_null_audit.render_query(model, start="2020-01-01", columns=columns) == query
+    assert render_cache.hits > hits
+
+    assert builtin.not_null_audit.render_query(model, start="2020-01-02", columns=columns) != query
+    assert (
+        builtin.not_null_audit.render_query(model, start="2020-01-01", columns=[exp.to_column("b")])
+        != query
+    )
+
+
 def test_unique_values_audit(model: Model):
     rendered_query_a = builtin.unique_values_audit.render_query(model, columns=[exp.to_column("a")])
     assert (
@@ -4,13 +4,19 @@ from unittest import mock
 
 import pytest
 
-from sqlmesh.core.config import Config, DuckDBConnectionConfig, ModelDefaultsConfig
+from sqlmesh.core.config import (
+    BuiltInSchedulerConfig,
+    Config,
+    DuckDBConnectionConfig,
+    ModelDefaultsConfig,
+)
 from sqlmesh.core.config.loader import (
     load_config_from_env,
     load_config_from_paths,
     load_config_from_python_module,
 )
 from sqlmesh.core.notification_target import ConsoleNotificationTarget
+from sqlmesh.core.scheduler import SchedulingPolicyType
 from sqlmesh.core.user import User
 from sqlmesh.utils.errors import ConfigError
 
@@ -215,3 +221,27 @@ def test_load_config_from_python_module_invalid_config_object(tmp_path):
         match=r"^Config needs to be a valid object.*",
     ):
         load_config_from_python_module(config_path)
+
+
+def test_load_builtin_scheduler_config(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    with open(config_path, "w") as fd:
+        fd.write(
+            """
+scheduler:
+    type: builtin
+    scheduling_policy: longest_path
+    python_model_buffer_size: 4
+    python_model_chunk_rows: 1000
+    batch_audits: false
+        """
+        )
+
+    assert load_config_from_paths(config_path) == Config(
+        scheduler=BuiltInSchedulerConfig(
+            scheduling_policy=SchedulingPolicyType.LONGEST_PATH,
+            python_model_buffer_size=4,
+            python_model_chunk_rows=1000,
+            batch_audits=False,
+        )
+    )
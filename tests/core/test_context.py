@@ -3,14 +3,17 @@ from datetime import date
 
 import pytest
 from pytest_mock.plugin import MockerFixture
-from sqlglot import parse_one
+from sqlglot import exp, parse_one
 
 import sqlmesh.core.constants
-from sqlmesh.core.config import Config, ModelDefaultsConfig
+from sqlmesh.core.config import BuiltInSchedulerConfig, Config, ModelDefaultsConfig
 from sqlmesh.core.context import Context
 from sqlmesh.core.dialect import parse
+from sqlmesh.core.loader import SqlMeshLoader
 from sqlmesh.core.model import load_model
 from sqlmesh.core.plan import BuiltInPlanEvaluator, Plan
+from sqlmesh.core.snapshot import Snapshot
+from sqlmesh.core.snapshot import definition as snapshot_definition
 from sqlmesh.utils.date import yesterday_ds
 from sqlmesh.utils.errors import ConfigError
 from tests.utils.test_filesystem import create_temp_file
@@ -59,6 +62,18 @@ def test_config_parameter():
     assert context.physical_schema == "dev"
 
 
+def test_snapshot_evaluator_config():
+    config = Config(
+        scheduler=BuiltInSchedulerConfig(
+            python_model_buffer_size=4, python_model_chunk_rows=1000, batch_audits=False
+        )
+    )
+    context = Context(path="examples/sushi", config=config)
+    assert context.snapshot_evaluator.python_model_buffer_size == 4
+    assert context.snapshot_evaluator.python_model_chunk_rows == 1000
+    assert not context.snapshot_evaluator.batch_audits
+
+
 def test_config_not_found():
     with pytest.raises(
         ConfigError,
@@ -331,3 +346,177 @@ def test_plan_apply(sushi_context) -> None:
     )
     sushi_context.apply(plan)
     assert sushi_context.state_reader.get_environment("dev")
+
+
+def test_incremental_reload(tmpdir):
+    models_dir = pathlib.Path("models")
+    create_temp_file(
+        tmpdir,
+        pathlib.Path(models_dir, "a.sql"),
+        "MODEL(name db.a, kind full); SELECT 1::int AS x",
+    )
+    create_temp_file(
+        tmpdir,
+        pathlib.Path(models_dir, "b.sql"),
+        "MODEL(name db.b, kind full); SELECT * FROM db.a",
+    )
+    create_temp_file(
+        tmpdir,
+        pathlib.Path(models_dir, "c.sql"),
+        "MODEL(name db.c, kind full); SELECT 1::int AS y",
+    )
+
+    context = Context(path=str(tmpdir), config=Config())
+    models = dict(context.models)
+    assert list(models["db.b"].columns_to_types) == ["x"]
+
+    # Reloading without modifications doesn't parse any files.
+    context.load()
+    assert all(context.models[name] is model for name, model in models.items())
+
+    # Touching a file without modifying its content doesn't re-parse it either.
+    path = pathlib.Path(tmpdir, models_dir, "a.sql")
+    path.write_text(path.read_text())
+    context.load()
+    assert context.models["db.a"] is models["db.a"]
+
+    path.write_text("MODEL(name db.a, kind full); SELECT 1::int AS x, 2::int AS z")
+    context.load()
+    assert context.models["db.a"] is not models["db.a"]
+    assert context.models["db.b"] is models["db.b"]
+    assert context.models["db.c"] is models["db.c"]
+    # The schema change is propagated downstream.
+    assert list(context.models["db.b"].columns_to_types) == ["x", "z"]
+
+    pathlib.Path(tmpdir, models_dir, "c.sql").unlink()
+    context.load()
+    assert set(context.models) == {"db.a", "db.b"}
+
+
+def test_persistent_model_cache(tmpdir, mocker: MockerFixture):
+    models_dir = pathlib.Path("models")
+    create_temp_file(
+        tmpdir,
+        pathlib.Path(models_dir, "a.sql"),
+        "MODEL(name db.a, kind full); SELECT 1::int AS x",
+    )
+    create_temp_file(
+        tmpdir,
+        pathlib.Path(models_dir, "b.sql"),
+        "MODEL(name db.b, kind full); SELECT * FROM db.a",
+    )
+
+    context = Context(path=str(tmpdir), config=Config())
+    snapshots = context.snapshots
+
+    # A new context loads the parsed models and their inferred columns from the cache.
+    parse_sql_model = mocker.spy(SqlMeshLoader, "_parse_sql_model")
+    context = Context(path=str(tmpdir), config=Config())
+    parse_sql_model.assert_not_called()
+    assert context.models["db.a"]._path == pathlib.Path(tmpdir, models_dir, "a.sql")
+    assert context.models["db.b"].columns_to_types == {"x": exp.DataType.build("int")}
+    assert {name: snapshot.fingerprint for name, snapshot in context.snapshots.items()} == {
+        name: snapshot.fingerprint for name, snapshot in snapshots.items()
+    }
+
+    pathlib.Path(tmpdir, models_dir, "a.sql").write_text(
+        "MODEL(name db.a, kind full); SELECT 1::int AS x, 2::int AS z"
+    )
+    context = Context(path=str(tmpdir), config=Config())
+    assert parse_sql_model.call_count == 1
+    assert list(context.models["db.b"].columns_to_types) == ["x", "z"]
+
+
+def test_snapshots_cache(tmpdir, mocker: MockerFixture):
+    models_dir = pathlib.Path("models")
+    create_temp_file(
+        tmpdir, pathlib.Path(models_dir, "a.sql"), "MODEL(name db.a, kind full); SELECT 1 AS x"
+    )
+    create_temp_file(
+        tmpdir, pathlib.Path(models_dir, "b.sql"), "MODEL(name db.b, kind full); SELECT x FROM db.a"
+    )
+    create_temp_file(
+        tmpdir, pathlib.Path(models_dir, "c.sql"), "MODEL(name db.c, kind full); SELECT 1 AS y"
+    )
+
+    context = Context(path=str(tmpdir), config=Config())
+    from_model = mocker.spy(Snapshot, "from_model")
+    get_snapshots = mocker.spy(context.state_reader, "get_snapshots")
+
+    snapshots = context.snapshots
+    assert from_model.call_count == 3
+
+    # Cached snapshots are reused but never shared with the caller.
+    assert context.snapshots == snapshots
+    assert context.snapshots["db.a"] is not snapshots["db.a"]
+    assert from_model.call_count == 3
+
+    snapshots["db.a"].intervals.append((0, 1))
+    snapshots["db.a"].indirect_versions["db.b"] = ()
+    context.local_snapshots["db.a"].dev_intervals.append((0, 1))
+    for snapshot in (context.snapshots["db.a"], context.local_snapshots["db.a"]):
+        assert not snapshot.intervals
+        assert not snapshot.dev_intervals
+        assert not snapshot.indirect_versions
+
+    # Only the snapshots of the modified model and its downstream dependents are regenerated.
+    context.upsert_model("db.a", owner="owner")
+    assert context.snapshots["db.c"].fingerprint == snapshots["db.c"].fingerprint
+    assert from_model.call_count == 5
+
+    context.load()
+    assert context.snapshots["db.a"].fingerprint == snapshots["db.a"].fingerprint
+    assert from_model.call_count == 7
+
+    # Stored snapshots are reused until the context modifies the state.
+    context.plan(auto_apply=True, no_prompts=True)
+    get_snapshots.reset_mock()
+    stored_snapshots = context.snapshots
+    assert all(snapshot.version for snapshot in stored_snapshots.values())
+    assert context.snapshots == stored_snapshots
+    assert get_snapshots.call_count == 1
+
+    stored_intervals = stored_snapshots["db.a"].intervals.copy()
+    stored_snapshots["db.a"].add_interval("2000-01-01", "2000-01-01")
+    assert context.snapshots["db.a"].intervals == stored_intervals
+
+
+def test_fingerprint_index(tmpdir, mocker: MockerFixture):
+    models_dir = pathlib.Path("models")
+    # A synthetic DAG in which every model depends on the two models preceding it.
+    for i in range(20):
+        sources = [f"db.m{j}" for j in range(max(i - 2, 0), i)]
+        query = (
+            f"SELECT {' + '.join(f'{source}.x' for source in sources)} AS x FROM {', '.join(sources)}"
+            if sources
+            else "SELECT 1 AS x"
+        )
+        create_temp_file(
+            tmpdir,
+            pathlib.Path(models_dir, f"m{i}.sql"),
+            f"MODEL(name db.m{i}, kind full); {query}",
+        )
+
+    fingerprints = {
+        name: snapshot.fingerprint
+        for name, snapshot in Context(path=str(tmpdir), config=Config()).snapshots.items()
+    }
+
+    # The hashes of unchanged models are read from the index.
+    model_data_hash = mocker.spy(snapshot_definition, "_model_data_hash")
+    context = Context(path=str(tmpdir), config=Config())
+    assert {name: snapshot.fingerprint for name, snapshot in context.snapshots.items()} == (
+        fingerprints
+    )
+    model_data_hash.assert_not_called()
+
+    # Only the modified model is hashed again, while the fingerprints of its downstream dependents change.
+    pathlib.Path(tmpdir, models_dir, "m17.sql").write_text(
+        "MODEL(name db.m17, kind full); SELECT db.m15.x * db.m16.x AS x FROM db.m15, db.m16"
+    )
+    context = Context(path=str(tmpdir), config=Config())
+    snapshots = context.snapshots
+    assert model_data_hash.call_count == 1
+    assert {
+        name for name, snapshot in snapshots.items() if snapshot.fingerprint != fingerprints[name]
+    } == {"db.m17", "db.m18", "db.m19"}
@@ -1,12 +1,16 @@
 from datetime import datetime
 from pathlib import Path
 
+import duckdb
 import pytest
+from croniter import croniter, croniter_range
 from sqlglot import exp, parse, parse_one
+from sqlglot.schema import MappingSchema
 
 import sqlmesh.core.dialect as d
 from sqlmesh.core.config import Config
 from sqlmesh.core.context import Context, ExecutionContext
+from sqlmesh.core.engine_adapter import create_engine_adapter
 from sqlmesh.core.hooks import hook
 from sqlmesh.core.model import (
     IncrementalByTimeRangeKind,
@@ -18,6 +22,7 @@ from sqlmesh.core.model import (
     load_model,
     model,
 )
+from sqlmesh.core.renderer import ExpressionRenderer, RenderCache
 from sqlmesh.utils.date import to_date, to_datetime, to_timestamp
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.metaprogramming import Executable
@@ -523,6 +528,24 @@ def test_cron():
     )
 
 
+@pytest.mark.parametrize("cron", ["@daily", "1 * * * *", "*/5 * * * *"])
+def test_cron_fixed_period_matches_croniter(cron):
+    model = ModelMeta(name="x", cron=cron)
+    normalized = model.normalized_cron()
+    assert model.cron_period is not None
+
+    for value in ("2020-01-01 00:00:00", "2020-01-01 10:01:30", "2020-02-29 23:59:59"):
+        schedule = croniter(normalized, to_datetime(value))
+        assert to_timestamp(model.cron_next(value)) == to_timestamp(schedule.get_next())
+        schedule = croniter(normalized, to_datetime(value))
+        assert to_timestamp(model.cron_prev(value)) == to_timestamp(schedule.get_prev())
+
+    start, end = to_datetime("2020-01-01 00:00:30"), to_datetime("2020-01-02 03:00:00")
+    assert model.cron_ticks(start, end) == [
+        to_timestamp(tick) for tick in croniter_range(start, end, normalized)
+    ]
+
+
 def test_render_query(assert_exp_eq):
     model = SqlModel(
         name="test",
@@ -566,6 +589,116 @@ def test_render_query(assert_exp_eq):
     )
 
 
+def test_render_cache():
+    cache = RenderCache(max_entries=2)
+    query_a, query_b, query_c = parse_one("SELECT a"), parse_one("SELECT b"), parse_one("SELECT c")
+
+    cache.put(("a",), query_a)
+    cache.put(("b",), query_b)
+    assert cache.get(("a",)) is query_a
+    cache.put(("c",), query_c)
+
+    assert len(cache) == 2
+    assert cache.get(("b",)) is None
+    assert cache.get(("c",)) is query_c
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_render_query_template(mocker):
+    def create_model() -> SqlModel:
+        return SqlModel(
+            name="test",
+            kind=IncrementalByTimeRangeKind(time_column="ds"),
+            dialect="duckdb",
+            query=parse_one(
+                "SELECT @start_ds AS start_ds, @end_date AS end_date, @latest_millis AS latest, ds "
+                "FROM x WHERE y BETWEEN @start_ts AND @end_ts",
+                read="duckdb",
+            ),
+        )
+
+    model = create_model()
+    assert model._query_renderer.is_templatable
+    render_spy = mocker.spy(ExpressionRenderer, "render")
+    rendered = [
+        model.render_query(start=day, end=day, latest="2022-01-01")
+        for day in ("2020-01-01", "2020-01-02", "2021-05-06")
+    ]
+    assert render_spy.call_count == 1
+
+    expected_model = create_model()
+    expected_model._query_renderer._is_templatable = False
+    assert rendered == [
+        expected_model.render_query(start=day, end=day, latest="2022-01-01")
+        for day in ("2020-01-01", "2020-01-02", "2021-05-06")
+    ]
+    assert rendered[2].sql(dialect="duckdb") == (
+        "SELECT '2021-05-06' AS start_ds, CAST('2021-05-06T23:59:59.999000+00:00' AS TIMESTAMP) AS end_date, "
+        "1640995200000 AS latest, x.ds AS ds FROM x AS x "
+        "WHERE x.ds <= CAST('2021-05-06T23:59:59.999000+00:00' AS TIMESTAMP) "
+        "AND x.ds >= CAST('2021-05-06T00:00:00+00:00' AS TIMESTAMP) AND x.y <= '2021-05-06T23:59:59.999000+00:00' AND x.y >= '2021-05-06T00:00:00+00:00'"
+    )
+    assert model.columns_to_types == expected_model.columns_to_types
+
+    not_templatable = SqlModel(
+        name="test",
+        query=parse_one("SELECT @EACH([1, 2], x -> x) FROM x WHERE y = @start_ds"),
+    )
+    assert not not_templatable._query_renderer.is_templatable
+
+
+def test_render_query_cache_isolation(mocker):
+    model = SqlModel(
+        name="test",
+        dialect="duckdb",
+        query=parse_one("SELECT a, ds FROM cache_isolation", read="duckdb"),
+    )
+    renderer = model._query_renderer
+
+    # Modifying a rendered query doesn't affect the cached one.
+    renderer.render().select("b", copy=False)
+    assert "b" not in renderer.render().named_selects
+
+    # Queries rendered with kwargs which can't be keyed are not cached.
+    render_spy = mocker.spy(ExpressionRenderer, "render")
+    renderer.render(start="2022-01-01", some_object=object())
+    renderer.render(start="2022-01-01", some_object=object())
+    assert render_spy.call_count == 2
+
+    render_spy.reset_mock()
+    engine_adapter = create_engine_adapter(duckdb.connect, "duckdb")
+    renderer.render(start="2022-01-02", engine_adapter=engine_adapter)
+    renderer.render(start="2022-01-02", engine_adapter=engine_adapter)
+    assert render_spy.call_count == 1
+
+
+def test_render_query_schema_key():
+    model = SqlModel(
+        name="db.test",
+        dialect="duckdb",
+        query=parse_one("SELECT a FROM db.upstream", read="duckdb"),
+    )
+    renderer = model._query_renderer
+
+    schema = MappingSchema(dialect="duckdb")
+    schema.add_table("db.upstream", {"a": exp.DataType.build("int")})
+    model.update_schema(schema)
+    schema_key = renderer._schema_key
+
+    # Tables which aren't referenced by the query don't change the key.
+    schema.add_table("db.unrelated", {"b": exp.DataType.build("int")})
+    model.update_schema(schema)
+    assert renderer._schema_key == schema_key
+
+    schema.add_table("db.upstream", {"a": exp.DataType.build("text")})
+    model.update_schema(schema)
+    assert renderer._schema_key != schema_key
+
+
 def test_time_column():
     expressions = parse(
         """
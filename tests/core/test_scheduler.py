@@ -2,9 +2,17 @@ import pytest
 from sqlglot import parse_one
 
 from sqlmesh.core import constants as c
+from sqlmesh.core.config import DuckDBConnectionConfig
 from sqlmesh.core.context import Context
-from sqlmesh.core.scheduler import Scheduler
-from sqlmesh.core.snapshot import Snapshot, SnapshotFingerprint
+from sqlmesh.core.model import IncrementalByTimeRangeKind, SqlModel
+from sqlmesh.core.scheduler import (
+    ExecutorType,
+    IntervalCommitBuffer,
+    Scheduler,
+    SchedulingPolicyType,
+)
+from sqlmesh.core.snapshot import Snapshot, SnapshotEvaluator, SnapshotFingerprint
+from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.date import to_datetime
 
 
@@ -129,3 +137,253 @@ def test_run(sushi_context_fixed_date: Context, scheduler: Scheduler):
         )
         == (0, "Hotate", 5.99)
     )
+
+
+def test_dag_interval_dependencies(scheduler: Scheduler, sushi_context_fixed_date: Context):
+    orders = sushi_context_fixed_date.snapshots["sushi.orders"]
+    waiter_revenue = sushi_context_fixed_date.snapshots["sushi.waiter_revenue_by_day"]
+    customers = sushi_context_fixed_date.snapshots["sushi.customers"]
+
+    batches = scheduler.batches("2022-01-01", "2022-02-05", "2022-02-05")
+    dag = scheduler._dag(batches)
+
+    first_orders_interval = (to_datetime("2022-01-01"), to_datetime("2022-01-31"))
+    last_orders_interval = (to_datetime("2022-01-31"), to_datetime("2022-02-06"))
+
+    def upstream_orders(node):
+        return {dep for dep in dag.graph[node] if dep[0] == orders}
+
+    # Incremental children only depend on the overlapping intervals of their parents.
+    assert upstream_orders(
+        (waiter_revenue, (to_datetime("2022-01-01"), to_datetime("2022-01-11")))
+    ) == {(orders, first_orders_interval)}
+    assert upstream_orders(
+        (waiter_revenue, (to_datetime("2022-01-31"), to_datetime("2022-02-06")))
+    ) == {(orders, last_orders_interval)}
+
+    # Non-incremental children depend on all intervals of their parents.
+    customers_node = next(node for node in dag.graph if node[0] == customers)
+    assert upstream_orders(customers_node) == {
+        (orders, first_orders_interval),
+        (orders, last_orders_interval),
+    }
+
+
+def test_run_with_scheduling_policy(sushi_context_fixed_date: Context, mocker):
+    console = mocker.Mock()
+    scheduler = Scheduler(
+        sushi_context_fixed_date.snapshots.values(),
+        sushi_context_fixed_date.snapshot_evaluator,
+        sushi_context_fixed_date.state_sync,
+        console=console,
+        scheduling_policy=SchedulingPolicyType.LONGEST_PATH,
+    )
+    assert scheduler.run(c.PROD, "2022-01-01", "2022-01-03", "2022-01-30")
+    assert "sushi.items" in scheduler.run_durations
+    console.log_status_update.assert_not_called()
+
+    scheduler.run(c.PROD, "2022-01-01", "2022-01-05", "2022-01-30")
+    assert console.log_status_update.call_args[0][0].startswith("Expected run time:")
+
+
+def test_run_durations_exclude_commits(sushi_context_fixed_date: Context, mocker):
+    scheduler = Scheduler(
+        sushi_context_fixed_date.snapshots.values(),
+        sushi_context_fixed_date.snapshot_evaluator,
+        sushi_context_fixed_date.state_sync,
+        console=mocker.Mock(),
+        commit_max_intervals=1,
+    )
+    # Time only passes while intervals are being committed.
+    clock = 0.0
+    mocker.patch("sqlmesh.core.scheduler.time.perf_counter", side_effect=lambda: clock)
+    add_intervals = scheduler.state_sync.add_intervals
+
+    def slow_add_intervals(*args, **kwargs):
+        nonlocal clock
+        clock += 1000.0
+        return add_intervals(*args, **kwargs)
+
+    mocker.patch.object(scheduler.state_sync, "add_intervals", side_effect=slow_add_intervals)
+
+    assert scheduler.run(c.PROD, "2022-01-01", "2022-01-03", "2022-01-30")
+    assert clock
+    assert scheduler.run_durations
+    assert not any(scheduler.run_durations.values())
+
+
+def test_run_commits_intervals_in_batches(sushi_context_fixed_date: Context, mocker):
+    console = mocker.Mock()
+    scheduler = Scheduler(
+        sushi_context_fixed_date.snapshots.values(),
+        sushi_context_fixed_date.snapshot_evaluator,
+        sushi_context_fixed_date.state_sync,
+        console=console,
+        commit_max_intervals=3,
+        commit_max_wait_secs=3600,
+    )
+    add_intervals = mocker.spy(scheduler.state_sync, "add_intervals")
+    batches = scheduler.batches("2022-01-01", "2022-01-03", "2022-01-30")
+    intervals_num = sum(len(intervals) for intervals in batches.values())
+
+    assert scheduler.run(c.PROD, "2022-01-01", "2022-01-03", "2022-01-30")
+
+    assert add_intervals.call_count == -(-intervals_num // 3)
+    assert not any(scheduler.batches("2022-01-01", "2022-01-03", "2022-01-30").values())
+    assert (
+        sum(call.args[1] for call in console.update_snapshot_progress.call_args_list)
+        == intervals_num
+    )
+
+
+def test_run_reports_commit_errors(sushi_context_fixed_date: Context, mocker):
+    console = mocker.Mock()
+    scheduler = Scheduler(
+        sushi_context_fixed_date.snapshots.values(),
+        sushi_context_fixed_date.snapshot_evaluator,
+        sushi_context_fixed_date.state_sync,
+        console=console,
+        commit_max_intervals=1,
+        commit_max_wait_secs=3600,
+    )
+    add_intervals = scheduler.state_sync.add_intervals
+    failed = False
+
+    def fail_first_commit(*args, **kwargs):
+        nonlocal failed
+        if not failed:
+            failed = True
+            raise ValueError("commit failed")
+        return add_intervals(*args, **kwargs)
+
+    mocker.patch.object(scheduler.state_sync, "add_intervals", side_effect=fail_first_commit)
+
+    # A failed commit doesn't fail the evaluation and its intervals are committed by the next flush.
+    assert scheduler.run(c.PROD, "2022-01-01", "2022-01-03", "2022-01-30")
+    assert not any(scheduler.batches("2022-01-01", "2022-01-03", "2022-01-30").values())
+    (error_message,) = [call.args[0] for call in console.log_error.call_args_list]
+    assert error_message.startswith("FAILED committing processed intervals")
+
+    console.reset_mock()
+    mocker.patch.object(
+        scheduler.state_sync, "add_intervals", side_effect=ValueError("commit failed")
+    )
+    assert not scheduler.run(c.PROD, "2022-01-01", "2022-01-05", "2022-01-30")
+    error_messages = [call.args[0] for call in console.log_error.call_args_list]
+    assert not any(message.startswith("FAILED processing") for message in error_messages)
+    assert error_messages[-1].endswith("were not committed and will be processed again")
+
+
+def test_commit_buffer_retries_at_final_flush(make_snapshot, mocker):
+    snapshot = make_snapshot(SqlModel(name="a", query=parse_one("SELECT 1, ds")), version="a")
+    state_sync = mocker.Mock()
+    state_sync.add_intervals.side_effect = ValueError("commit failed")
+    commit_buffer = IntervalCommitBuffer(
+        state_sync, mocker.Mock(), max_intervals=1, max_wait_secs=0
+    )
+
+    for day in ("2022-01-01", "2022-01-02", "2022-01-03"):
+        commit_buffer.add(snapshot, day, day)
+        commit_buffer.flush_if_due()
+
+    # The failed commit isn't retried by later additions.
+    assert state_sync.add_intervals.call_count == 1
+    assert len(commit_buffer.errors) == 1
+    assert commit_buffer.pending == 3
+
+    state_sync.add_intervals.side_effect = None
+    commit_buffer.flush()
+    assert state_sync.add_intervals.call_count == 2
+    assert len(list(state_sync.add_intervals.call_args[0][0])) == 3
+    assert not commit_buffer.pending
+
+
+def test_commit_buffer_flushes_on_failure(sushi_context_fixed_date: Context, mocker):
+    scheduler = Scheduler(
+        sushi_context_fixed_date.snapshots.values(),
+        sushi_context_fixed_date.snapshot_evaluator,
+        sushi_context_fixed_date.state_sync,
+        console=mocker.Mock(),
+        commit_max_intervals=1000,
+        commit_max_wait_secs=3600,
+    )
+    evaluate = scheduler.snapshot_evaluator.evaluate
+
+    def fail_on_waiter_revenue(snapshot, *args, **kwargs):
+        if snapshot.name == "sushi.waiter_revenue_by_day":
+            raise ValueError("failed")
+        return evaluate(snapshot, *args, **kwargs)
+
+    mocker.patch.object(scheduler.snapshot_evaluator, "evaluate", fail_on_waiter_revenue)
+
+    assert not scheduler.run(c.PROD, "2022-01-01", "2022-01-03", "2022-01-30")
+
+    remaining = {
+        s.name
+        for s, intervals in scheduler.batches("2022-01-01", "2022-01-03", "2022-01-30").items()
+        if intervals
+    }
+    assert "sushi.waiter_revenue_by_day" in remaining
+    assert "sushi.orders" not in remaining
+
+
+class _MultiprocessDuckDBConnectionConfig(DuckDBConnectionConfig):
+    # The database file is only opened by one process at a time in these tests.
+    @property
+    def is_multiprocess_safe(self) -> bool:
+        return True
+
+
+def test_run_in_worker_processes(tmp_path, make_snapshot, mocker):
+    connection_config = _MultiprocessDuckDBConnectionConfig(database=str(tmp_path / "db.duckdb"))
+    snapshot = make_snapshot(
+        SqlModel(
+            name="db.model",
+            kind=IncrementalByTimeRangeKind(time_column="ds"),
+            start="2022-01-01",
+            query=parse_one("SELECT a, ds FROM src"),
+        )
+    )
+    snapshot.set_version()
+
+    adapter = connection_config.create_engine_adapter()
+    adapter.execute("CREATE TABLE src AS SELECT 1 AS a, DATE '2022-01-01' AS ds")
+    SnapshotEvaluator(adapter).create([snapshot], {})
+    adapter.close()
+
+    state_sync = mocker.Mock()
+    state_sync.get_snapshots_with_same_version.return_value = []
+
+    with pytest.raises(ConfigError, match="A connection configuration is required"):
+        Scheduler([snapshot], mocker.Mock(), state_sync, executor_type=ExecutorType.PROCESS)
+
+    with pytest.raises(
+        ConfigError, match="can't be evaluated in worker processes with the 'duckdb'"
+    ):
+        Scheduler(
+            [snapshot],
+            mocker.Mock(),
+            state_sync,
+            executor_type=ExecutorType.PROCESS,
+            connection_config=DuckDBConnectionConfig(database=str(tmp_path / "db.duckdb")),
+        )
+
+    scheduler = Scheduler(
+        [snapshot],
+        mocker.MagicMock(),
+        state_sync,
+        console=mocker.Mock(),
+        executor_type=ExecutorType.PROCESS,
+        connection_config=connection_config,
+    )
+    assert scheduler.run(c.PROD, "2022-01-01", "2022-01-01", "2022-01-02")
+
+    scheduler.snapshot_evaluator.evaluate.assert_not_called()
+    state_sync.add_intervals.assert_called_once()
+    assert list(state_sync.add_intervals.call_args[0][0]) == [
+        (snapshot, to_datetime("2022-01-01"), to_datetime("2022-01-02"))
+    ]
+
+    adapter = connection_config.create_engine_adapter()
+    assert adapter.fetchall(f"SELECT a FROM {snapshot.table_name()}") == [(1,)]
+    adapter.close()
@@ -1,4 +1,5 @@
 import json
+import random
 from pathlib import Path
 
 import pytest
@@ -24,6 +25,7 @@ from sqlmesh.core.snapshot import (
     categorize_change,
     fingerprint_from_model,
 )
+from sqlmesh.core.snapshot.definition import uncovered_intervals
 from sqlmesh.utils.date import to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroInfo
@@ -209,6 +211,48 @@ def test_missing_intervals(snapshot: Snapshot):
     ]
 
 
+def test_uncovered_intervals():
+    intervals = [(2, 4), (6, 8), (8, 10), (12, 14)]
+    assert uncovered_intervals([], 0, 10) == [(0, 10)]
+    assert uncovered_intervals(intervals, 0, 16) == [(0, 2), (4, 6), (10, 12), (14, 16)]
+    assert uncovered_intervals(intervals, 3, 13) == [(4, 6), (10, 12)]
+    assert uncovered_intervals(intervals, 6, 10) == []
+    assert uncovered_intervals(intervals, 9, 11) == [(10, 11)]
+    assert uncovered_intervals(intervals, 15, 20) == [(15, 20)]
+
+
+def test_missing_intervals_matches_linear_scan(snapshot: Snapshot):
+    def linear_scan(start, end):
+        missing = []
+        start_ts, end_ts = snapshot._inclusive_exclusive(start, end)
+        day = 86400000
+        for current_ts in range(start_ts, end_ts, day):
+            for low, high in snapshot.intervals:
+                if current_ts < low:
+                    missing.append((current_ts, current_ts + day))
+                    break
+                elif current_ts < high:
+                    break
+            else:
+                missing.append((current_ts, current_ts + day))
+        return missing
+
+    rng = random.Random(42)
+    base = to_timestamp("2020-01-01")
+    day = 86400000
+
+    for _ in range(20):
+        snapshot.intervals = []
+        for _ in range(rng.randint(0, 10)):
+            low = base + rng.randint(0, 60) * day
+            snapshot.add_interval(low, low + rng.randint(1, 5) * day)
+
+        for _ in range(10):
+            start = base + rng.randint(0, 70) * day
+            end = start + rng.randint(1, 20) * day
+            assert snapshot.missing_intervals(start, end) == linear_scan(start, end)
+
+
 def test_seed_intervals(make_snapshot):
     snapshot_a = make_snapshot(
         SeedModel(
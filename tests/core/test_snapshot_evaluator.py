@@ -1,7 +1,9 @@
 import typing as t
 from datetime import datetime
-from unittest.mock import call
+from pathlib import Path
+from unittest.mock import MagicMock, call
 
+import pandas as pd
 import pytest
 from pytest_mock.plugin import MockerFixture
 from sqlglot import expressions as exp
@@ -16,6 +18,7 @@ from sqlmesh.core.model import (
     ModelKindName,
     SqlModel,
     load_model,
+    model,
 )
 from sqlmesh.core.model.meta import IntervalUnit
 from sqlmesh.core.schema_diff import SchemaDelta
@@ -25,7 +28,7 @@ from sqlmesh.core.snapshot import (
     SnapshotFingerprint,
     SnapshotTableInfo,
 )
-from sqlmesh.utils.errors import ConfigError, SQLMeshError
+from sqlmesh.utils.errors import AuditError, ConfigError, SQLMeshError
 
 
 @pytest.fixture
@@ -302,6 +305,49 @@ def test_migrate_duckdb(snapshot: Snapshot, duck_conn, make_snapshot):
     ]
 
 
+@pytest.mark.parametrize("batch_audits", [True, False])
+def test_audit_duckdb(duck_conn, make_snapshot, mocker: MockerFixture, batch_audits: bool):
+    duck_conn.execute("CREATE VIEW tbl AS SELECT * FROM (VALUES (1, NULL), (1, 2)) AS t(a, b)")
+    model = load_model(
+        parse(  # type: ignore
+            """
+        MODEL (
+            name db.model,
+            audits (
+                not_null(columns=[a]),
+                unique_values(columns=[a]),
+                not_null(columns=[b]),
+            ),
+        );
+
+        SELECT a::int AS a, b::int AS b FROM tbl
+        """
+        )
+    )
+    snapshot = make_snapshot(model)
+    snapshot.set_version()
+
+    adapter = create_engine_adapter(lambda: duck_conn, "duckdb")
+    evaluator = SnapshotEvaluator(adapter, batch_audits=batch_audits)
+    evaluator.create([snapshot], {})
+    evaluator.evaluate(snapshot, "2020-01-01", "2020-01-01", "2020-01-01", snapshots={})
+
+    fetchone_spy = mocker.spy(adapter, "fetchone")
+    fetchall_spy = mocker.spy(adapter, "fetchall")
+    results = evaluator.audit(snapshot=snapshot, snapshots={}, raise_exception=False)
+
+    assert [(result.audit.name, result.count) for result in results] == [
+        ("not_null", 0),
+        ("unique_values", 1),
+        ("not_null", 1),
+    ]
+    assert fetchall_spy.call_count == (1 if batch_audits else 0)
+    assert fetchone_spy.call_count == (0 if batch_audits else 3)
+
+    with pytest.raises(AuditError, match="Audit 'unique_values' for model 'db.model' failed"):
+        evaluator.audit(snapshot=snapshot, snapshots={})
+
+
 def test_audit_unversioned(mocker: MockerFixture, adapter_mock, make_snapshot):
     evaluator = SnapshotEvaluator(adapter_mock)
 
@@ -318,3 +364,30 @@ def test_audit_unversioned(mocker: MockerFixture, adapter_mock, make_snapshot):
         match="Cannot audit 'db.model' because it has not been versioned yet. Apply a plan first.",
     ):
         evaluator.audit(snapshot=snapshot, snapshots={})
+
+
+def test_evaluate_python_model_streaming(duck_conn, make_snapshot):
+    @model(name="db.python_model", kind="full", columns={"a": "int"})
+    def produce(context, **kwargs):
+        for i in range(5):
+            yield pd.DataFrame({"a": [i, i]})
+
+    python_model = model.get_registry()["db.python_model"].model(
+        module_path=Path("."), path=Path(".")
+    )
+    snapshot = make_snapshot(python_model)
+    snapshot.set_version()
+
+    adapter = create_engine_adapter(lambda: duck_conn, "duckdb")
+    evaluator = SnapshotEvaluator(adapter, python_model_buffer_size=2, python_model_chunk_rows=4)
+    evaluator.create([snapshot], {})
+
+    insert_append_spy = MagicMock(wraps=adapter.insert_append)
+    adapter.insert_append = insert_append_spy  # type: ignore
+    evaluator.evaluate(snapshot, "2020-01-01", "2020-01-01", "2020-01-01", snapshots={})
+
+    assert sorted(
+        row[0] for row in duck_conn.execute(f"SELECT a FROM {snapshot.table_name()}").fetchall()
+    ) == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+    # The outputs are coalesced into chunks of 4, 4 and 2 rows.
+    assert insert_append_spy.call_count == 2
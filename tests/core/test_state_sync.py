@@ -14,9 +14,10 @@ from sqlmesh.core.model import (
     ModelKindName,
     SqlModel,
 )
-from sqlmesh.core.snapshot import Snapshot, SnapshotTableInfo
-from sqlmesh.core.state_sync import EngineAdapterStateSync
+from sqlmesh.core.snapshot import Snapshot, SnapshotId, SnapshotTableInfo
+from sqlmesh.core.state_sync import EngineAdapterStateSync, SnapshotCatalog
 from sqlmesh.core.state_sync.base import SCHEMA_VERSION, SQLGLOT_VERSION, Versions
+from sqlmesh.core.state_sync.engine_adapter import RecordedInterval
 from sqlmesh.utils.date import now_timestamp, to_datetime, to_ds, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError
 
@@ -206,6 +207,113 @@ def test_snapshots_exists(state_sync: EngineAdapterStateSync, snapshots: t.List[
     assert state_sync.snapshots_exist(snapshot_ids) == snapshot_ids
 
 
+def test_snapshot_filters_are_batched(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(state_sync, "SNAPSHOT_BATCH_SIZE", 2)
+    snapshots = [
+        make_snapshot(
+            SqlModel(name=name, query=parse_one(f"select {i}, ds")),
+            version=name,
+        )
+        for name in ("a", "b")
+        for i in range(3)
+    ]
+    snapshot_ids = [snapshot.snapshot_id for snapshot in snapshots]
+
+    filters = [f.sql() for f in state_sync._snapshot_id_filter(snapshot_ids + snapshot_ids)]
+    assert filters == [
+        f"name = 'a' AND identifier IN ('{snapshot_ids[0].identifier}', '{snapshot_ids[1].identifier}')",
+        f"(name = 'a' AND identifier IN ('{snapshot_ids[2].identifier}')) OR (name = 'b' AND identifier IN ('{snapshot_ids[3].identifier}'))",
+        f"name = 'b' AND identifier IN ('{snapshot_ids[4].identifier}', '{snapshot_ids[5].identifier}')",
+    ]
+    assert not list(state_sync._snapshot_id_filter([]))
+
+    state_sync.push_snapshots(snapshots)
+    assert set(state_sync.get_snapshots(snapshot_ids)) == set(snapshot_ids)
+    assert state_sync.snapshots_exist(snapshot_ids) == set(snapshot_ids)
+    assert len(state_sync.get_snapshots_with_same_version(snapshots)) == 6
+
+    state_sync.delete_snapshots(snapshot_ids[1:])
+    assert set(state_sync.get_snapshots(snapshot_ids)) == {snapshot_ids[0]}
+
+
+def test_get_snapshots_by_models(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    snapshots: t.List[Snapshot],
+    mocker: MockerFixture,
+) -> None:
+    snapshot_a_new = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 3, ds")),
+        version="a_new",
+    )
+    state_sync.push_snapshots(snapshots + [snapshot_a_new])
+    state_sync.add_interval(snapshot_a_new, "2020-01-01", "2020-01-01")
+
+    fetchall = mocker.spy(state_sync.engine_adapter, "fetchall")
+
+    stored_snapshots = state_sync.get_snapshots_by_models("a", "c")
+    assert {s.snapshot_id for s in stored_snapshots} == {
+        snapshots[0].snapshot_id,
+        snapshot_a_new.snapshot_id,
+    }
+    assert next(s for s in stored_snapshots if s.version == "a_new").intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-02"))
+    ]
+    assert "\"name\" IN ('a', 'c')" in state_sync.engine_adapter._to_sql(
+        fetchall.call_args_list[0][0][0]
+    )
+
+    assert not state_sync.get_snapshots_by_models()
+
+
+def test_get_snapshot_summaries(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    snapshots: t.List[Snapshot],
+    mocker: MockerFixture,
+) -> None:
+    snapshot_a = snapshots[0]
+    snapshot_a.add_interval("2020-01-01", "2020-01-01")
+    state_sync.push_snapshots(snapshots)
+    state_sync.add_interval(snapshot_a, "2020-01-02", "2020-01-02")
+    state_sync.unpause_snapshots([snapshot_a], "2020-01-03")
+
+    parse_raw = mocker.spy(Snapshot, "parse_raw")
+    summaries = state_sync.get_snapshot_summaries(None)
+    parse_raw.assert_not_called()
+
+    assert set(summaries) == {s.snapshot_id for s in snapshots}
+    summary_a = summaries[snapshot_a.snapshot_id]
+    assert summary_a.table_info == snapshot_a.table_info
+    assert summary_a.intervals == [(to_timestamp("2020-01-01"), to_timestamp("2020-01-03"))]
+    assert summary_a.unpaused_ts == to_timestamp("2020-01-03")
+
+    assert list(state_sync.get_snapshot_summaries([snapshots[1]])) == [snapshots[1].snapshot_id]
+
+
+def test_delete_expired_snapshots(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+) -> None:
+    now_ts = now_timestamp()
+
+    snapshot = make_snapshot(SqlModel(name="a", query=parse_one("select 1, ds")), version="a")
+    snapshot.ttl = "in 10 seconds"
+    snapshot.updated_ts = now_ts - 15000
+
+    new_snapshot = make_snapshot(SqlModel(name="a", query=parse_one("select 2, ds")), version="b")
+    new_snapshot.ttl = "in 10 seconds"
+    new_snapshot.updated_ts = now_ts - 5000
+
+    state_sync.push_snapshots([snapshot, new_snapshot])
+
+    parse_raw = mocker.spy(Snapshot, "parse_raw")
+    assert state_sync.delete_expired_snapshots() == [snapshot.table_info]
+    parse_raw.assert_not_called()
+    assert set(state_sync.get_snapshots(None)) == {new_snapshot.snapshot_id}
+
+
 def test_add_interval(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable) -> None:
     snapshot = make_snapshot(
         SqlModel(
@@ -239,6 +347,170 @@ def test_add_interval(state_sync: EngineAdapterStateSync, make_snapshot: t.Calla
     ]
 
 
+def test_add_interval_appends_row(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
+) -> None:
+    snapshot = make_snapshot(
+        SqlModel(
+            name="a",
+            cron="@daily",
+            query=parse_one("select 1, ds"),
+        ),
+        version="a",
+    )
+    state_sync.push_snapshots([snapshot])
+    stored_payload = state_sync.engine_adapter.fetchone(
+        exp.select("snapshot").from_(state_sync.snapshots_table)
+    )[0]
+
+    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-02")
+    state_sync.add_interval(snapshot, "2020-01-03", "2020-01-03", is_dev=True)
+
+    assert (
+        state_sync.engine_adapter.fetchone(
+            exp.select("snapshot").from_(state_sync.snapshots_table)
+        )[0]
+        == stored_payload
+    )
+    assert state_sync.engine_adapter.fetchall(
+        exp.select("start_ts", "end_ts", "is_dev")
+        .from_(state_sync.intervals_table)
+        .order_by("start_ts")
+    ) == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-03"), False),
+        (to_timestamp("2020-01-03"), to_timestamp("2020-01-04"), True),
+    ]
+
+    stored_snapshot = state_sync.get_snapshots([snapshot])[snapshot.snapshot_id]
+    assert stored_snapshot.intervals == [(to_timestamp("2020-01-01"), to_timestamp("2020-01-03"))]
+    assert stored_snapshot.dev_intervals == [
+        (to_timestamp("2020-01-03"), to_timestamp("2020-01-04"))
+    ]
+
+    assert state_sync.get_snapshots_with_same_version([snapshot])[0].intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-03"))
+    ]
+
+
+def test_add_intervals(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable) -> None:
+    snapshot_a = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")),
+        version="a",
+    )
+    snapshot_b = make_snapshot(
+        SqlModel(name="b", cron="@daily", query=parse_one("select 2, ds")),
+        version="b",
+    )
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+
+    with pytest.raises(SQLMeshError, match=r".*was not found.*"):
+        state_sync.add_intervals(
+            [
+                (snapshot_a, "2020-01-01", "2020-01-01"),
+                (SnapshotId(name="c", identifier="c"), "2020-01-01", "2020-01-01"),
+            ]
+        )
+    assert not state_sync.engine_adapter.fetchall(exp.select("*").from_(state_sync.intervals_table))
+
+    state_sync.add_intervals(
+        [
+            (snapshot_a, "2020-01-01", "2020-01-01"),
+            (snapshot_b.snapshot_id, "2020-01-01", "2020-01-02"),
+            (snapshot_a, "2020-01-02", "2020-01-02"),
+        ]
+    )
+    snapshots = state_sync.get_snapshots([snapshot_a, snapshot_b])
+    assert snapshots[snapshot_a.snapshot_id].intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-03"))
+    ]
+    assert snapshots[snapshot_b.snapshot_id].intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-03"))
+    ]
+
+
+def test_compact_intervals(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable) -> None:
+    snapshot = make_snapshot(
+        SqlModel(
+            name="a",
+            cron="@daily",
+            query=parse_one("select 1, ds"),
+        ),
+        version="a",
+    )
+    state_sync.push_snapshots([snapshot])
+    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-02")
+    state_sync.add_interval(snapshot, "2020-01-05", "2020-01-05")
+
+    state_sync.compact_intervals()
+
+    assert not state_sync.engine_adapter.fetchall(exp.select("*").from_(state_sync.intervals_table))
+    assert state_sync.get_snapshots([snapshot])[snapshot.snapshot_id].intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-03")),
+        (to_timestamp("2020-01-05"), to_timestamp("2020-01-06")),
+    ]
+
+    state_sync.delete_snapshots([snapshot])
+    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-02")
+    state_sync.compact_intervals()
+    assert not state_sync.engine_adapter.fetchall(exp.select("*").from_(state_sync.intervals_table))
+
+
+@pytest.mark.parametrize(
+    "created_ts_offset",
+    [
+        1,
+        # The concurrent interval is recorded within the same millisecond as the one being merged.
+        0,
+        # The concurrent process' clock is behind.
+        -1000,
+    ],
+)
+def test_compact_intervals_recorded_concurrently(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    mocker: MockerFixture,
+    created_ts_offset: int,
+) -> None:
+    snapshot = make_snapshot(
+        SqlModel(
+            name="a",
+            cron="@daily",
+            query=parse_one("select 1, ds"),
+        ),
+        version="a",
+    )
+    state_sync.push_snapshots([snapshot])
+    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-01")
+
+    merge_pushed_intervals = state_sync._merge_pushed_intervals
+
+    def merge_and_record_interval(*args: t.Any) -> t.Dict[SnapshotId, t.Set[RecordedInterval]]:
+        merged_intervals = merge_pushed_intervals(*args)
+        # Another process records an interval right after the recorded intervals have been read.
+        mocker.stopall()
+        mocker.patch(
+            "sqlmesh.core.state_sync.engine_adapter.now_timestamp",
+            return_value=created_ts_offset
+            + max(created_ts for *_, created_ts in merged_intervals[snapshot.snapshot_id]),
+        )
+        state_sync.add_interval(snapshot, "2020-01-05", "2020-01-05")
+        return merged_intervals
+
+    mocker.patch.object(
+        state_sync, "_merge_pushed_intervals", side_effect=merge_and_record_interval
+    )
+    state_sync.compact_intervals()
+
+    assert (
+        len(state_sync.engine_adapter.fetchall(exp.select("*").from_(state_sync.intervals_table)))
+        == 1
+    )
+    assert state_sync.get_snapshots([snapshot])[snapshot.snapshot_id].intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-02")),
+        (to_timestamp("2020-01-05"), to_timestamp("2020-01-06")),
+    ]
+
+
 def test_remove_interval(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable) -> None:
     snapshot_a = make_snapshot(
         SqlModel(
@@ -271,6 +543,19 @@ def test_remove_interval(state_sync: EngineAdapterStateSync, make_snapshot: t.Ca
         (to_timestamp("2020-01-18"), to_timestamp("2020-01-31")),
     ]
 
+    # Intervals recorded after the snapshots passed in were fetched are not lost.
+    all_snapshots = list(snapshots.values())
+    state_sync.add_interval(snapshot_a, "2020-02-01", "2020-02-01")
+    state_sync.remove_interval(
+        [snapshot_a], "2020-01-01", "2020-01-01", all_snapshots=all_snapshots
+    )
+
+    snapshots = state_sync.get_snapshots([snapshot_a, snapshot_b])
+    assert snapshots[snapshot_a.snapshot_id].intervals == [
+        (to_timestamp("2020-01-02"), to_timestamp("2020-01-11")),
+        (to_timestamp("2020-02-01"), to_timestamp("2020-02-02")),
+    ]
+
 
 def test_promote_snapshots(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
     snapshot_a = make_snapshot(
@@ -555,6 +840,67 @@ def test_unpause_snapshots(state_sync: EngineAdapterStateSync, make_snapshot: t.
     assert actual_snapshots[new_snapshot.snapshot_id].unpaused_ts == to_timestamp(unpaused_dt)
 
 
+def test_snapshot_catalog(
+    state_sync: EngineAdapterStateSync,
+    snapshots: t.List[Snapshot],
+    mocker: MockerFixture,
+    tmp_path,
+) -> None:
+    snapshot_a, snapshot_b = snapshots
+    state_sync.push_snapshots(snapshots)
+    get_snapshots = mocker.spy(state_sync, "get_snapshots")
+
+    catalog = SnapshotCatalog(state_sync, tmp_path)
+    assert catalog.get_snapshots() == state_sync.get_snapshots(None)
+    get_snapshots.assert_has_calls(
+        [mocker.call([snapshot_a.snapshot_id, snapshot_b.snapshot_id]), mocker.call(None)],
+        any_order=True,
+    )
+
+    # Unchanged snapshots are loaded from the local copy.
+    get_snapshots.reset_mock()
+    assert SnapshotCatalog(state_sync, tmp_path).get_snapshots() == {
+        snapshot_a.snapshot_id: snapshot_a,
+        snapshot_b.snapshot_id: snapshot_b,
+    }
+    get_snapshots.assert_not_called()
+
+    # Recorded intervals are merged without refetching snapshots.
+    state_sync.add_interval(snapshot_a, "2022-01-01", "2022-01-01")
+    assert catalog.get_snapshots()[snapshot_a.snapshot_id].intervals == [
+        (to_timestamp("2022-01-01"), to_timestamp("2022-01-02")),
+    ]
+    get_snapshots.assert_not_called()
+
+    # Only modified snapshots are refetched.
+    state_sync.unpause_snapshots([snapshot_b], "2022-01-01")
+    assert catalog.get_snapshots()[snapshot_b.snapshot_id].unpaused_ts == to_timestamp("2022-01-01")
+    get_snapshots.assert_called_once_with([snapshot_b.snapshot_id])
+
+    get_snapshots.reset_mock()
+    state_sync.compact_intervals()
+    assert catalog.get_snapshots() == state_sync.get_snapshots(None)
+    get_snapshots.assert_any_call([snapshot_a.snapshot_id])
+
+    state_sync.delete_snapshots([snapshot_a])
+    assert catalog.get_snapshots() == {snapshot_b.snapshot_id: snapshot_b}
+
+
+def test_snapshot_catalog_corrupted(
+    state_sync: EngineAdapterStateSync, snapshots: t.List[Snapshot], tmp_path
+) -> None:
+    state_sync.push_snapshots(snapshots)
+    catalog = SnapshotCatalog(state_sync, tmp_path)
+    catalog.get_snapshots()
+
+    (file,) = tmp_path.iterdir()
+    file.write_bytes(b"corrupted")
+    assert catalog.get_snapshots() == state_sync.get_snapshots(None)
+
+    catalog.clear()
+    assert not list(tmp_path.iterdir())
+
+
 def test_get_version(state_sync: EngineAdapterStateSync) -> None:
     # fresh install should not raise
     assert state_sync.get_versions() == Versions(
@@ -566,7 +912,7 @@ def test_get_version(state_sync: EngineAdapterStateSync) -> None:
 
     with pytest.raises(
         SQLMeshError,
-        match=r"SQLMesh \(local\) is using version '1' which is ahead of '0'",
+        match=rf"SQLMesh \(local\) is using version '{SCHEMA_VERSION}' which is ahead of '0'",
     ):
         state_sync.get_versions()
 
@@ -664,6 +1010,7 @@ def test_migrate_rows(state_sync: EngineAdapterStateSync, mocker: MockerFixture)
 
     assert len(old_snapshots) == len(new_snapshots)
     assert len(old_environments) == len(new_environments)
+    assert new_snapshots["summary"].notnull().all()
 
     assert not state_sync.missing_intervals("staging")
     assert not state_sync.missing_intervals("dev")
@@ -0,0 +1,272 @@
+import gzip
+import json
+import typing as t
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from pytest_mock.plugin import MockerFixture
+from sqlglot import parse_one
+
+from sqlmesh.core.engine_adapter import create_engine_adapter
+from sqlmesh.core.model import IncrementalByTimeRangeKind, SqlModel
+from sqlmesh.core.snapshot import Snapshot, SnapshotNameVersion
+from sqlmesh.core.state_sync import EngineAdapterStateSync
+from sqlmesh.schedulers.airflow import common
+from sqlmesh.schedulers.airflow.api import sqlmesh_api_v1
+from sqlmesh.utils.date import to_timestamp
+
+SEARCH_PATH = f"/{common.SQLMESH_API_BASE_PATH}/snapshots/search"
+
+
+@pytest.fixture
+def snapshots(make_snapshot: t.Callable) -> t.List[Snapshot]:
+    return [
+        make_snapshot(
+            SqlModel(
+                name=f"model_{i}",
+                kind=IncrementalByTimeRangeKind(time_column="ds"),
+                query=parse_one(f"SELECT {i} AS a, ds"),
+            ),
+            version=str(i),
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def state_sync(duck_conn, snapshots: t.List[Snapshot]) -> EngineAdapterStateSync:
+    state_sync = EngineAdapterStateSync(
+        create_engine_adapter(lambda: duck_conn, "duckdb"), "sqlmesh"
+    )
+    state_sync.migrate()
+    state_sync.push_snapshots(snapshots)
+    for snapshot in snapshots:
+        state_sync.add_interval(snapshot, "2023-01-01", "2023-01-02")
+    return state_sync
+
+
+@pytest.fixture
+def client(mocker: MockerFixture, state_sync: EngineAdapterStateSync) -> FlaskClient:
+    mocker.patch("airflow.api_connexion.security.check_authentication")
+    scoped_state_sync = mocker.patch("sqlmesh.schedulers.airflow.util.scoped_state_sync")
+    scoped_state_sync.return_value.__enter__.return_value = state_sync
+
+    app = Flask(__name__)
+    app.register_blueprint(sqlmesh_api_v1)
+    return app.test_client()
+
+
+def search(
+    client: FlaskClient, headers: t.Optional[t.Dict[str, str]] = None, **request: t.Any
+) -> common.SnapshotSearchResponse:
+    response = client.post(
+        SEARCH_PATH,
+        data=common.SnapshotSearchRequest(**request).json(),
+        headers=headers,
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    return common.SnapshotSearchResponse.parse_raw(response.data)
+
+
+@pytest.mark.airflow
+@pytest.mark.parametrize(
+    "projection, attribute",
+    [
+        (common.SnapshotProjection.FULL, "snapshots"),
+        (common.SnapshotProjection.SUMMARY, "summaries"),
+        (common.SnapshotProjection.IDS, "snapshot_ids"),
+        (common.SnapshotProjection.VERSIONS, "table_infos"),
+        (common.SnapshotProjection.INTERVALS, "intervals"),
+    ],
+)
+def test_search_snapshots_projection(
+    client: FlaskClient,
+    snapshots: t.List[Snapshot],
+    projection: common.SnapshotProjection,
+    attribute: str,
+):
+    snapshot_ids = [snapshot.snapshot_id for snapshot in snapshots[:2]]
+    response = search(client, ids=snapshot_ids, projection=projection)
+
+    found = getattr(response, attribute)
+    assert {item.snapshot_id for item in found} == set(snapshot_ids)
+    assert response.next_offset is None
+    for other_attribute in ("snapshots", "summaries", "snapshot_ids", "table_infos", "intervals"):
+        if other_attribute != attribute:
+            assert getattr(response, other_attribute) is None
+
+    expected_intervals = [(to_timestamp("2023-01-01"), to_timestamp("2023-01-03"))]
+    if projection == common.SnapshotProjection.FULL:
+        assert all(snapshot.model for snapshot in found)
+    if projection in (
+        common.SnapshotProjection.FULL,
+        common.SnapshotProjection.SUMMARY,
+        common.SnapshotProjection.INTERVALS,
+    ):
+        assert all(item.intervals == expected_intervals for item in found)
+    if projection == common.SnapshotProjection.VERSIONS:
+        assert sorted(found, key=lambda table_info: table_info.name) == [
+            snapshot.table_info for snapshot in snapshots[:2]
+        ]
+
+
+@pytest.mark.airflow
+def test_search_snapshots_missing_ids(client: FlaskClient, snapshots: t.List[Snapshot]):
+    missing_id = snapshots[0].snapshot_id.copy(update={"identifier": "missing"})
+    response = search(
+        client,
+        ids=[snapshots[0].snapshot_id, missing_id],
+        projection=common.SnapshotProjection.IDS,
+    )
+    assert response.snapshot_ids == [snapshots[0].snapshot_id]
+
+
+@pytest.mark.airflow
+def test_search_snapshots_paging_over_all_ids(client: FlaskClient, snapshots: t.List[Snapshot]):
+    pages = []
+    offset: t.Optional[int] = 0
+    while offset is not None:
+        response = search(client, projection=common.SnapshotProjection.IDS, offset=offset, limit=2)
+        pages.append(response.snapshot_ids)
+        offset = response.next_offset
+
+    assert [len(page or []) for page in pages] == [2, 2, 1]
+    assert [snapshot_id for page in pages for snapshot_id in page or []] == sorted(
+        (snapshot.snapshot_id for snapshot in snapshots),
+        key=lambda snapshot_id: (snapshot_id.name, snapshot_id.identifier),
+    )
+
+    response = search(client, projection=common.SnapshotProjection.SUMMARY, offset=4, limit=2)
+    assert [summary.snapshot_id for summary in response.summaries or []] == [
+        snapshots[4].snapshot_id
+    ]
+    assert response.next_offset is None
+
+
+@pytest.mark.airflow
+def test_search_snapshots_paging_over_ids(client: FlaskClient, snapshots: t.List[Snapshot]):
+    snapshot_ids = [snapshot.snapshot_id for snapshot in snapshots]
+
+    response = search(
+        client, ids=snapshot_ids, projection=common.SnapshotProjection.IDS, offset=1, limit=2
+    )
+    assert set(response.snapshot_ids or []) == set(snapshot_ids[1:3])
+    assert response.next_offset == 3
+
+    response = search(
+        client, ids=snapshot_ids, projection=common.SnapshotProjection.IDS, offset=3, limit=2
+    )
+    assert set(response.snapshot_ids or []) == set(snapshot_ids[3:])
+    assert response.next_offset is None
+
+    response = search(client, ids=snapshot_ids, projection=common.SnapshotProjection.IDS, offset=2)
+    assert set(response.snapshot_ids or []) == set(snapshot_ids[2:])
+    assert response.next_offset is None
+
+
+@pytest.mark.airflow
+def test_search_snapshots_paging_over_versions(client: FlaskClient, snapshots: t.List[Snapshot]):
+    versions = [
+        SnapshotNameVersion(name=snapshot.name, version=snapshot.version) for snapshot in snapshots
+    ]
+
+    response = search(client, versions=versions, limit=3)
+    assert {snapshot.snapshot_id for snapshot in response.snapshots or []} == {
+        snapshot.snapshot_id for snapshot in snapshots[:3]
+    }
+    assert response.next_offset == 3
+
+
+@pytest.mark.airflow
+def test_search_snapshots_gzip_request(client: FlaskClient, snapshots: t.List[Snapshot]):
+    body = common.SnapshotSearchRequest(
+        ids=[snapshot.snapshot_id for snapshot in snapshots],
+        projection=common.SnapshotProjection.IDS,
+    ).json()
+    response = client.post(
+        SEARCH_PATH,
+        data=gzip.compress(body.encode("utf-8")),
+        headers={"Content-Encoding": "gzip"},
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    assert set(common.SnapshotSearchResponse.parse_raw(response.data).snapshot_ids or []) == {
+        snapshot.snapshot_id for snapshot in snapshots
+    }
+
+
+@pytest.mark.airflow
+def test_search_snapshots_unsupported_request_encoding(client: FlaskClient):
+    response = client.post(
+        SEARCH_PATH,
+        data=b"{}",
+        headers={"Content-Encoding": "br"},
+        content_type="application/json",
+    )
+    assert response.status_code == 400
+    assert json.loads(response.data) == {"message": "Unsupported content encoding 'br'"}
+
+
+@pytest.mark.airflow
+def test_search_snapshots_gzip_response(client: FlaskClient, snapshots: t.List[Snapshot]):
+    response = client.post(
+        SEARCH_PATH,
+        data=common.SnapshotSearchRequest().json(),
+        headers={"Accept-Encoding": "gzip"},
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+    body = gzip.decompress(response.data)
+    assert len(body) >= common.COMPRESSION_MIN_SIZE_BYTES
+    assert len(common.SnapshotSearchResponse.parse_raw(body).snapshots or []) == len(snapshots)
+
+
+@pytest.mark.airflow
+def test_search_snapshots_zstd_response(client: FlaskClient, snapshots: t.List[Snapshot]):
+    zstandard = pytest.importorskip("zstandard")
+
+    response = client.post(
+        SEARCH_PATH,
+        data=common.SnapshotSearchRequest().json(),
+        headers={"Accept-Encoding": "gzip, zstd"},
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "zstd"
+
+    body = zstandard.ZstdDecompressor().decompress(response.data)
+    assert len(common.SnapshotSearchResponse.parse_raw(body).snapshots or []) == len(snapshots)
+
+    # gzip is used if the client doesn't accept zstd.
+    response = client.post(
+        SEARCH_PATH,
+        data=common.SnapshotSearchRequest().json(),
+        headers={"Accept-Encoding": "gzip"},
+        content_type="application/json",
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+@pytest.mark.airflow
+def test_search_snapshots_small_response_uncompressed(
+    client: FlaskClient, snapshots: t.List[Snapshot]
+):
+    response = search(
+        client,
+        headers={"Accept-Encoding": "gzip, zstd"},
+        ids=[snapshots[0].snapshot_id],
+        projection=common.SnapshotProjection.IDS,
+    )
+    assert response.snapshot_ids == [snapshots[0].snapshot_id]
+
+
+@pytest.mark.airflow
+def test_search_snapshots_uncompressed_response(client: FlaskClient, snapshots: t.List[Snapshot]):
+    response = search(client)
+    assert len(response.snapshots or []) == len(snapshots)
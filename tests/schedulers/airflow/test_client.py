@@ -1,4 +1,6 @@
+import gzip
 import json
+from unittest.mock import call
 from urllib.parse import urlencode
 
 import pytest
@@ -10,7 +12,7 @@ from sqlmesh.core.environment import Environment
 from sqlmesh.core.model import IncrementalByTimeRangeKind, SqlModel
 from sqlmesh.core.snapshot import Snapshot, SnapshotNameVersion
 from sqlmesh.schedulers.airflow import common
-from sqlmesh.schedulers.airflow.client import AirflowClient, _list_to_json
+from sqlmesh.schedulers.airflow.client import AirflowClient
 
 
 @pytest.fixture
@@ -61,7 +63,8 @@ def test_apply_plan(mocker: MockerFixture, snapshot: Snapshot):
     args, data = apply_plan_mock.call_args_list[0]
 
     assert args[0] == "http://localhost:8080/sqlmesh/api/v1/plans"
-    assert json.loads(data["data"]) == {
+    assert data["headers"] == {"Content-Encoding": "gzip"}
+    assert json.loads(gzip.decompress(data["data"])) == {
         "new_snapshots": [
             {
                 "created_ts": 1665014400000,
@@ -132,17 +135,23 @@ def test_apply_plan(mocker: MockerFixture, snapshot: Snapshot):
     }
 
 
-def snapshot_url(snapshot_ids, key="ids") -> str:
-    return urlencode({key: _list_to_json(snapshot_ids)})
+def assert_search_requests(search_mock, *expected: common.SnapshotSearchRequest) -> None:
+    assert search_mock.call_count == len(expected)
+    for (args, kwargs), search in zip(search_mock.call_args_list, expected):
+        assert args[0] == "http://localhost:8080/sqlmesh/api/v1/snapshots/search"
+        body = kwargs["data"]
+        if kwargs["headers"].get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        assert common.SnapshotSearchRequest.parse_raw(body) == search
 
 
 def test_get_snapshots(mocker: MockerFixture, snapshot: Snapshot):
-    snapshots = common.SnapshotsResponse(snapshots=[snapshot])
+    snapshots = common.SnapshotSearchResponse(snapshots=[snapshot])
 
     get_snapshots_response_mock = mocker.Mock()
     get_snapshots_response_mock.status_code = 200
     get_snapshots_response_mock.json.return_value = snapshots.dict()
-    get_snapshots_mock = mocker.patch("requests.Session.get")
+    get_snapshots_mock = mocker.patch("requests.Session.post")
     get_snapshots_mock.return_value = get_snapshots_response_mock
 
     client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
@@ -150,18 +159,89 @@ def test_get_snapshots(mocker: MockerFixture, snapshot: Snapshot):
 
     assert result == [snapshot]
 
-    get_snapshots_mock.assert_called_once_with(
-        f"http://localhost:8080/sqlmesh/api/v1/snapshots?{snapshot_url([snapshot.snapshot_id])}"
+    assert_search_requests(
+        get_snapshots_mock, common.SnapshotSearchRequest(ids=[snapshot.snapshot_id])
+    )
+
+
+def test_get_all_snapshots(mocker: MockerFixture, snapshot: Snapshot):
+    snapshot_ids_response_mock = mocker.Mock()
+    snapshot_ids_response_mock.status_code = 200
+    snapshot_ids_response_mock.json.return_value = common.SnapshotSearchResponse(
+        snapshot_ids=[snapshot.snapshot_id]
+    ).dict()
+    get_snapshots_response_mock = mocker.Mock()
+    get_snapshots_response_mock.status_code = 200
+    get_snapshots_response_mock.json.return_value = common.SnapshotSearchResponse(
+        snapshots=[snapshot]
+    ).dict()
+    get_snapshots_mock = mocker.patch("requests.Session.post")
+    get_snapshots_mock.side_effect = [snapshot_ids_response_mock, get_snapshots_response_mock]
+
+    client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
+    result = client.get_snapshots(None)
+
+    assert result == [snapshot]
+
+    assert_search_requests(
+        get_snapshots_mock,
+        common.SnapshotSearchRequest(projection=common.SnapshotProjection.IDS),
+        common.SnapshotSearchRequest(ids=[snapshot.snapshot_id]),
+    )
+
+
+def test_get_snapshots_batched(mocker: MockerFixture, snapshot: Snapshot):
+    mocker.patch("sqlmesh.schedulers.airflow.common.SNAPSHOTS_PAGE_SIZE", 2)
+
+    get_snapshots_response_mock = mocker.Mock()
+    get_snapshots_response_mock.status_code = 200
+    get_snapshots_response_mock.json.return_value = common.SnapshotSearchResponse(
+        snapshots=[snapshot]
+    ).dict()
+    get_snapshots_mock = mocker.patch("requests.Session.post")
+    get_snapshots_mock.return_value = get_snapshots_response_mock
+
+    snapshot_ids = [snapshot.snapshot_id.copy(update={"identifier": str(i)}) for i in range(5)]
+    client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
+    client.get_snapshots(snapshot_ids)
+
+    assert_search_requests(
+        get_snapshots_mock,
+        common.SnapshotSearchRequest(ids=snapshot_ids[0:2]),
+        common.SnapshotSearchRequest(ids=snapshot_ids[2:4]),
+        common.SnapshotSearchRequest(ids=snapshot_ids[4:]),
+    )
+
+
+def test_get_snapshot_summaries(mocker: MockerFixture, snapshot: Snapshot):
+    summaries = common.SnapshotSearchResponse(summaries=[snapshot.summary])
+
+    get_summaries_response_mock = mocker.Mock()
+    get_summaries_response_mock.status_code = 200
+    get_summaries_response_mock.json.return_value = summaries.dict()
+    get_summaries_mock = mocker.patch("requests.Session.post")
+    get_summaries_mock.return_value = get_summaries_response_mock
+
+    client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
+    result = client.get_snapshot_summaries([snapshot.snapshot_id])
+
+    assert result == [snapshot.summary]
+
+    assert_search_requests(
+        get_summaries_mock,
+        common.SnapshotSearchRequest(
+            ids=[snapshot.snapshot_id], projection=common.SnapshotProjection.SUMMARY
+        ),
     )
 
 
 def test_snapshots_exist(mocker: MockerFixture, snapshot: Snapshot):
-    snapshot_ids = common.SnapshotIdsResponse(snapshot_ids=[snapshot.snapshot_id])
+    snapshot_ids = common.SnapshotSearchResponse(snapshot_ids=[snapshot.snapshot_id])
 
     snapshots_exist_response_mock = mocker.Mock()
     snapshots_exist_response_mock.status_code = 200
     snapshots_exist_response_mock.json.return_value = snapshot_ids.dict()
-    snapshots_exist_mock = mocker.patch("requests.Session.get")
+    snapshots_exist_mock = mocker.patch("requests.Session.post")
     snapshots_exist_mock.return_value = snapshots_exist_response_mock
 
     client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
@@ -169,18 +249,21 @@ def test_snapshots_exist(mocker: MockerFixture, snapshot: Snapshot):
 
     assert result == {snapshot.snapshot_id}
 
-    snapshots_exist_mock.assert_called_once_with(
-        f"http://localhost:8080/sqlmesh/api/v1/snapshots?check_existence&{snapshot_url([snapshot.snapshot_id])}"
+    assert_search_requests(
+        snapshots_exist_mock,
+        common.SnapshotSearchRequest(
+            ids=[snapshot.snapshot_id], projection=common.SnapshotProjection.IDS
+        ),
     )
 
 
 def test_get_snapshots_with_same_version(mocker: MockerFixture, snapshot: Snapshot):
-    snapshots = common.SnapshotsResponse(snapshots=[snapshot])
+    snapshots = common.SnapshotSearchResponse(snapshots=[snapshot])
 
     get_snapshots_response_mock = mocker.Mock()
     get_snapshots_response_mock.status_code = 200
     get_snapshots_response_mock.json.return_value = snapshots.dict()
-    get_snapshots_mock = mocker.patch("requests.Session.get")
+    get_snapshots_mock = mocker.patch("requests.Session.post")
     get_snapshots_mock.return_value = get_snapshots_response_mock
 
     client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
@@ -189,8 +272,53 @@ def test_get_snapshots_with_same_version(mocker: MockerFixture, snapshot: Snapsh
 
     assert result == [snapshot]
 
-    get_snapshots_mock.assert_called_once_with(
-        f"http://localhost:8080/sqlmesh/api/v1/snapshots?{snapshot_url(versions, 'versions')}"
+    assert_search_requests(get_snapshots_mock, common.SnapshotSearchRequest(versions=versions))
+
+
+def test_search_snapshots_legacy_plugin(mocker: MockerFixture, snapshot: Snapshot):
+    not_found_response_mock = mocker.Mock()
+    not_found_response_mock.status_code = 404
+    search_mock = mocker.patch("requests.Session.post")
+    search_mock.return_value = not_found_response_mock
+
+    get_snapshots_response_mock = mocker.Mock()
+    get_snapshots_response_mock.status_code = 200
+    get_snapshots_response_mock.json.return_value = common.SnapshotsResponse(
+        snapshots=[snapshot]
+    ).dict()
+    snapshots_exist_response_mock = mocker.Mock()
+    snapshots_exist_response_mock.status_code = 200
+    snapshots_exist_response_mock.json.return_value = common.SnapshotIdsResponse(
+        snapshot_ids=[snapshot.snapshot_id]
+    ).dict()
+    get_mock = mocker.patch("requests.Session.get")
+    get_mock.side_effect = [
+        get_snapshots_response_mock,
+        get_snapshots_response_mock,
+        snapshots_exist_response_mock,
+    ]
+
+    client = AirflowClient(airflow_url=common.AIRFLOW_LOCAL_URL, session=requests.Session())
+    assert client.get_snapshots([snapshot.snapshot_id]) == [snapshot]
+    assert client.get_snapshot_summaries([snapshot.snapshot_id]) == [snapshot.summary]
+    assert client.snapshots_exist([snapshot.snapshot_id]) == {snapshot.snapshot_id}
+
+    # The search endpoint isn't requested again once it turned out to be missing.
+    assert search_mock.call_count == 1
+
+    ids = json.dumps([snapshot.snapshot_id.dict()], separators=(",", ":"))
+    get_mock.assert_has_calls(
+        [
+            call(
+                f"http://localhost:8080/sqlmesh/api/v1/snapshots?{urlencode({'ids': ids})}",
+            ),
+            call(
+                f"http://localhost:8080/sqlmesh/api/v1/snapshots?{urlencode({'ids': ids})}",
+            ),
+            call(
+                f"http://localhost:8080/sqlmesh/api/v1/snapshots?check_existence&{urlencode({'ids': ids})}",
+            ),
+        ]
     )
 
 
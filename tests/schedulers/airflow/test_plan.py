@@ -139,6 +139,15 @@ def test_create_plan_dag_spec_duplicated_snapshot(
 
     state_sync_mock.get_snapshots.assert_called_once()
 
+    snapshot_catalog_mock = mocker.Mock()
+    snapshot_catalog_mock.get_snapshots.return_value = {snapshot.snapshot_id: snapshot}
+
+    with pytest.raises(SQLMeshError):
+        create_plan_dag_spec(plan_request, state_sync_mock, snapshot_catalog_mock)
+
+    snapshot_catalog_mock.get_snapshots.assert_called_once()
+    state_sync_mock.get_snapshots.assert_called_once()
+
 
 @pytest.mark.airflow
 @pytest.mark.parametrize("unbounded_end", [None, ""])
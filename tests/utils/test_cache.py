@@ -0,0 +1,74 @@
+import os
+import typing as t
+
+from sqlmesh.utils.cache import FileCache, cache_key
+from sqlmesh.utils.pydantic import PydanticModel
+
+
+class _Entry(PydanticModel):
+    value: str
+
+
+def test_file_cache(tmp_path):
+    cache: FileCache[_Entry] = FileCache(tmp_path, _Entry, "test")
+    key = cache_key("a", "b")
+
+    assert cache.get(key) is None
+    cache.put(key, _Entry(value="foo"))
+    assert cache.get(key) == _Entry(value="foo")
+
+    # Entries are persisted across instances.
+    assert FileCache(tmp_path, _Entry, "test").get(key) == _Entry(value="foo")
+
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_file_cache_key():
+    assert cache_key("a", "b") == cache_key("a", "b")
+    assert cache_key("a", "b") != cache_key("ab")
+    assert cache_key("a", None) != cache_key("a", "")
+
+
+def test_file_cache_version(tmp_path, mocker):
+    cache: FileCache[_Entry] = FileCache(tmp_path, _Entry, "test")
+    cache.put("key", _Entry(value="foo"))
+
+    mocker.patch("sqlmesh.utils.cache.SQLGLOT_VERSION", "0.0.0")
+    cache = FileCache(tmp_path, _Entry, "test")
+    assert cache.get("key") is None
+    assert len(list((tmp_path / "test").iterdir())) == 1
+
+
+def test_file_cache_eviction(tmp_path):
+    cache: FileCache[_Entry] = FileCache(tmp_path, _Entry, "test", max_size_bytes=0)
+    cache.put("a", _Entry(value="a"))
+    assert cache.get("a") is None
+
+    cache = FileCache(tmp_path, _Entry, "test", max_size_bytes=10_000)
+    files: t.List = []
+    for key in "abc":
+        cache.put(key, _Entry(value=key))
+        files.append(cache._file(key))
+    entry_size = max(os.path.getsize(file) for file in files)
+
+    # The least recently used entry is evicted first.
+    cache = FileCache(tmp_path, _Entry, "test", max_size_bytes=entry_size * 2)
+    os.utime(files[0], (1, 1))
+    os.utime(files[1], (2, 2))
+    os.utime(files[2], (3, 3))
+    assert cache.get("a") is not None
+    cache.put("d", _Entry(value="d"))
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    assert cache.get("a") is not None
+    assert cache.get("d") is not None
+
+
+def test_file_cache_corrupted_entry(tmp_path):
+    cache: FileCache[_Entry] = FileCache(tmp_path, _Entry, "test")
+    cache.put("key", _Entry(value="foo"))
+    cache._file("key").write_bytes(b"not gzip")
+
+    assert cache.get("key") is None
+    assert not cache._file("key").exists()
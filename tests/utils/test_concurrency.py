@@ -1,11 +1,19 @@
+import typing as t
+
 import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.core.snapshot import SnapshotId
 from sqlmesh.utils.concurrency import (
+    ConcurrentDAGExecutor,
+    LongestPathPolicy,
     NodeExecutionFailedError,
+    OldestFirstPolicy,
+    concurrent_apply_to_dag,
     concurrent_apply_to_snapshots,
+    estimate_makespan,
 )
+from sqlmesh.utils.dag import DAG
 
 
 @pytest.mark.parametrize("tasks_num", [1, 2])
@@ -102,3 +110,79 @@ def test_concurrent_apply_to_snapshots_return_failed_skipped(mocker: MockerFixtu
     assert errors[0].node == snapshot_a.snapshot_id
 
     assert skipped == [snapshot_b.snapshot_id, snapshot_c.snapshot_id]
+
+
+@pytest.mark.parametrize("tasks_num", [1, 2])
+def test_concurrent_apply_to_dag_skips_each_node_once(tasks_num: int):
+    dag = DAG[str](
+        {
+            "a": set(),
+            "b": {"a"},
+            "c": {"a"},
+            "d": {"b", "c"},
+            "e": {"d"},
+            "f": set(),
+        }
+    )
+
+    processed = []
+
+    def fn(node: str) -> None:
+        if node == "a":
+            raise RuntimeError("fail")
+        processed.append(node)
+
+    errors, skipped = concurrent_apply_to_dag(dag, fn, tasks_num, raise_on_error=False)
+
+    assert [error.node for error in errors] == ["a"]
+    assert sorted(skipped) == ["b", "c", "d", "e"]
+    assert processed == ["f"]
+
+
+def test_concurrent_apply_to_dag_large_graph():
+    dag = DAG[int]()
+    for i in range(1000):
+        dag.add(i, [j for j in (i - 1, i - 2) if j >= 0])
+
+    processed = []
+    errors, skipped = concurrent_apply_to_dag(dag, processed.append, 4)
+
+    assert processed == list(range(1000))
+    assert not errors
+    assert not skipped
+
+
+def test_longest_path_policy():
+    dag = DAG[str]({"a": set(), "b": {"a"}, "c": {"b"}, "d": set()})
+
+    assert LongestPathPolicy().priorities(dag) == {"a": 3.0, "b": 2.0, "c": 1.0, "d": 1.0}
+    assert LongestPathPolicy({"a": 1.0, "b": 5.0, "c": 1.0, "d": 10.0}.get).priorities(dag) == {
+        "a": 7.0,
+        "b": 6.0,
+        "c": 1.0,
+        "d": 10.0,
+    }
+
+
+def test_concurrent_apply_to_dag_policy():
+    dag = DAG[str]({"d": set(), "a": set(), "b": {"a"}, "c": {"b"}})
+
+    processed: t.List[str] = []
+    concurrent_apply_to_dag(dag, processed.append, 1, policy=LongestPathPolicy())
+    assert processed == ["a", "b", "d", "c"]
+
+    processed = []
+    concurrent_apply_to_dag(dag, processed.append, 1, policy=OldestFirstPolicy(lambda n: -ord(n)))
+    assert processed == ["d", "a", "b", "c"]
+
+    executor = ConcurrentDAGExecutor(dag, processed.append, 2, True, policy=LongestPathPolicy())
+    assert [node for _, _, node in sorted(executor._ready_nodes)] == ["a", "d"]
+
+
+def test_estimate_makespan():
+    dag = DAG[str]({"x1": set(), "x2": set(), "a": set(), "b": {"a"}, "c": {"b"}})
+    weights = {"x1": 2.0, "x2": 2.0, "a": 1.0, "b": 1.0, "c": 1.0}
+
+    assert estimate_makespan(dag, weights.__getitem__, 1) == 7.0
+    assert estimate_makespan(dag, weights.__getitem__, 2) == 5.0
+    assert estimate_makespan(dag, weights.__getitem__, 2, LongestPathPolicy()) == 4.0
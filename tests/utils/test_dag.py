@@ -1,4 +1,7 @@
+import pytest
+
 from sqlmesh.utils.dag import DAG
+from sqlmesh.utils.errors import SQLMeshError
 
 
 def test_downstream(sushi_context):
@@ -43,3 +46,51 @@ def test_reversed_graph():
         "c": set(),
         "d": set(),
     }
+
+
+def test_upstream():
+    dag = DAG({"a": set(), "b": {"a"}, "c": {"b"}, "d": {"a", "c"}, "e": set()})
+
+    assert dag.upstream("d") == ["a", "b", "c"]
+    assert dag.upstream("b") == ["a"]
+    assert dag.upstream("a") == []
+    assert dag.upstream("missing") == []
+
+
+def test_downstream_sorted():
+    dag = DAG({"a": set(), "b": {"a"}, "c": {"b"}, "d": {"a", "c"}, "e": set()})
+
+    assert dag.downstream("a") == ["b", "c", "d"]
+    assert dag.downstream("c") == ["d"]
+    assert dag.downstream("e") == []
+    assert dag.downstream("missing") == []
+
+
+def test_sorted_after_add():
+    dag = DAG({"a": set(), "b": {"a"}})
+    assert dag.sorted() == ["a", "b"]
+    assert dag.downstream("a") == ["b"]
+
+    dag.add("c", ["b"])
+    dag.add("a", ["d"])
+    assert dag.sorted() == ["d", "a", "b", "c"]
+    assert dag.downstream("a") == ["b", "c"]
+    assert dag.upstream("c") == ["d", "a", "b"]
+
+
+def test_sorted_cycle():
+    dag = DAG({"a": {"c"}, "b": {"a"}, "c": {"b"}, "d": set()})
+
+    with pytest.raises(SQLMeshError, match="a, b, c"):
+        dag.sorted()
+
+
+def test_large_dag():
+    size = 10_000
+    dag = DAG({f"n{i}": {f"n{i - 1}"} if i else set() for i in range(size)})
+
+    assert dag.sorted() == [f"n{i}" for i in range(size)]
+    assert len(dag.downstream("n0")) == size - 1
+    assert len(dag.upstream(f"n{size - 1}")) == size - 1
+    assert len(dag.lineage(f"n{size // 2}").sorted()) == size
+    assert len(dag.reversed.downstream(f"n{size - 1}")) == size - 1
@@ -0,0 +1,100 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from sqlmesh.utils.streaming import BufferedStream
+
+
+def test_buffered_stream_backpressure():
+    produced = []
+    consumed_all = threading.Event()
+
+    def producer():
+        for i in range(10):
+            produced.append(i)
+            yield pd.DataFrame({"a": [i] * 100})
+        consumed_all.set()
+
+    stream = BufferedStream(producer(), max_buffered_chunks=2)
+    iterator = iter(stream)
+
+    first = next(iterator)
+    assert first["a"].tolist() == [0] * 100
+    # The first chunk was consumed, 2 chunks are buffered and 1 more is waiting to be buffered.
+    threading.Event().wait(0.3)
+    assert len(produced) <= 4
+    assert not consumed_all.is_set()
+
+    rest = list(iterator)
+    assert [df["a"][0] for df in rest] == list(range(1, 10))
+    assert stream.stats.rows == 1000
+    assert stream.stats.chunks == 10
+    assert 0 < stream.stats.peak_buffered_bytes <= 4 * first.memory_usage(index=True).sum()
+    assert stream.stats.rows_per_second > 0
+
+
+def test_buffered_stream_coalescing():
+    def producer():
+        yield pd.DataFrame({"a": [1, 2]})
+        yield pd.DataFrame({"a": [3]})
+        yield pd.DataFrame({"a": [4, 5, 6]})
+        yield "not a dataframe"
+        yield pd.DataFrame({"a": [7]})
+
+    stream = BufferedStream(producer(), max_buffered_chunks=1, min_chunk_rows=3)
+    chunks = list(stream)
+
+    assert [c if isinstance(c, str) else c["a"].tolist() for c in chunks] == [
+        [1, 2, 3],
+        [4, 5, 6],
+        "not a dataframe",
+        [7],
+    ]
+    assert stream.stats.rows == 7
+    assert stream.stats.chunks == 4
+
+
+def test_buffered_stream_errors():
+    def failing():
+        yield pd.DataFrame({"a": [1]})
+        raise ValueError("boom")
+
+    iterator = iter(BufferedStream(failing()))
+    assert next(iterator)["a"].tolist() == [1]
+    with pytest.raises(ValueError, match="boom"):
+        next(iterator)
+
+    def infinite():
+        while True:
+            yield pd.DataFrame({"a": [1]})
+
+    iterator = iter(BufferedStream(infinite(), max_buffered_chunks=1))
+    next(iterator)
+    # Closing the consumer stops the producer thread.
+    iterator.close()
+    assert not any(t.name == "sqlmesh_stream_producer" for t in threading.enumerate())
+
+
+def test_buffered_stream_closes_iterable():
+    closed_by = []
+
+    def producer():
+        try:
+            while True:
+                yield pd.DataFrame({"a": [1]})
+        finally:
+            closed_by.append(threading.current_thread().name)
+
+    iterator = iter(BufferedStream(producer(), max_buffered_chunks=1))
+    next(iterator)
+    iterator.close()
+    # The generator is closed by the producer thread which has been advancing it.
+    assert closed_by == ["sqlmesh_stream_producer"]
+
+    def interrupted():
+        yield pd.DataFrame({"a": [1]})
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        list(BufferedStream(interrupted()))
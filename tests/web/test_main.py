@@ -437,6 +437,20 @@ def test_fetchdf(web_sushi_context: Context) -> None:
     assert not df.empty
 
 
+def test_fetchdf_empty_and_invalid(web_sushi_context: Context) -> None:
+    response = client.post(
+        "/api/commands/fetchdf", json={"sql": "SELECT * from sushi.top_waiters WHERE FALSE"}
+    )
+    assert response.status_code == 200
+    with pa.ipc.open_stream(response.content) as reader:
+        df = reader.read_pandas()
+    assert df.empty
+    assert list(df.columns) == ["waiter_id", "revenue"]
+
+    response = client.post("/api/commands/fetchdf", json={"sql": "SELECT * from missing_table"})
+    assert response.status_code == 422
+
+
 def test_get_models(web_sushi_context: Context) -> None:
     response = client.get("/api/models")
     assert response.status_code == 200
@@ -17,6 +17,7 @@ from web.server.settings import get_loaded_context
 from web.server.utils import (
     ArrowStreamingResponse,
     df_to_pyarrow_bytes,
+    record_batches_to_pyarrow_bytes,
     run_in_executor,
 )
 
@@ -107,12 +108,14 @@ async def fetchdf(
 ) -> ArrowStreamingResponse:
     """Fetches a dataframe given a sql string"""
     try:
-        df = context.fetchdf(sql)
+        stream = await run_in_executor(
+            lambda: record_batches_to_pyarrow_bytes(context.fetch_batches(sql))
+        )
     except Exception:
         raise HTTPException(
             status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail=traceback.format_exc()
         )
-    return ArrowStreamingResponse(df_to_pyarrow_bytes(df))
+    return ArrowStreamingResponse(stream)
 
 
 @router.get("/dag")
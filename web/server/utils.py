@@ -60,16 +60,60 @@ def replace_file(src: Path, dst: Path) -> None:
             )
 
 
-def df_to_pyarrow_bytes(df: pd.DataFrame) -> io.BytesIO:
+def df_to_pyarrow_bytes(df: pd.DataFrame) -> t.Iterator[bytes]:
     """Convert a DataFrame to pyarrow bytes stream"""
     table = pa.Table.from_pandas(df)
-    sink = pa.BufferOutputStream()
+    batches = table.to_batches() or [pa.RecordBatch.from_pylist([], schema=table.schema)]
+    return record_batches_to_pyarrow_bytes(iter(batches))
 
-    with pa.ipc.new_stream(sink, table.schema) as writer:
-        for batch in table.to_batches():
-            writer.write_batch(batch)
 
-    return io.BytesIO(sink.getvalue().to_pybytes())
+def record_batches_to_pyarrow_bytes(
+    batches: t.Iterator[pa.RecordBatch],
+) -> t.Generator[bytes, None, None]:
+    """Convert a stream of record batches to a pyarrow bytes stream, one chunk per batch.
+
+    The first batch is serialized before this function returns, so that errors raised while
+    executing the underlying query are surfaced before the response starts streaming. The batches
+    and the writer are closed once the returned stream is exhausted or closed, for example when
+    the client disconnects.
+    """
+    sink = io.BytesIO()
+    try:
+        first_batch = next(batches)
+        writer = pa.ipc.new_stream(sink, first_batch.schema)
+    except BaseException:
+        _close(batches)
+        raise
+    writer.write_batch(first_batch)
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    def chunks() -> t.Generator[bytes, None, None]:
+        writer_closed = False
+        try:
+            yield drain()
+            for batch in batches:
+                writer.write_batch(batch)
+                yield drain()
+            writer_closed = True
+            writer.close()
+            yield drain()
+        finally:
+            if not writer_closed:
+                writer.close()
+            _close(batches)
+
+    return chunks()
+
+
+def _close(iterator: t.Iterator) -> None:
+    close = getattr(iterator, "close", None)
+    if close:
+        close()
 
 
 def is_relative_to(path: PurePath, other: PurePath | str) -> bool: